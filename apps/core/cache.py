@@ -0,0 +1,257 @@
+import hashlib
+import logging
+import time
+from functools import wraps
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache, DEFAULT_TIMEOUT
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from django.db.models import Count, IntegerField, Max, Value
+from django.utils import timezone
+from django.utils.translation import get_language
+from django.views.decorators.http import condition
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class TieredCache(BaseCache):
+    """2단계 캐시: L1(프로세스 메모리) + L2(워커 간 공유 캐시)
+
+    읽기는 L1 → L2 순서로 하고, L2에서 찾은 값은 LOCAL_TIMEOUT 동안만
+    L1에 둔다. 쓰기/삭제는 L2와 현재 워커의 L1에 반영되며, 다른 워커의
+    L1은 최대 LOCAL_TIMEOUT 뒤에 L2 값을 다시 읽는다.
+    L2에 연결할 수 없으면 경고만 남기고 L1만으로 동작한다.
+
+    설정 예:
+        'default': {
+            'BACKEND': 'apps.core.cache.TieredCache',
+            'OPTIONS': {'SHARED_CACHE': 'shared', 'LOCAL_TIMEOUT': 5},
+        }
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        self.shared_alias = options.get('SHARED_CACHE', 'shared')
+        self.local_timeout = options.get('LOCAL_TIMEOUT', 5)
+        self.local = LocMemCache(f'tiered-{location or self.shared_alias}', {
+            'TIMEOUT': self.local_timeout,
+            'OPTIONS': {'MAX_ENTRIES': options.get('LOCAL_MAX_ENTRIES', 1000)},
+        })
+
+    @property
+    def shared(self):
+        return caches[self.shared_alias]
+
+    def _local_timeout(self, timeout):
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = self.default_timeout
+        if timeout is None:
+            return self.local_timeout
+        return min(timeout, self.local_timeout)
+
+    def _shared_call(self, method, *args, fallback=None, **kwargs):
+        try:
+            return getattr(self.shared, method)(*args, **kwargs)
+        except Exception as e:
+            logger.warning(f"공유 캐시({self.shared_alias}) {method} 실패, 로컬 캐시만 사용: {e}")
+            return fallback
+
+    def get(self, key, default=None, version=None):
+        value = self.local.get(key, _MISSING, version=version)
+        if value is not _MISSING:
+            return value
+        value = self._shared_call('get', key, _MISSING, version=version, fallback=_MISSING)
+        if value is _MISSING:
+            return default
+        self.local.set(key, value, self.local_timeout, version=version)
+        return value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self._shared_call('set', key, value, timeout, version=version)
+        self.local.set(key, value, self._local_timeout(timeout), version=version)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        added = self._shared_call('add', key, value, timeout, version=version, fallback=_MISSING)
+        if added is _MISSING:
+            return self.local.add(key, value, self._local_timeout(timeout), version=version)
+        if added:
+            self.local.set(key, value, self._local_timeout(timeout), version=version)
+        return added
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        self.local.touch(key, self._local_timeout(timeout), version=version)
+        return self._shared_call('touch', key, timeout, version=version, fallback=False)
+
+    def delete(self, key, version=None):
+        self.local.delete(key, version=version)
+        return self._shared_call('delete', key, version=version, fallback=False)
+
+    def has_key(self, key, version=None):
+        return self.get(key, _MISSING, version=version) is not _MISSING
+
+    def incr(self, key, delta=1, version=None):
+        """원자적 증가는 L2에 맡긴다 (L1의 오래된 값을 기준으로 하지 않음)"""
+        try:
+            value = self.shared.incr(key, delta, version=version)
+        except ValueError:
+            # 키가 없음 - 호출한 쪽에서 처리
+            raise
+        except Exception as e:
+            logger.warning(f"공유 캐시({self.shared_alias}) incr 실패, 로컬 캐시만 사용: {e}")
+            return self.local.incr(key, delta, version=version)
+        self.local.set(key, value, self.local_timeout, version=version)
+        return value
+
+    def clear(self):
+        self.local.clear()
+        self._shared_call('clear')
+
+
+def _initial_version():
+    """버전 키가 없을 때의 시작 버전 - 현재 시각(µs)
+
+    버전 키가 컬링/재시작으로 사라져도 1로 돌아가지 않으므로 이전 버전의 값을 다시 읽지 않는다.
+    """
+    return time.time_ns() // 1000
+
+
+def namespace_version(namespace, cache_alias='default'):
+    """네임스페이스의 현재 버전 (없으면 새 시작 버전을 기록)"""
+    cache = caches[cache_alias]
+    key = f'ns:{namespace}'
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _initial_version(), timeout=None)
+        version = cache.get(key, 1)
+    return version
+
+
+def namespaced_key(namespace, key, cache_alias='default'):
+    """버전이 붙은 캐시 키 - bump_namespace() 후에는 이전 키를 더 이상 읽지 않는다"""
+    return f'{namespace}:v{namespace_version(namespace, cache_alias)}:{key}'
+
+
+def bump_namespace(namespace, cache_alias='default'):
+    """네임스페이스 전체 무효화 (키를 지우지 않고 버전만 올림, 이전 값은 만료로 정리)"""
+    cache = caches[cache_alias]
+    key = f'ns:{namespace}'
+    try:
+        return cache.incr(key)
+    except ValueError:
+        version = _initial_version()
+        if cache.add(key, version, timeout=None):
+            return version
+        return cache.incr(key)
+
+
+PAGE_CACHE_NAMESPACE = 'pages'
+
+
+def invalidate_public_pages():
+    """캐시된 공개 페이지 전체 무효화 (트랜잭션이 커밋된 뒤에 실행)
+
+    커밋 전에 무효화하면 그 사이 요청이 이전 데이터로 다시 캐시할 수 있다.
+    """
+    transaction.on_commit(lambda: bump_namespace(PAGE_CACHE_NAMESPACE))
+
+
+def _page_cache_key(request):
+    # 날짜를 넣어 '현재/예정 전시'처럼 날짜에 따라 바뀌는 페이지가 자정을 넘기지 않게 한다
+    raw = f'{request.get_full_path()}|{get_language()}|{timezone.localdate()}'
+    return namespaced_key(PAGE_CACHE_NAMESPACE, hashlib.md5(raw.encode()).hexdigest())
+
+
+def _is_cacheable(request, response):
+    return (
+        response.status_code == 200
+        and not response.streaming
+        and not response.cookies
+        and not response.has_header('Cache-Control')
+        # {% csrf_token %}을 렌더링한 페이지는 방문자마다 달라야 한다
+        and not request.META.get('CSRF_COOKIE_NEEDS_UPDATE')
+    )
+
+
+def cache_public_page(view_func=None, timeout=None):
+    """로그인하지 않은 방문자의 GET 응답 전체를 공유 캐시에 저장
+
+    키는 경로(쿼리 포함) + 언어이고, 관련 모델이 바뀌면
+    invalidate_public_pages()가 네임스페이스 버전을 올려 한 번에 무효화한다.
+    사용법: @cache_public_page 또는 @cache_public_page(timeout=60)
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if (
+                request.method not in ('GET', 'HEAD')
+                or request.user.is_authenticated
+                or len(get_messages(request))
+            ):
+                return view(request, *args, **kwargs)
+
+            cache = caches['default']
+            key = _page_cache_key(request)
+            response = cache.get(key)
+            if response is not None:
+                return response
+
+            response = view(request, *args, **kwargs)
+            if _is_cacheable(request, response):
+                cache.set(key, response, timeout or getattr(settings, 'PAGE_CACHE_TIMEOUT', 600))
+            return response
+        return wrapper
+
+    if view_func is not None:
+        return decorator(view_func)
+    return decorator
+
+
+def _updated_state(querysets):
+    """쿼리셋별 (최종 updated_at, 행 수)를 UNION ALL 쿼리 한 번으로 조회"""
+    def summary(qs):
+        return (
+            qs.order_by()
+            .annotate(_group=Value(1, output_field=IntegerField())).values('_group')
+            .annotate(latest=Max('updated_at'), rows=Count('pk'))
+            .values_list('latest', 'rows')
+        )
+
+    first, *rest = [summary(qs) for qs in querysets]
+    return list(first.union(*rest, all=True)) if rest else list(first)
+
+
+def conditional_on_updated(related):
+    """객체와 관련 행의 updated_at으로 ETag/Last-Modified를 계산해 조건부 GET 처리
+
+    related(*args, **kwargs)는 뷰 인자를 받아 쿼리셋 목록을 반환한다
+    (첫 번째는 객체 자체). 변경이 없으면 렌더링 없이 304를 반환한다.
+    행 수도 ETag에 넣어 관련 행이 삭제된 경우도 변경으로 본다.
+    사용법: @conditional_on_updated(lambda pk: [Artist.objects.filter(pk=pk), ...])
+    """
+    def state(request, *args, **kwargs):
+        # etag_func와 last_modified_func가 같은 결과를 쓰도록 요청에 저장
+        if not hasattr(request, '_updated_state'):
+            rows = _updated_state(related(*args, **kwargs))
+            latest = max((row[0] for row in rows if row[0]), default=None)
+            request._updated_state = (latest, [row[1] for row in rows])
+        return request._updated_state
+
+    def etag_func(request, *args, **kwargs):
+        latest, counts = state(request, *args, **kwargs)
+        if latest is None:
+            return None
+        raw = '|'.join(map(str, [
+            request.path, get_language(), timezone.localdate(),
+            request.user.is_authenticated, latest.isoformat(), counts,
+        ]))
+        return hashlib.md5(raw.encode()).hexdigest()
+
+    def last_modified_func(request, *args, **kwargs):
+        return state(request, *args, **kwargs)[0]
+
+    return condition(etag_func=etag_func, last_modified_func=last_modified_func)
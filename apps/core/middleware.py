@@ -0,0 +1,24 @@
+import time
+from django.conf import settings
+from django.contrib.sessions.middleware import SessionMiddleware
+
+
+class LazySessionMiddleware(SessionMiddleware):
+    """세션 저장을 꼭 필요할 때만 하는 SessionMiddleware
+
+    - 비로그인 방문자: 세션에 값을 넣지 않는 한 세션을 만들거나 저장하지 않는다.
+    - 로그인 사용자: 값이 바뀌었을 때, 그리고 만료 시간 연장을 위해
+      SESSION_REFRESH_INTERVAL마다 한 번만 저장한다.
+      (SESSION_SAVE_EVERY_REQUEST처럼 매 요청 저장하지 않음)
+    """
+
+    refresh_key = '_session_refreshed_at'
+
+    def process_response(self, request, response):
+        session = getattr(request, 'session', None)
+        if session is not None and not session.is_empty() and not session.modified:
+            interval = getattr(settings, 'SESSION_REFRESH_INTERVAL', 3600)
+            now = int(time.time())
+            if now - session.get(self.refresh_key, 0) >= interval:
+                session[self.refresh_key] = now
+        return super().process_response(request, response)
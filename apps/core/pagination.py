@@ -0,0 +1,218 @@
+import base64
+import hashlib
+import json
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import Q
+from .cache import PAGE_CACHE_NAMESPACE, namespaced_key
+
+# 이 행 수 이상이면 전체 COUNT(*) 대신 DB 통계의 추정값을 쓴다
+APPROXIMATE_COUNT_THRESHOLD = 10000
+# 정확한 행 수를 캐시하는 시간 (초) - 갤러리 모델이 바뀌면 공개 페이지 캐시와 함께 무효화
+COUNT_CACHE_TIMEOUT = 60
+
+
+def estimated_count(model, using='default'):
+    """DB 통계에 기록된 테이블 행 수 추정값 (지원하지 않는 DB면 None)"""
+    connection = connections[using]
+    table = model._meta.db_table
+    if connection.vendor == 'mysql':
+        sql = (
+            'SELECT TABLE_ROWS FROM information_schema.TABLES '
+            'WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s'
+        )
+    elif connection.vendor == 'postgresql':
+        sql = 'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass'
+    else:
+        return None
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [table])
+        row = cursor.fetchone()
+    if not row or row[0] is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+class KeysetPage:
+    """키셋 페이지 - Django Page처럼 순회하고 has_next/has_previous를 제공한다"""
+
+    def __init__(self, object_list, paginator, next_cursor, previous_cursor, params):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+        self.params = params
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __bool__(self):
+        return bool(self.object_list)
+
+    def __repr__(self):
+        return f'<KeysetPage {len(self)} rows>'
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    def _query(self, cursor):
+        params = self.params.copy()
+        params.pop(self.paginator.cursor_param, None)
+        if cursor:
+            params[self.paginator.cursor_param] = cursor
+        return params.urlencode()
+
+    @property
+    def first_query(self):
+        """첫 페이지 링크용 쿼리스트링 (필터 등 다른 GET 인자는 유지)"""
+        return self._query(None)
+
+    @property
+    def next_query(self):
+        return self._query(self.next_cursor)
+
+    @property
+    def previous_query(self):
+        return self._query(self.previous_cursor)
+
+
+class KeysetPaginator:
+    """OFFSET 없이 마지막 행의 정렬 키 다음부터 읽는 페이지네이터
+
+    ordering은 쿼리셋의 정렬과 같은 필드 목록('-start_date' 등)이고, 순서를
+    유일하게 만들기 위해 pk가 자동으로 붙는다. 페이지 위치와 상관없이
+    per_page + 1행만 읽으므로 마지막 페이지도 첫 페이지와 같은 비용이다.
+    페이지 번호 대신 커서(?cursor=...)로 다음/이전 페이지를 가리킨다.
+
+    사용법:
+        paginator = KeysetPaginator(Exhibition.objects.all(), ['-start_date'], 20)
+        page_obj = paginator.get_page(request)
+    """
+
+    cursor_param = 'cursor'
+
+    def __init__(self, queryset, ordering, per_page, approximate=True):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.approximate = approximate
+        self.ordering = [(name.lstrip('-'), name.startswith('-')) for name in ordering]
+        if 'pk' not in {name for name, _ in self.ordering}:
+            self.ordering.append(('pk', self.ordering[-1][1] if self.ordering else False))
+
+    # 커서 인코딩 -------------------------------------------------------
+    def _field(self, name):
+        meta = self.queryset.model._meta
+        return meta.pk if name == 'pk' else meta.get_field(name)
+
+    def _encode(self, obj, backwards):
+        values = []
+        for name, _ in self.ordering:
+            value = getattr(obj, self._field(name).attname)
+            values.append(value.isoformat() if hasattr(value, 'isoformat') else value)
+        raw = json.dumps([int(backwards), values], separators=(',', ':'), default=str)
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+    def _decode(self, cursor):
+        """(backwards, 값 목록) - 잘못된 커서면 None (첫 페이지로)"""
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            backwards, values = json.loads(raw)
+            if len(values) != len(self.ordering):
+                return None
+            values = [
+                self._field(name).to_python(value)
+                for (name, _), value in zip(self.ordering, values)
+            ]
+        except Exception:
+            return None
+        return bool(backwards), values
+
+    # 조회 --------------------------------------------------------------
+    def _after(self, values, backwards):
+        """정렬 순서상 values 다음(backwards면 이전)에 오는 행 조건
+
+        (a, b, pk) > (x, y, z)  →  a > x OR (a = x AND b > y) OR (a = x AND b = y AND pk > z)
+        """
+        condition = Q()
+        equal = Q()
+        for (name, descending), value in zip(self.ordering, values):
+            lookup = 'lt' if descending != backwards else 'gt'
+            condition |= equal & Q(**{f'{name}__{lookup}': value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def _order_by(self, backwards):
+        return [
+            f'{"-" if descending != backwards else ""}{name}'
+            for name, descending in self.ordering
+        ]
+
+    def _rows(self, values, backwards):
+        queryset = self.queryset.order_by(*self._order_by(backwards))
+        if values is not None:
+            queryset = queryset.filter(self._after(values, backwards))
+
+        if self.queryset.query.where:
+            # 필터 결과가 정렬 인덱스를 못 타면 일치하는 행 전체를 정렬해야 하므로
+            # pk만 정렬해 한 페이지를 고른 뒤 그 행만 읽는다 (정렬 대상 행을 좁게)
+            keys = list(queryset.values_list('pk', flat=True)[:self.per_page + 1])
+            objects = self.queryset.in_bulk(keys)
+            rows = [objects[pk] for pk in keys if pk in objects]
+        else:
+            rows = list(queryset[:self.per_page + 1])
+        return rows, len(rows) > self.per_page
+
+    def get_page(self, request):
+        cursor = request.GET.get(self.cursor_param)
+        decoded = self._decode(cursor) if cursor else None
+        backwards, values = decoded if decoded else (False, None)
+
+        rows, has_more = self._rows(values, backwards)
+        if backwards and not has_more:
+            # 앞쪽에 남은 행이 한 페이지보다 적으면 첫 페이지를 그대로 보여준다
+            backwards, values = False, None
+            rows, has_more = self._rows(values, backwards)
+        rows = rows[:self.per_page]
+        if backwards:
+            rows.reverse()
+
+        next_cursor = previous_cursor = None
+        if rows:
+            if has_more or backwards:
+                next_cursor = self._encode(rows[-1], backwards=False)
+            if values is not None and (has_more or not backwards):
+                previous_cursor = self._encode(rows[0], backwards=True)
+        return KeysetPage(rows, self, next_cursor, previous_cursor, request.GET)
+
+    @property
+    def count(self):
+        """전체 행 수 - 필터 없는 큰 테이블은 DB 추정값, 그 외는 캐시한 COUNT(*)"""
+        if not hasattr(self, '_count'):
+            self._count = self._get_count()
+        return self._count
+
+    def _get_count(self):
+        query = self.queryset.query
+        if self.approximate and not query.where:
+            estimate = estimated_count(self.queryset.model, self.queryset.db)
+            if estimate is not None and estimate >= APPROXIMATE_COUNT_THRESHOLD:
+                return estimate
+
+        sql, params = query.sql_with_params()
+        key = namespaced_key(PAGE_CACHE_NAMESPACE, 'count:' + hashlib.md5(f'{sql}|{params}'.encode()).hexdigest())
+        count = cache.get(key) if self.approximate else None
+        if count is None:
+            count = self.queryset.count()
+            if self.approximate:
+                cache.set(key, count, COUNT_CACHE_TIMEOUT)
+        return count
@@ -1,3 +1,250 @@
-from django.test import TestCase
+import json
+import os
+import tempfile
+import time
+from PIL import Image
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLResolver, get_resolver, reverse
+from apps.gallery.models import Artist, Artwork, ChunkedUpload, Exhibition, SimpleArtist
+from .cache import bump_namespace, namespaced_key
+from .pagination import KeysetPaginator
 
-# Create your tests here.
+# URL 이름별 응답 코드/쿼리 수/응답 시간 예산
+# {"gallery:artist_detail": {"anonymous": {"status": 200, "queries": 4, "ms": 300}, "staff": {...}}, ...}
+# 측정값으로 다시 만들려면: QUERY_BUDGET_UPDATE=1 python manage.py test apps.core.tests
+BUDGET_FILE = os.path.join(os.path.dirname(__file__), 'query_budgets.json')
+
+# 검사하지 않는 URL 네임스페이스 (외부 패키지)
+SKIP_NAMESPACES = ('admin', 'rest_framework', 'djdt', 'silk')
+
+# 시드 데이터 규모 (manage.py seed_gallery)
+ARTIST_COUNT = 1000
+ARTWORKS_PER_ARTIST = 3
+EXHIBITION_COUNT = 200
+ARTISTS_PER_EXHIBITION = 5
+SIMPLE_ARTIST_COUNT = 30
+
+
+def named_urls(resolver=None, prefix=''):
+    """URLconf의 모든 이름 있는 URL (네임스페이스 포함) - {이름: 인자 이름 목록}"""
+    resolver = resolver or get_resolver()
+    names = {}
+    for pattern in resolver.url_patterns:
+        if isinstance(pattern, URLResolver):
+            namespace = pattern.namespace
+            if namespace in SKIP_NAMESPACES:
+                continue
+            names.update(named_urls(pattern, f'{prefix}{namespace}:' if namespace else prefix))
+        elif pattern.name:
+            names.setdefault(f'{prefix}{pattern.name}', list(pattern.pattern.converters))
+    return names
+
+
+class QueryBudgetTest(TestCase):
+    """모든 URL을 비로그인/직원으로 요청해 쿼리 수와 응답 시간이 예산 안인지 확인
+
+    N+1 쿼리가 생기면 데이터가 많은 이 시드에서 쿼리 수가 크게 늘어 실패한다.
+    예산 파일에 없는 URL도 실패하므로 새 뷰를 추가하면 예산도 함께 등록한다.
+    응답 코드도 예산과 함께 기록해 두고 비교한다 - 리다이렉트(302)나 405로 끝난
+    요청의 쿼리 수가 예산을 통과하는 것을 막는다.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = User.objects.create_user('staff', password='staff', is_staff=True)
+        call_command(
+            'seed_gallery', seed=1, verbosity=0,
+            artists=ARTIST_COUNT, artworks_per_artist=ARTWORKS_PER_ARTIST,
+            exhibitions=EXHIBITION_COUNT, artists_per_exhibition=ARTISTS_PER_EXHIBITION,
+            simple_artists=SIMPLE_ARTIST_COUNT,
+        )
+        upload = ChunkedUpload.objects.create(user=cls.staff, filename='scan.tif', size=1024)
+
+        # 시드는 파일명만 채우므로 리사이즈할 원본 하나만 실제로 만든다
+        media = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(media.cleanup)
+        media_settings = override_settings(
+            MEDIA_ROOT=media.name, RENDITION_CACHE_DIR=os.path.join(media.name, 'renditions'),
+        )
+        media_settings.enable()
+        cls.addClassCleanup(media_settings.disable)
+
+        artist = Artist.objects.filter(is_active=True).first()
+        artwork = Artwork.objects.filter(is_published=True).first()
+        exhibition = Exhibition.objects.filter(is_published=True).first()
+        cls.url_kwargs = {
+            'gallery:artist_detail': {'pk': artist.pk},
+            'gallery:artwork_detail': {'pk': artwork.pk},
+            'gallery:exhibition_detail': {'slug': exhibition.slug},
+            'gallery:artist_edit': {'pk': artist.pk},
+            'gallery:artist_delete': {'pk': artist.pk},
+            'gallery:artwork_edit': {'pk': artwork.pk},
+            'gallery:artwork_delete': {'pk': artwork.pk},
+            'gallery:exhibition_edit': {'pk': exhibition.pk},
+            'gallery:exhibition_delete': {'pk': exhibition.pk},
+            'gallery:exhibition_set_current': {'pk': exhibition.pk},
+            'gallery:edit_simple_artist': {'pk': SimpleArtist.objects.first().pk},
+            'gallery:delete_simple_artist': {'pk': SimpleArtist.objects.first().pk},
+            'gallery:chunked_upload_detail': {'pk': upload.pk},
+            'gallery:chunked_upload_complete': {'pk': upload.pk},
+            'gallery:resized_image': {'width': 160, 'height': 160, 'path': artwork.main_image.name},
+        }
+        os.makedirs(os.path.dirname(artwork.main_image.path), exist_ok=True)
+        Image.new('RGB', (800, 600), 'gray').save(artwork.main_image.path, 'JPEG')
+        # 쿼리스트링이 있어야 실제 작업을 하는 URL
+        cls.url_queries = {
+            'gallery:search': f'q={artwork.title.split()[0]}',
+        }
+
+    def load_budgets(self):
+        if not os.path.exists(BUDGET_FILE):
+            return {}
+        with open(BUDGET_FILE, encoding='utf-8') as f:
+            return json.load(f)
+
+    def measure(self, url, staff):
+        """요청 하나의 (응답 코드, 쿼리 수, 응답 시간 ms) - 페이지 캐시를 비운 상태에서 측정"""
+        cache.clear()
+        self.client.logout()
+        if staff:
+            self.client.force_login(self.staff)
+
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            response = self.client.get(url)
+            elapsed = (time.perf_counter() - started) * 1000
+        return response.status_code, len(queries), elapsed
+
+    def test_query_budgets(self):
+        updating = bool(os.environ.get('QUERY_BUDGET_UPDATE'))
+        budgets = self.load_budgets()
+        measured = {}
+
+        for name, params in sorted(named_urls().items()):
+            kwargs = self.url_kwargs.get(name, {})
+            self.assertEqual(set(params), set(kwargs), f'{name}: url_kwargs에 URL 인자를 등록하세요')
+            url = reverse(name, kwargs=kwargs)
+            if name in self.url_queries:
+                url = f'{url}?{self.url_queries[name]}'
+
+            for role in ('anonymous', 'staff'):
+                status, queries, elapsed = self.measure(url, staff=role == 'staff')
+                measured.setdefault(name, {})[role] = {'status': status, 'queries': queries, 'ms': round(elapsed)}
+
+                if updating:
+                    continue
+                with self.subTest(url=name, role=role):
+                    budget = budgets.get(name, {}).get(role)
+                    self.assertIsNotNone(budget, f'{name} ({role}): 예산 파일에 없음 - 측정값 {status} {queries}쿼리 {elapsed:.0f}ms')
+                    self.assertEqual(status, budget['status'], f'{name} ({role}): 응답 코드가 다름')
+                    self.assertLessEqual(queries, budget['queries'], f'{name} ({role}): 쿼리 수 초과')
+                    self.assertLessEqual(elapsed, budget['ms'], f'{name} ({role}): 응답 시간 초과')
+
+        if updating:
+            self.write_budgets(measured)
+
+    def write_budgets(self, measured):
+        """측정값으로 예산 파일 갱신 (시간은 환경 차이를 감안해 여유를 둠)"""
+        budgets = {
+            name: {
+                role: {'status': values['status'], 'queries': values['queries'], 'ms': max(500, values['ms'] * 5)}
+                for role, values in roles.items()
+            }
+            for name, roles in measured.items()
+        }
+        with open(BUDGET_FILE, 'w', encoding='utf-8') as f:
+            json.dump(budgets, f, ensure_ascii=False, indent=2, sort_keys=True)
+            f.write('\n')
+
+
+class NamespaceVersionTest(TestCase):
+    """버전 키가 컬링으로 사라져도 이전 버전의 값을 다시 읽지 않는지 확인"""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_lost_version_key_starts_new_version(self):
+        first = namespaced_key('test', 'page')
+        cache.set(first, 'v1')
+        bump_namespace('test')
+        second = namespaced_key('test', 'page')
+        self.assertNotEqual(first, second)
+
+        cache.delete('ns:test')  # 컬링
+        third = namespaced_key('test', 'page')
+        self.assertNotIn(third, (first, second))
+        self.assertIsNone(cache.get(third))
+        self.assertEqual(namespaced_key('test', 'page'), third)
+
+
+class KeysetPaginatorTest(TestCase):
+    """커서로 앞뒤 페이지를 오가도 행이 빠지거나 겹치지 않는지 확인"""
+
+    @classmethod
+    def setUpTestData(cls):
+        # 표시 순서/이름이 같은 행이 여럿 - pk로 순서가 정해져야 한다
+        Artist.objects.bulk_create([
+            Artist(name=f'작가 {i // 3}', display_order=i // 6, is_active=i % 4 != 0)
+            for i in range(23)
+        ])
+        cls.expected = list(Artist.objects.order_by('display_order', 'name', 'pk'))
+
+    def get_page(self, queryset=None, **params):
+        paginator = KeysetPaginator(
+            queryset if queryset is not None else Artist.objects.all(), ['display_order', 'name'], 5,
+        )
+        return paginator.get_page(RequestFactory().get('/manage/artists/', params))
+
+    def walk_forward(self, queryset=None, **params):
+        pages = [self.get_page(queryset, **params)]
+        while pages[-1].has_next():
+            pages.append(self.get_page(queryset, **params, cursor=pages[-1].next_cursor))
+        return pages
+
+    def test_forward_covers_every_row_once(self):
+        pages = self.walk_forward()
+        self.assertEqual([len(page) for page in pages], [5, 5, 5, 5, 3])
+        self.assertEqual([artist for page in pages for artist in page], self.expected)
+        self.assertFalse(pages[0].has_previous())
+        self.assertTrue(all(page.has_previous() for page in pages[1:]))
+
+    def test_backward_returns_previous_pages(self):
+        pages = self.walk_forward()
+        page = pages[-1]
+        for previous in reversed(pages[:-1]):
+            page = self.get_page(cursor=page.previous_cursor)
+            self.assertEqual(list(page), list(previous))
+        self.assertFalse(page.has_previous())
+        self.assertTrue(page.has_next())
+
+    def test_ties_broken_by_pk(self):
+        pages = self.walk_forward()
+        for page in pages:
+            keys = [(a.display_order, a.name, a.pk) for a in page]
+            self.assertEqual(keys, sorted(keys))
+        names = [a.name for a in self.expected]
+        self.assertEqual(names[4], names[5])  # 같은 이름이 페이지 경계에 걸쳐 있다
+
+    def test_malformed_cursor_falls_back_to_first_page(self):
+        first = list(self.get_page())
+        for cursor in ('not-a-cursor', '!!!', 'W1tdXQ', 'WzAsWzFdXQ'):
+            with self.subTest(cursor=cursor):
+                page = self.get_page(cursor=cursor)
+                self.assertEqual(list(page), first)
+                self.assertFalse(page.has_previous())
+
+    def test_filtered_queryset_keeps_params(self):
+        queryset = Artist.objects.filter(is_active=True)
+        pages = self.walk_forward(queryset, q='작가')
+        expected = [artist for artist in self.expected if artist.is_active]
+        self.assertEqual([artist for page in pages for artist in page], expected)
+        self.assertIn('q=', pages[0].next_query)
+        self.assertIn('cursor=', pages[0].next_query)
+        self.assertNotIn('cursor=', pages[1].first_query)
+        back = self.get_page(queryset, q='작가', cursor=pages[1].previous_cursor)
+        self.assertEqual(list(back), list(pages[0]))
@@ -1,28 +1,35 @@
 from django.shortcuts import render, redirect
+from .cache import cache_public_page
 
+@cache_public_page
 def index(request):
     """메인 페이지"""
     # 새로운 하나아트갤러리 메인 페이지 템플릿 렌더링
     return render(request, 'index_new.html')
 
+@cache_public_page
 def about(request):
     """소개·인사말 페이지"""
     return render(request, 'about.html')
 
+@cache_public_page
 def history(request):
     """연혁 페이지"""
     return render(request, 'history.html')
 
+@cache_public_page
 def exhibition(request):
     """현재전시 페이지"""
-    from apps.gallery.models import CurrentExhibition
-    exhibition = CurrentExhibition.objects.filter(is_active=True).first()
+    from apps.gallery.current import get_current
+    # 포인터 행이 가리키는 전시를 캐시에서 읽는다 (변경 시 신호로 무효화)
+    exhibition = get_current()
     return render(request, 'exhibition.html', {'exhibition': exhibition})
 
 def artfair(request):
     """아트페어 페이지"""
     return render(request, 'artfair.html')
 
+@cache_public_page
 def artists(request):
     """전속작가 페이지"""
     from apps.gallery.models import SimpleArtist
@@ -44,6 +51,6 @@ def contact(request):
 def dashboard(request):
     """관리자 대시보드 (gallery 앱으로 이동)"""
     if not request.user.is_authenticated or not request.user.is_staff:
-        return redirect('admin:login')
+        return redirect('gallery:manage_login')
     
     return redirect('gallery:admin_dashboard')
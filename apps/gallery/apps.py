@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class GalleryConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.gallery'
+
+    def ready(self):
+        # 대형 스캔 허용(IMAGE_MAX_PIXELS)은 직원 업로드 뷰와 이미지 작업 워커에서만
+        # utils.allow_large_images()로 적용한다 (공개 요청은 Pillow 기본 한도)
+        from . import signals
+        signals.connect()
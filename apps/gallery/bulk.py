@@ -0,0 +1,121 @@
+from django.db import transaction
+from django.utils import timezone
+from apps.core.cache import invalidate_public_pages
+from . import stats
+from .models import Artist, Artwork, Exhibition
+
+# 요청 한 번에 처리하는 최대 객체 수
+BULK_MAX_IDS = 500
+
+# 요청의 model 값 → (모델, 게시 여부 필드, 결과 메시지의 수량 단위)
+BULK_MODELS = {
+    'artist': (Artist, 'is_active', '명을'),
+    'exhibition': (Exhibition, 'is_published', '개를'),
+    'artwork': (Artwork, 'is_published', '점을'),
+}
+
+
+def _ids(value):
+    """중복 없는 pk 목록 (순서 유지 - 순서 변경에 쓰인다)"""
+    if not isinstance(value, list) or not value:
+        raise ValueError('선택한 항목이 없습니다.')
+    if len(value) > BULK_MAX_IDS:
+        raise ValueError(f'한 번에 {BULK_MAX_IDS}개까지 처리할 수 있습니다.')
+    try:
+        return list(dict.fromkeys(int(pk) for pk in value))
+    except (TypeError, ValueError):
+        raise ValueError('잘못된 항목 ID가 있습니다.')
+
+
+# 작업 함수: (모델 이름, 대상 쿼리셋, 요청 pk 목록, 요청 데이터, 현재 시각) → (처리 수, 작업 이름)
+# QuerySet.update()/bulk_update()는 auto_now를 채우지 않으므로 updated_at을 직접 넣는다
+# (상세 페이지 ETag가 updated_at으로 계산된다)
+def _publish(value):
+    def operation(name, queryset, ids, data, now):
+        field = BULK_MODELS[name][1]
+        count = queryset.update(**{field: value, 'updated_at': now})
+        if field == 'is_active':
+            return count, '활성화' if value else '비활성화'
+        return count, '게시' if value else '게시 해제'
+    return operation
+
+
+def _set_sold(name, queryset, ids, data, now):
+    sold = bool(data.get('sold', True))
+    count = queryset.update(is_sold=sold, updated_at=now)
+    return count, '판매 완료로 변경' if sold else '판매 중으로 변경'
+
+
+def _reorder(name, queryset, ids, data, now):
+    """ids 순서대로 display_order를 start, start + 1, ...로 지정 (UPDATE ... CASE 한 번)"""
+    try:
+        start = int(data.get('start', 0))
+    except (TypeError, ValueError):
+        raise ValueError('시작 순서는 숫자여야 합니다.')
+    existing = set(queryset.values_list('pk', flat=True))
+    model = queryset.model
+    objects = [
+        model(pk=pk, display_order=start + position, updated_at=now)
+        for position, pk in enumerate(pk for pk in ids if pk in existing)
+    ]
+    model.objects.bulk_update(objects, ['display_order', 'updated_at'])
+    return len(objects), '순서 변경'
+
+
+def _assign_exhibition(name, queryset, ids, data, now):
+    """작품을 전시에 추가 - 이미 연결된 작품은 그대로 (m2m_changed 신호 한 번)"""
+    try:
+        exhibition = Exhibition.objects.get(pk=int(data.get('exhibition')))
+    except (TypeError, ValueError, Exhibition.DoesNotExist):
+        raise ValueError('연결할 전시를 선택하세요.')
+    pks = list(queryset.values_list('pk', flat=True))
+    exhibition.artworks.add(*pks)
+    queryset.update(updated_at=now)
+    Exhibition.objects.filter(pk=exhibition.pk).update(updated_at=now)
+    return len(pks), f'{exhibition.title} 전시에 연결'
+
+
+def _delete(name, queryset, ids, data, now):
+    # 검색 색인/캐시는 삭제 신호(post_delete)로 정리된다
+    count = queryset.count()
+    queryset.delete()
+    return count, '삭제'
+
+
+# 작업 이름 → (함수, 사용할 수 있는 모델)
+OPERATIONS = {
+    'publish': (_publish(True), ('artist', 'exhibition', 'artwork')),
+    'unpublish': (_publish(False), ('artist', 'exhibition', 'artwork')),
+    'set_sold': (_set_sold, ('artwork',)),
+    'reorder': (_reorder, ('artist', 'artwork')),
+    'assign_exhibition': (_assign_exhibition, ('artwork',)),
+    'delete': (_delete, ('artist', 'exhibition', 'artwork')),
+}
+
+
+def apply(data):
+    """일괄 작업 실행 - (처리 수, 결과 메시지), 잘못된 요청은 ValueError
+
+    data: {"model": "artwork", "operation": "publish", "ids": [1, 2, 3], ...작업별 값}
+    작업 전체를 트랜잭션 하나로 처리하고, 신호를 보내지 않는 update()를 쓰므로
+    공개 페이지/대시보드 캐시는 커밋 후 한 번에 무효화한다.
+    """
+    if not isinstance(data, dict):
+        raise ValueError('잘못된 요청입니다.')
+    name = data.get('model')
+    if not isinstance(name, str) or name not in BULK_MODELS:
+        raise ValueError('지원하지 않는 대상입니다.')
+    operation = data.get('operation')
+    if not isinstance(operation, str) or operation not in OPERATIONS:
+        raise ValueError('지원하지 않는 작업입니다.')
+    function, models = OPERATIONS[operation]
+    model, _, unit = BULK_MODELS[name]
+    if name not in models:
+        raise ValueError(f'{model._meta.verbose_name}에는 사용할 수 없는 작업입니다.')
+    ids = _ids(data.get('ids'))
+
+    with transaction.atomic():
+        count, label = function(name, model.objects.filter(pk__in=ids), ids, data, timezone.now())
+        invalidate_public_pages()
+        stats.invalidate()
+    return count, f'{model._meta.verbose_name} {count}{unit} {label}했습니다.'
@@ -0,0 +1,94 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from apps.core.cache import bump_namespace, invalidate_public_pages, namespaced_key
+from .models import CurrentExhibition, CurrentExhibitionPointer, Exhibition
+
+CURRENT_CACHE_NAMESPACE = 'current'
+# 저장/삭제 신호로 무효화되지만 update()로 바뀌는 이미지 정보도 이 시간 뒤에는 반영
+CURRENT_CACHE_TIMEOUT = 600
+
+
+def invalidate():
+    """현재 전시 캐시 무효화 (트랜잭션이 커밋된 뒤에 실행)"""
+    transaction.on_commit(lambda: bump_namespace(CURRENT_CACHE_NAMESPACE))
+
+
+def _lock_pointer():
+    """포인터 행을 잠근다 (트랜잭션 안에서) - 현재 전시를 바꾸는 요청을 한 줄로 세운다"""
+    pointer, _ = CurrentExhibitionPointer.objects.select_for_update().get_or_create(
+        pk=CurrentExhibitionPointer.SINGLETON_PK,
+    )
+    return pointer
+
+
+def get_current(cached=True):
+    """현재전시 페이지에 표시할 CurrentExhibition (없으면 None)
+
+    캐시 키는 조회 전에 현재 네임스페이스 버전으로 만들므로, 조회 중에 커밋된
+    변경이 이전 값으로 캐시되어도 다음 요청은 올라간 버전의 키에서 다시 읽는다.
+    """
+    if not cached:
+        pointer = (
+            CurrentExhibitionPointer.objects.select_related('exhibition')
+            .filter(pk=CurrentExhibitionPointer.SINGLETON_PK).first()
+        )
+        return pointer.exhibition if pointer else None
+
+    key = namespaced_key(CURRENT_CACHE_NAMESPACE, 'exhibition')
+    # (전시,) 튜플로 저장해 '현재 전시 없음'도 캐시한다
+    value = cache.get(key)
+    if value is None:
+        value = (get_current(cached=False),)
+        cache.set(key, value, CURRENT_CACHE_TIMEOUT)
+    return value[0]
+
+
+def activate(exhibition):
+    """CurrentExhibition 하나를 현재 전시로 - 저장 전 객체면 새로 저장한다
+
+    포인터 행을 잠근 트랜잭션 안에서 포인터와 is_active 플래그를 함께 바꾸므로
+    동시에 요청해도 활성 전시가 0개나 2개가 되지 않는다.
+    """
+    with transaction.atomic():
+        pointer = _lock_pointer()
+        now = timezone.now()
+        exhibition.is_active = True
+        if exhibition.pk is None:
+            exhibition.save()
+        else:
+            # 메모리의 is_active는 다른 전환 뒤라 낡았을 수 있으므로 DB 값을 직접 바꾼다
+            CurrentExhibition.objects.filter(pk=exhibition.pk).update(is_active=True, updated_at=now)
+        CurrentExhibition.objects.filter(is_active=True).exclude(pk=exhibition.pk).update(
+            is_active=False, updated_at=now,
+        )
+        pointer.exhibition = exhibition
+        pointer.save()
+        invalidate()
+        invalidate_public_pages()
+    return exhibition
+
+
+def set_current(exhibition):
+    """Exhibition 하나만 is_current로 - 같은 포인터 행 잠금으로 동시 변경을 직렬화"""
+    with transaction.atomic():
+        _lock_pointer()
+        Exhibition.objects.filter(is_current=True).exclude(pk=exhibition.pk).update(
+            is_current=False, updated_at=timezone.now(),
+        )
+        exhibition.is_current = True
+        exhibition.save(update_fields=['is_current', 'updated_at'])
+        invalidate()
+        invalidate_public_pages()
+    return exhibition
+
+
+def clear_current(exhibition):
+    """Exhibition의 is_current 해제 - set_current()와 같은 포인터 행 잠금"""
+    with transaction.atomic():
+        _lock_pointer()
+        exhibition.is_current = False
+        exhibition.save(update_fields=['is_current', 'updated_at'])
+        invalidate()
+        invalidate_public_pages()
+    return exhibition
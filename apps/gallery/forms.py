@@ -21,6 +21,7 @@ class ArtistForm(forms.ModelForm):
             'phone': forms.TextInput(attrs={'class': 'form-control', 'placeholder': '전화번호'}),
             'website': forms.URLInput(attrs={'class': 'form-control', 'placeholder': '웹사이트'}),
             'instagram': forms.TextInput(attrs={'class': 'form-control', 'placeholder': '@instagram'}),
+            'profile_image': forms.ClearableFileInput(attrs={'data-chunked-upload': 'true'}),
             'display_order': forms.NumberInput(attrs={'class': 'form-control', 'placeholder': '표시 순서'}),
             'is_exclusive': forms.CheckboxInput(attrs={'class': 'form-check-input'}),
             'is_active': forms.CheckboxInput(attrs={'class': 'form-check-input'}),
@@ -34,9 +35,16 @@ class ExhibitionForm(forms.ModelForm):
         required=False,
         label='전시 작품'
     )
+    # 모델 필드로 저장하지 않고 뷰에서 current.set_current()로 지정 (다른 전시 해제, 캐시 무효화)
+    is_current = forms.BooleanField(
+        widget=forms.CheckboxInput(attrs={'class': 'form-check-input'}),
+        required=False,
+        label='현재 전시'
+    )
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.fields['is_current'].initial = self.instance.is_current
         # 작품 선택 필드의 표시 형식 개선
         self.fields['artworks'].label_from_instance = lambda obj: f"{obj.artist.name} - {obj.title}"
         # 작가 선택 필드의 표시 형식 개선
@@ -49,7 +57,7 @@ class ExhibitionForm(forms.ModelForm):
             'description', 'poster_image', 
             'start_date', 'end_date', 'opening_date',
             'venue', 'venue_address',
-            'artists', 'is_current', 'is_featured', 'is_published',
+            'artists', 'is_featured', 'is_published',
             'meta_description'
         ]
         widgets = {
@@ -65,7 +73,6 @@ class ExhibitionForm(forms.ModelForm):
             'venue_address': forms.TextInput(attrs={'class': 'form-control'}),
             'artists': forms.SelectMultiple(attrs={'class': 'form-select', 'size': 8}),
             'meta_description': forms.Textarea(attrs={'class': 'form-control', 'rows': 2}),
-            'is_current': forms.CheckboxInput(attrs={'class': 'form-check-input'}),
             'is_featured': forms.CheckboxInput(attrs={'class': 'form-check-input'}),
             'is_published': forms.CheckboxInput(attrs={'class': 'form-check-input'}),
         }
@@ -90,6 +97,7 @@ class ArtworkForm(forms.ModelForm):
             'size': forms.TextInput(attrs={'class': 'form-control'}),
             'edition': forms.TextInput(attrs={'class': 'form-control'}),
             'description': forms.Textarea(attrs={'class': 'form-control', 'rows': 4}),
+            'main_image': forms.ClearableFileInput(attrs={'data-chunked-upload': 'true'}),
             'price': forms.NumberInput(attrs={'class': 'form-control'}),
             'exhibitions': forms.SelectMultiple(attrs={'class': 'form-select'}),
             'display_order': forms.NumberInput(attrs={'class': 'form-control'}),
@@ -0,0 +1,71 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from apps.gallery.models import (
+    Artist, Artwork, ArtworkImage, CurrentExhibition, CurrentExhibitionPointer, Exhibition, SimpleArtist,
+)
+
+
+def _querysets():
+    """gallery/core/adminpanel 뷰가 실행하는 목록 쿼리 (뷰와 같은 filter/order_by)"""
+    artist = Artist.objects.filter(is_active=True).order_by('-pk').first()
+    artist_id = artist.pk if artist else 0
+    artwork_count = Artwork.objects.filter(is_published=True, artist=OuterRef('pk')).order_by().values('artist').annotate(c=Count('pk')).values('c')
+
+    return {
+        # gallery.views
+        'artist_list': Artist.objects.filter(is_active=True).annotate(
+            artwork_count=Coalesce(Subquery(artwork_count), 0),
+        ).order_by('display_order', 'name'),
+        'artist_list cover': Artwork.objects.filter(is_published=True, artist_id=artist_id).order_by('display_order', '-created_at')[:1],
+        'artist_detail artworks': Artwork.objects.filter(artist_id=artist_id, is_published=True).order_by('display_order', '-created_at'),
+        'artist_detail exhibitions': Exhibition.objects.filter(artists=artist_id, is_published=True).order_by('-start_date'),
+        'exhibition_list': Exhibition.objects.filter(is_published=True).order_by('-start_date'),
+        'exhibition_list current': Exhibition.objects.filter(is_published=True, is_current=True).order_by('-start_date'),
+        'artwork_detail images': ArtworkImage.objects.filter(artwork__artist_id=artist_id).order_by('artwork', 'order'),
+        'admin_dashboard recent artists': Artist.objects.order_by('-created_at')[:6],
+        'admin_dashboard recent exhibitions': Exhibition.objects.order_by('-created_at')[:5],
+        'admin_dashboard current': Exhibition.objects.filter(is_current=True),
+        'artist_manage_list': Artist.objects.order_by('display_order', 'name')[:20],
+        'exhibition_manage_list': Exhibition.objects.order_by('-start_date')[:20],
+        'artwork_manage_list': Artwork.objects.select_related('artist').order_by('-created_at')[:20],
+        'artwork_manage_list artists': Artist.objects.filter(is_active=True).order_by('name'),
+        'manage_current_exhibition past': CurrentExhibition.objects.filter(is_active=False).order_by('-created_at')[:10],
+        # core.views
+        'core exhibition': CurrentExhibitionPointer.objects.select_related('exhibition').filter(pk=1),
+        'core artists': SimpleArtist.objects.filter(is_active=True).order_by('display_order', 'name'),
+    }
+
+
+class Command(BaseCommand):
+    help = '갤러리 목록 쿼리의 실행 계획과 실행 시간 측정 (seed_gallery로 만든 대용량 데이터에서 실행)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=20, help='쿼리별 반복 횟수')
+        parser.add_argument('--plan', action='store_true', help='실행 계획(EXPLAIN) 출력')
+        parser.add_argument('--only', default='', help='이름에 이 문자열이 들어간 쿼리만')
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f'{connection.vendor} / 작가 {Artist.objects.count()}, 작품 {Artwork.objects.count()}, '
+            f'전시 {Exhibition.objects.count()}'
+        )
+        self.stdout.write(f'{"쿼리":<40} {"중앙값(ms)":>10} {"최대(ms)":>10} {"행":>7}')
+
+        for name, queryset in _querysets().items():
+            if options['only'] not in name:
+                continue
+            timings = []
+            for _ in range(options['runs']):
+                started = time.perf_counter()
+                rows = len(list(queryset.all()))
+                timings.append((time.perf_counter() - started) * 1000)
+            self.stdout.write(f'{name:<40} {statistics.median(timings):>10.2f} {max(timings):>10.2f} {rows:>7}')
+            if options['plan']:
+                for line in queryset.explain().splitlines():
+                    self.stdout.write(f'    {line}')
@@ -0,0 +1,79 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+
+import django
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from apps.gallery.models import ImageJob
+
+
+def _init_worker():
+    """워커 프로세스 초기화 (spawn 방식에서도 앱 레지스트리 준비)
+
+    fork로 시작하면 부모가 열어 둔 DB 연결을 물려받는다. 여러 워커가 한 소켓을
+    같이 쓰면 프로토콜이 깨지고, close()는 부모의 연결까지 끊으므로 닫지 않고
+    버린다 - 워커의 첫 쿼리에서 새로 연결된다.
+    """
+    django.setup()
+    for connection in connections.all(initialized_only=True):
+        connection.connection = None
+
+
+def _run(job_id):
+    from apps.gallery.tasks import run_image_job
+    return run_image_job(job_id)
+
+
+class Command(BaseCommand):
+    help = '이미지 렌디션 작업 큐 처리 워커'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='워커 프로세스 수')
+        parser.add_argument('--batch', type=int, default=20, help='한 번에 가져올 작업 수')
+        parser.add_argument('--sleep', type=float, default=2.0, help='작업이 없을 때 대기 시간(초)')
+        parser.add_argument('--stale-minutes', type=int, default=30, help='처리중으로 남은 작업을 재시도할 시간(분)')
+        parser.add_argument('--once', action='store_true', help='대기 중인 작업만 처리하고 종료')
+        parser.add_argument('--retry-failed', action='store_true', help='실패한 작업을 다시 대기 상태로')
+        parser.add_argument('--backfill', action='store_true', help='기존 이미지 전체에 대해 작업 등록')
+
+    def handle(self, *args, **options):
+        if options['retry_failed']:
+            count = ImageJob.objects.filter(status=ImageJob.STATUS_FAILED).update(
+                status=ImageJob.STATUS_PENDING, attempts=0,
+            )
+            self.stdout.write(f'실패 작업 {count}개를 다시 대기 상태로 변경했습니다.')
+
+        if options['backfill']:
+            self.stdout.write(f'기존 이미지 작업 {self.backfill()}개를 등록했습니다.')
+
+        stale = timedelta(minutes=options['stale_minutes'])
+
+        # 워커가 물려받은 연결은 _init_worker에서 버린다 (부모는 루프에서 다시 연결)
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=options['workers'], initializer=_init_worker) as pool:
+            while True:
+                ImageJob.requeue_stale(stale)
+                job_ids = ImageJob.claim(options['batch'])
+                if not job_ids:
+                    if options['once']:
+                        break
+                    time.sleep(options['sleep'])
+                    continue
+
+                for job_id, status in zip(job_ids, pool.map(_run, job_ids)):
+                    self.stdout.write(f'작업 #{job_id}: {status}')
+
+    def backfill(self):
+        """rendition_fields가 있는 모든 모델의 기존 이미지를 큐에 등록"""
+        count = 0
+        for model in apps.get_app_config('gallery').get_models():
+            fields = getattr(model, 'rendition_fields', ())
+            if not fields:
+                continue
+            for instance in model.objects.only('pk', *fields).iterator():
+                count += len(ImageJob.enqueue(instance, fields))
+        return count
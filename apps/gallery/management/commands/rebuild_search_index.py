@@ -0,0 +1,24 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.gallery import search
+
+
+class Command(BaseCommand):
+    help = '검색 색인 전체 재생성 (bulk 데이터 이관/seed 후 또는 토큰 규칙 변경 시)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('models', nargs='*', help=f'재생성할 모델 (기본: 전체 - {", ".join(search.INDEXES)})')
+        parser.add_argument('--chunk-size', type=int, default=2000, help='한 번에 색인할 객체 수')
+
+    def handle(self, *args, **options):
+        labels = options['models'] or list(search.INDEXES)
+        unknown = set(labels) - set(search.INDEXES)
+        if unknown:
+            raise CommandError(f'색인 대상이 아닌 모델: {", ".join(sorted(unknown))}')
+
+        for label in labels:
+            started = time.perf_counter()
+            objects, tokens = search.rebuild(label, chunk_size=options['chunk_size'])
+            self.stdout.write(f'{label}: {objects}개, 토큰 {tokens}개 색인 ({time.perf_counter() - started:.1f}초)')
@@ -0,0 +1,25 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.gallery import stats
+
+
+class Command(BaseCommand):
+    help = '대시보드 일별 통계(등록 수) 다시 집계 - 데이터 이관 후 지난 날짜 채우기, 또는 매일 cron으로 마감'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=stats.TREND_WEEKS * 7, help='오늘부터 거슬러 집계할 날짜 수')
+
+    def handle(self, *args, **options):
+        if options['days'] < 1:
+            raise CommandError('--days는 1 이상이어야 합니다')
+        today = timezone.localdate()
+        start = today - timedelta(days=options['days'] - 1)
+        totals = stats.totals(today)['artworks']
+        rows = stats.rollup(start, today, sold_value=totals['sold_value'], for_sale_value=totals['for_sale_value'])
+        stats.invalidate()
+        self.stdout.write(
+            f'{start} ~ {today}: {len(rows)}일, 작품 {sum(row.artworks_added for row in rows.values())}개 등록'
+        )
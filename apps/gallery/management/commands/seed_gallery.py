@@ -0,0 +1,304 @@
+import random
+import time
+import uuid
+from datetime import date, timedelta
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from PIL import Image, ImageDraw
+
+from apps.gallery import current, search
+from apps.gallery.models import (
+    Artist, Artwork, ArtworkImage, CurrentExhibition, Exhibition, SimpleArtist,
+)
+from apps.gallery.utils import ImageOptimizer
+
+SURNAMES = '김이박최정강조윤장임한오서신권황안송류홍전고문손양배백허남심노하곽성차주우구민유나진지엄채원천방공현함변염여추도소석선설마길연위표명기반왕금옥육인맹제모탁국어은편용'
+NAME_SYLLABLES = '민서준지현우진수영하은도윤예주원아연호성경태희승재혜미정선나유다혁빈건소채시한결'
+TITLE_WORDS = [
+    '풍경', '정물', '기억', '바다', '산', '빛', '그림자', '도시', '숲', '바람', '꽃', '시간',
+    '침묵', '여름', '겨울', '새벽', '흔적', '구성', '리듬', '파도', '달', '길', '창', '정원',
+]
+MEDIUMS = ['캔버스에 유채', '한지에 수묵담채', '캔버스에 아크릴', '종이에 혼합재료', '브론즈', '디지털 프린트']
+EXHIBITION_WORDS = ['빛의', '시간의', '기억의', '자연의', '도시의', '사이의', '너머의', '조용한']
+EXHIBITION_NOUNS = ['정원', '풍경', '여정', '대화', '층위', '리듬', '온도', '단면']
+
+
+def _parse_size(value):
+    try:
+        width, height = (int(v) for v in value.lower().split('x'))
+    except ValueError:
+        raise CommandError(f'이미지 크기는 WIDTHxHEIGHT 형식이어야 합니다: {value}')
+    return width, height
+
+
+class Command(BaseCommand):
+    help = '부하/규모 테스트용 합성 갤러리 데이터 생성 (bulk_create 사용)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--artists', type=int, default=100, help='작가 수')
+        parser.add_argument('--artworks-per-artist', type=int, default=10, help='작가당 작품 수')
+        parser.add_argument('--exhibitions', type=int, default=50, help='전시 수')
+        parser.add_argument('--artists-per-exhibition', type=int, default=5, help='전시당 참여 작가 수')
+        parser.add_argument('--artworks-per-exhibition', type=int, default=20, help='전시당 출품 작품 수')
+        parser.add_argument('--extra-images', type=int, default=1, help='작품당 추가 이미지 수')
+        parser.add_argument('--simple-artists', type=int, default=10, help='전속작가(간단) 수')
+        parser.add_argument('--images', action='store_true', help='합성 이미지 파일을 실제로 생성 (없으면 파일명만 채움)')
+        parser.add_argument('--image-size', default='1600x1200', help='합성 이미지 크기 (WIDTHxHEIGHT)')
+        parser.add_argument('--image-pool', type=int, default=20, help='생성해 돌려 쓸 이미지 수')
+        parser.add_argument('--batch-size', type=int, default=1000, help='bulk_create 배치 크기')
+        parser.add_argument('--seed', type=int, default=None, help='난수 시드 (같은 값이면 같은 데이터)')
+
+    def handle(self, *args, **options):
+        self.verbosity = options['verbosity']
+        self.random = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        # 슬러그/파일명 충돌 방지용 (같은 시드로 여러 번 실행해도 됨)
+        self.run_id = uuid.uuid4().hex[:8]
+        started = time.perf_counter()
+
+        images = self.image_pool(options)
+
+        with transaction.atomic():
+            artist_ids = self.create_artists(options['artists'], images['artists'])
+            artworks_by_artist = self.create_artworks(artist_ids, options['artworks_per_artist'], images['artworks'])
+            self.create_artwork_images(artworks_by_artist, options['extra_images'], images['artworks'])
+            exhibition_ids = self.create_exhibitions(options['exhibitions'], images['posters'])
+            self.link_exhibitions(exhibition_ids, artworks_by_artist, options)
+            self.create_simple_artists(options['simple_artists'], images['artworks'])
+            self.create_current_exhibition(images['artworks'])
+            # bulk_create는 저장 신호를 보내지 않으므로 검색 색인을 직접 만든다
+            self.index(Artist, artist_ids)
+            self.index(Exhibition, exhibition_ids)
+            self.index(Artwork, [pk for artwork_ids in artworks_by_artist.values() for pk in artwork_ids])
+
+        artwork_count = sum(len(ids) for ids in artworks_by_artist.values())
+        self.log(
+            f'작가 {len(artist_ids)}명, 작품 {artwork_count}점, 전시 {len(exhibition_ids)}개 생성 '
+            f'({time.perf_counter() - started:.1f}초)'
+        )
+        if options['images']:
+            self.log('렌디션은 `process_image_jobs --backfill`로 생성하세요.')
+
+    def log(self, message):
+        if self.verbosity > 0:
+            self.stdout.write(message)
+
+    # 이미지
+
+    def image_pool(self, options):
+        """용도별 이미지 파일명 목록
+
+        --images가 없으면 존재하지 않는 파일명만 만든다 (템플릿은 원본 URL로 대체).
+        """
+        count = max(1, options['image_pool'])
+        folders = {'artists': 'artists/profiles', 'artworks': 'artworks', 'posters': 'exhibitions/posters'}
+        if not options['images']:
+            return {
+                key: [f'{folder}/seed_{self.run_id}_{i}.jpg' for i in range(count)]
+                for key, folder in folders.items()
+            }
+
+        size = _parse_size(options['image_size'])
+        pool = {}
+        for key, folder in folders.items():
+            pool[key] = []
+            for i in range(count):
+                with self.synthetic_image(size) as img:
+                    content = ImageOptimizer.encode(img, quality=90)
+                with content:
+                    pool[key].append(default_storage.save(f'{folder}/seed_{self.run_id}_{i}.jpg', content))
+        self.log(f'합성 이미지 {count * len(folders)}개 생성 ({size[0]}x{size[1]})')
+        return pool
+
+    def synthetic_image(self, size):
+        """그라디언트 배경에 무작위 도형을 그린 이미지 (JPEG 압축률이 실제 작품과 비슷하도록)"""
+        rand = self.random
+        start = tuple(rand.randrange(256) for _ in range(3))
+        end = tuple(rand.randrange(256) for _ in range(3))
+        gradient = Image.linear_gradient('L').resize(size)
+        img = Image.merge('RGB', [
+            gradient.point(lambda v, a=a, b=b: a + (b - a) * v // 255) for a, b in zip(start, end)
+        ])
+        draw = ImageDraw.Draw(img)
+        width, height = size
+        for _ in range(30):
+            x0, y0 = rand.randrange(width), rand.randrange(height)
+            x1, y1 = x0 + rand.randrange(width // 3 + 1), y0 + rand.randrange(height // 3 + 1)
+            color = tuple(rand.randrange(256) for _ in range(3))
+            if rand.random() < 0.5:
+                draw.ellipse((x0, y0, x1, y1), fill=color)
+            else:
+                draw.rectangle((x0, y0, x1, y1), outline=color, width=rand.randrange(1, 12))
+        return img
+
+    # 생성
+
+    def bulk_create(self, model, objects):
+        """배치로 나눠 저장하고 pk 목록 반환
+
+        MySQL처럼 bulk_create가 pk를 돌려주지 않는 DB에서는
+        방금 추가된 마지막 행들의 pk를 다시 읽는다.
+        """
+        pks = []
+        batch = []
+        for obj in objects:
+            batch.append(obj)
+            if len(batch) >= self.batch_size:
+                pks.extend(self._create_batch(model, batch))
+                batch = []
+        if batch:
+            pks.extend(self._create_batch(model, batch))
+        return pks
+
+    def _create_batch(self, model, batch):
+        created = model.objects.bulk_create(batch)
+        if created[0].pk is not None:
+            return [obj.pk for obj in created]
+        return list(model.objects.order_by('-pk').values_list('pk', flat=True)[:len(created)])[::-1]
+
+    def person_name(self):
+        rand = self.random
+        return rand.choice(SURNAMES) + ''.join(rand.choice(NAME_SYLLABLES) for _ in range(2))
+
+    def create_artists(self, count, images):
+        rand = self.random
+        return self.bulk_create(Artist, (
+            Artist(
+                name=self.person_name(),
+                name_en=f'Artist {self.run_id}-{i}',
+                birth_year=rand.randint(1940, 2000),
+                profile_image=rand.choice(images),
+                bio='작가 소개 ' * rand.randint(5, 40),
+                education='미술대학 졸업',
+                is_exclusive=rand.random() < 0.1,
+                is_active=rand.random() < 0.95,
+                display_order=i,
+            )
+            for i in range(count)
+        ))
+
+    def create_artworks(self, artist_ids, per_artist, images):
+        """반환값: {작가 pk: [작품 pk, ...]}"""
+        rand = self.random
+        artist_of = []
+
+        def artworks():
+            for artist_id in artist_ids:
+                for order in range(per_artist):
+                    artist_of.append(artist_id)
+                    yield Artwork(
+                        title=f'{rand.choice(TITLE_WORDS)} {rand.choice(TITLE_WORDS)} {order + 1}',
+                        artist_id=artist_id,
+                        artwork_type=rand.choice(Artwork.ARTWORK_TYPES)[0],
+                        year=rand.randint(1980, date.today().year),
+                        medium=rand.choice(MEDIUMS),
+                        size=f'{rand.randint(20, 200)} x {rand.randint(20, 200)} cm',
+                        description='작품 설명 ' * rand.randint(3, 30),
+                        main_image=rand.choice(images),
+                        price=rand.randint(10, 5000) * 10000 if rand.random() < 0.7 else None,
+                        is_sold=rand.random() < 0.2,
+                        is_featured=rand.random() < 0.05,
+                        is_published=rand.random() < 0.9,
+                        display_order=order,
+                    )
+
+        artworks_by_artist = {artist_id: [] for artist_id in artist_ids}
+        for artist_id, pk in zip(artist_of, self.bulk_create(Artwork, artworks())):
+            artworks_by_artist[artist_id].append(pk)
+        return artworks_by_artist
+
+    def create_artwork_images(self, artworks_by_artist, per_artwork, images):
+        if per_artwork <= 0:
+            return
+        rand = self.random
+        self.bulk_create(ArtworkImage, (
+            ArtworkImage(artwork_id=artwork_id, image=rand.choice(images), order=order)
+            for artwork_ids in artworks_by_artist.values()
+            for artwork_id in artwork_ids
+            for order in range(per_artwork)
+        ))
+
+    def create_exhibitions(self, count, images):
+        rand = self.random
+        today = date.today()
+
+        def exhibitions():
+            for i in range(count):
+                start = today - timedelta(days=rand.randint(-90, 3650))
+                end = start + timedelta(days=rand.randint(14, 60))
+                yield Exhibition(
+                    title=f'{rand.choice(EXHIBITION_WORDS)} {rand.choice(EXHIBITION_NOUNS)}',
+                    exhibition_type=rand.choice(Exhibition.EXHIBITION_TYPES)[0],
+                    description='전시 설명 ' * rand.randint(10, 60),
+                    poster_image=rand.choice(images),
+                    start_date=start,
+                    end_date=end,
+                    is_current=start <= today <= end,
+                    is_featured=rand.random() < 0.1,
+                    is_published=rand.random() < 0.95,
+                    slug=f'seed-{self.run_id}-{i}',
+                )
+
+        return self.bulk_create(Exhibition, exhibitions())
+
+    def link_exhibitions(self, exhibition_ids, artworks_by_artist, options):
+        """전시-작가, 전시-작품 M2M을 through 테이블에 직접 bulk_create"""
+        rand = self.random
+        artist_ids = [artist_id for artist_id, artworks in artworks_by_artist.items() if artworks] or list(artworks_by_artist)
+        if not artist_ids:
+            return
+        ExhibitionArtist = Exhibition.artists.through
+        ArtworkExhibition = Artwork.exhibitions.through
+        exhibition_artists = []
+        artwork_exhibitions = []
+
+        for exhibition_id in exhibition_ids:
+            participants = rand.sample(artist_ids, min(options['artists_per_exhibition'], len(artist_ids)))
+            exhibition_artists.extend(
+                ExhibitionArtist(exhibition_id=exhibition_id, artist_id=artist_id) for artist_id in participants
+            )
+            # 출품작은 참여 작가의 작품에서 고른다
+            candidates = [pk for artist_id in participants for pk in artworks_by_artist[artist_id]]
+            artwork_exhibitions.extend(
+                ArtworkExhibition(exhibition_id=exhibition_id, artwork_id=artwork_id)
+                for artwork_id in rand.sample(candidates, min(options['artworks_per_exhibition'], len(candidates)))
+            )
+
+        ExhibitionArtist.objects.bulk_create(exhibition_artists, batch_size=self.batch_size)
+        ArtworkExhibition.objects.bulk_create(artwork_exhibitions, batch_size=self.batch_size)
+
+    def index(self, model, pks):
+        queryset = search.INDEXES[model._meta.label].queryset()
+        for start in range(0, len(pks), self.batch_size):
+            chunk = pks[start:start + self.batch_size]
+            search.index_objects(queryset.filter(pk__in=chunk), replace=False)
+
+    def create_simple_artists(self, count, images):
+        rand = self.random
+        self.bulk_create(SimpleArtist, (
+            SimpleArtist(
+                name=self.person_name(),
+                bio='작가 소개 ' * rand.randint(5, 20),
+                artwork1=rand.choice(images),
+                artwork2=rand.choice(images),
+                artwork3=rand.choice(images),
+                display_order=i,
+            )
+            for i in range(count)
+        ))
+
+    def create_current_exhibition(self, images):
+        today = date.today()
+        pks = self.bulk_create(CurrentExhibition, [CurrentExhibition(
+            title=f'{self.random.choice(EXHIBITION_WORDS)} {self.random.choice(EXHIBITION_NOUNS)}',
+            artist_name=self.person_name(),
+            start_date=today,
+            end_date=today + timedelta(days=30),
+            description='현재 전시 설명',
+            image1=self.random.choice(images),
+            image2=self.random.choice(images),
+        )])
+        # 현재전시 페이지는 포인터가 가리키는 전시를 보여준다
+        current.activate(CurrentExhibition.objects.get(pk=pks[0]))
@@ -0,0 +1,40 @@
+# Generated by Django 5.0 on 2026-10-18 12:32
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gallery', '0003_simpleartist'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImageJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('model_label', models.CharField(max_length=100, verbose_name='모델')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='객체 ID')),
+                ('field_name', models.CharField(max_length=50, verbose_name='필드')),
+                ('source_name', models.CharField(max_length=255, verbose_name='원본 파일')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('running', '처리중'), ('done', '완료'), ('failed', '실패')], default='pending', max_length=10, verbose_name='상태')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='시도 횟수')),
+                ('max_attempts', models.PositiveSmallIntegerField(default=3, verbose_name='최대 시도 횟수')),
+                ('last_error', models.TextField(blank=True, verbose_name='마지막 오류')),
+                ('run_after', models.DateTimeField(default=django.utils.timezone.now, verbose_name='실행 예정')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='시작 시각')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='완료 시각')),
+            ],
+            options={
+                'verbose_name': '이미지 작업',
+                'verbose_name_plural': '이미지 작업 목록',
+                'ordering': ['run_after'],
+                'indexes': [models.Index(fields=['status', 'run_after'], name='gallery_imagejob_queue_idx')],
+                'constraints': [models.UniqueConstraint(fields=('model_label', 'object_id', 'field_name', 'source_name'), name='gallery_imagejob_unique_source')],
+            },
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.0 on 2026-10-18 13:05
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gallery', '0004_imagejob'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChunkedUpload',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('filename', models.CharField(max_length=255, verbose_name='파일명')),
+                ('content_type', models.CharField(blank=True, max_length=100, verbose_name='콘텐츠 타입')),
+                ('size', models.PositiveBigIntegerField(verbose_name='전체 크기')),
+                ('offset', models.PositiveBigIntegerField(default=0, verbose_name='받은 크기')),
+                ('status', models.CharField(choices=[('uploading', '업로드 중'), ('complete', '완료')], default='uploading', max_length=10, verbose_name='상태')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='chunked_uploads', to=settings.AUTH_USER_MODEL, verbose_name='업로더')),
+            ],
+            options={
+                'verbose_name': '분할 업로드',
+                'verbose_name_plural': '분할 업로드 목록',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.0 on 2026-10-18 14:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gallery', '0005_chunkedupload'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='artwork',
+            name='image_meta',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='이미지 정보'),
+        ),
+        migrations.AddField(
+            model_name='artworkimage',
+            name='image_meta',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='이미지 정보'),
+        ),
+        migrations.AddField(
+            model_name='currentexhibition',
+            name='image_meta',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='이미지 정보'),
+        ),
+        migrations.AddField(
+            model_name='simpleartist',
+            name='image_meta',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='이미지 정보'),
+        ),
+    ]
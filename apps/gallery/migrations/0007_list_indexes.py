@@ -0,0 +1,65 @@
+# Generated by Django 5.0 on 2026-10-18 16:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gallery', '0006_image_meta'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='artist',
+            index=models.Index(fields=['is_active', 'display_order', 'name'], name='gallery_artist_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artist',
+            index=models.Index(fields=['display_order', 'name'], name='gallery_artist_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artist',
+            index=models.Index(fields=['is_active', 'name'], name='gallery_artist_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artist',
+            index=models.Index(fields=['-created_at'], name='gallery_artist_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artwork',
+            index=models.Index(fields=['artist', 'is_published', 'display_order', '-created_at'], name='gallery_artwork_artist_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artwork',
+            index=models.Index(fields=['-created_at'], name='gallery_artwork_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artworkimage',
+            index=models.Index(fields=['artwork', 'order'], name='gallery_artworkimage_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='currentexhibition',
+            index=models.Index(fields=['is_active', '-created_at'], name='gallery_curexhib_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exhibition',
+            index=models.Index(fields=['is_published', 'is_current', '-start_date'], name='gallery_exhib_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exhibition',
+            index=models.Index(fields=['is_current', '-start_date'], name='gallery_exhib_current_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exhibition',
+            index=models.Index(fields=['-start_date'], name='gallery_exhib_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exhibition',
+            index=models.Index(fields=['-created_at'], name='gallery_exhib_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='simpleartist',
+            index=models.Index(fields=['is_active', 'display_order', 'name'], name='gallery_simple_active_idx'),
+        ),
+    ]
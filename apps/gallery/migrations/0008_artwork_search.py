@@ -0,0 +1,50 @@
+# Generated by Django 5.0 on 2026-10-18 17:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gallery', '0007_list_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model_label', models.CharField(max_length=100, verbose_name='모델')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='객체 ID')),
+                ('token', models.CharField(max_length=20, verbose_name='토큰')),
+            ],
+            options={
+                'verbose_name': '검색 토큰',
+                'verbose_name_plural': '검색 토큰 목록',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='artwork',
+            index=models.Index(fields=['artist', '-created_at'], name='gallery_artwork_artist_new_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artwork',
+            index=models.Index(fields=['artwork_type', '-created_at'], name='gallery_artwork_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artwork',
+            index=models.Index(fields=['is_sold', 'is_for_sale', '-created_at'], name='gallery_artwork_sale_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artwork',
+            index=models.Index(fields=['year'], name='gallery_artwork_year_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='searchtoken',
+            index=models.Index(fields=['model_label', 'object_id'], name='gallery_searchtoken_obj_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='searchtoken',
+            constraint=models.UniqueConstraint(fields=('model_label', 'token', 'object_id'), name='gallery_searchtoken_unique'),
+        ),
+    ]
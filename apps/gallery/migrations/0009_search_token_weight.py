@@ -0,0 +1,18 @@
+# Generated by Django 5.0 on 2026-10-18 18:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gallery', '0008_artwork_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='searchtoken',
+            name='weight',
+            field=models.PositiveSmallIntegerField(default=1, verbose_name='가중치'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.0 on 2026-10-18 15:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gallery', '0009_search_token_weight'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(unique=True, verbose_name='날짜')),
+                ('artists_added', models.PositiveIntegerField(default=0, verbose_name='등록 작가')),
+                ('exhibitions_added', models.PositiveIntegerField(default=0, verbose_name='등록 전시')),
+                ('artworks_added', models.PositiveIntegerField(default=0, verbose_name='등록 작품')),
+                ('sold_value', models.DecimalField(blank=True, decimal_places=0, max_digits=16, null=True, verbose_name='판매 완료 금액')),
+                ('for_sale_value', models.DecimalField(blank=True, decimal_places=0, max_digits=16, null=True, verbose_name='판매 중 금액')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+            ],
+            options={
+                'verbose_name': '일별 통계',
+                'verbose_name_plural': '일별 통계 목록',
+                'ordering': ['-date'],
+            },
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.0 on 2026-10-18 16:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def create_pointer(apps, schema_editor):
+    """가장 최근 활성 전시를 가리키는 포인터를 만들고 나머지 활성 플래그는 끈다"""
+    CurrentExhibition = apps.get_model('gallery', 'CurrentExhibition')
+    CurrentExhibitionPointer = apps.get_model('gallery', 'CurrentExhibitionPointer')
+    current = CurrentExhibition.objects.filter(is_active=True).order_by('-created_at').first()
+    CurrentExhibitionPointer.objects.update_or_create(pk=1, defaults={'exhibition': current})
+    if current is not None:
+        CurrentExhibition.objects.filter(is_active=True).exclude(pk=current.pk).update(is_active=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gallery', '0010_daily_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CurrentExhibitionPointer',
+            fields=[
+                ('id', models.PositiveSmallIntegerField(default=1, primary_key=True, serialize=False)),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('exhibition', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='gallery.currentexhibition', verbose_name='현재 전시')),
+            ],
+            options={
+                'verbose_name': '현재 전시 포인터',
+                'verbose_name_plural': '현재 전시 포인터',
+            },
+        ),
+        migrations.RunPython(create_pointer, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,139 @@
+# Generated by Django 5.0 on 2026-10-18 17:40
+
+from django.db import migrations, models
+from django.db.models import Q
+
+# 모델 → 이미지 필드 (크기는 <필드명>_width/<필드명>_height)
+IMAGE_FIELDS = {
+    'Artwork': ('main_image',),
+    'ArtworkImage': ('image',),
+    'CurrentExhibition': ('image1', 'image2', 'image3'),
+    'SimpleArtist': ('artwork1', 'artwork2', 'artwork3'),
+}
+
+
+def move_dimensions(apps, schema_editor, to_fields=True):
+    """image_meta의 width/height를 크기 필드로 옮긴다 (to_fields=False면 되돌림)"""
+    for model_name, names in IMAGE_FIELDS.items():
+        model = apps.get_model('gallery', model_name)
+        fields = ['image_meta', *(f'{name}_{axis}' for name in names for axis in ('width', 'height'))]
+        changed = []
+        queryset = model.objects.only(*fields)
+        if to_fields:
+            queryset = queryset.exclude(image_meta={})
+        else:
+            queryset = queryset.filter(Q(*(Q(**{f'{name}_width__isnull': False}) for name in names), _connector=Q.OR))
+        for obj in queryset.iterator(chunk_size=1000):
+            meta = {name: dict(value) for name, value in (obj.image_meta or {}).items()}
+            for name in names:
+                entry = meta.setdefault(name, {})
+                for axis in ('width', 'height'):
+                    if to_fields:
+                        setattr(obj, f'{name}_{axis}', entry.pop(axis, None))
+                    elif getattr(obj, f'{name}_{axis}'):
+                        entry[axis] = getattr(obj, f'{name}_{axis}')
+                if not entry:
+                    del meta[name]
+            if meta == obj.image_meta:
+                continue
+            obj.image_meta = meta
+            changed.append(obj)
+            if len(changed) >= 1000:
+                model.objects.bulk_update(changed, fields)
+                changed = []
+        model.objects.bulk_update(changed, fields)
+
+
+def move_dimensions_back(apps, schema_editor):
+    move_dimensions(apps, schema_editor, to_fields=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gallery', '0011_current_exhibition_pointer'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='artwork',
+            name='main_image_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='메인 이미지 높이'),
+        ),
+        migrations.AddField(
+            model_name='artwork',
+            name='main_image_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='메인 이미지 너비'),
+        ),
+        migrations.AddField(
+            model_name='artworkimage',
+            name='image_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='높이'),
+        ),
+        migrations.AddField(
+            model_name='artworkimage',
+            name='image_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='너비'),
+        ),
+        migrations.AddField(
+            model_name='currentexhibition',
+            name='image1_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='메인 이미지 높이'),
+        ),
+        migrations.AddField(
+            model_name='currentexhibition',
+            name='image1_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='메인 이미지 너비'),
+        ),
+        migrations.AddField(
+            model_name='currentexhibition',
+            name='image2_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='이미지 2 높이'),
+        ),
+        migrations.AddField(
+            model_name='currentexhibition',
+            name='image2_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='이미지 2 너비'),
+        ),
+        migrations.AddField(
+            model_name='currentexhibition',
+            name='image3_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='이미지 3 높이'),
+        ),
+        migrations.AddField(
+            model_name='currentexhibition',
+            name='image3_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='이미지 3 너비'),
+        ),
+        migrations.AddField(
+            model_name='simpleartist',
+            name='artwork1_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='작품 이미지 1 높이'),
+        ),
+        migrations.AddField(
+            model_name='simpleartist',
+            name='artwork1_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='작품 이미지 1 너비'),
+        ),
+        migrations.AddField(
+            model_name='simpleartist',
+            name='artwork2_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='작품 이미지 2 높이'),
+        ),
+        migrations.AddField(
+            model_name='simpleartist',
+            name='artwork2_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='작품 이미지 2 너비'),
+        ),
+        migrations.AddField(
+            model_name='simpleartist',
+            name='artwork3_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='작품 이미지 3 높이'),
+        ),
+        migrations.AddField(
+            model_name='simpleartist',
+            name='artwork3_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='작품 이미지 3 너비'),
+        ),
+        migrations.RunPython(move_dimensions, move_dimensions_back),
+    ]
@@ -1,11 +1,148 @@
-from django.db import models
-from apps.core.models import TimeStampedModel
-from .utils import ImageOptimizer
+from django.core.files.uploadedfile import UploadedFile
+from django.db import models, transaction
+from django.utils import timezone
+from apps.core.models import TimeStampedModel, UUIDModel
+import fcntl
 import os
-from datetime import date
+from datetime import date, timedelta
 
-class Artist(TimeStampedModel):
+
+class ImageRenditionMixin(models.Model):
+    """이미지 필드가 바뀌면 렌디션 생성 작업을 큐에 등록
+
+    로드 시점(from_db)의 파일명을 기억해 두고 save()에서 비교하므로
+    변경 여부를 판단하기 위해 DB를 다시 조회하지 않는다.
+
+    image_meta 필드가 있는 모델은 이미지 필드마다 <필드명>_width/<필드명>_height
+    크기 필드를 두고, 대표 색/blurhash는 image_meta({필드명: {'color', 'blurhash'}})에
+    저장한다. 크기는 업로드 시 헤더에서 읽고, 색 정보는 워커가 채운다.
+    """
+
+    # 렌디션을 생성할 이미지 필드 이름
+    rendition_fields = ()
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        loaded = dict(zip(field_names, values))
+        instance._loaded_images = {
+            name: loaded[name] or '' for name in cls.rendition_fields if name in loaded
+        }
+        return instance
+
+    def changed_image_fields(self, update_fields=None):
+        """로드 이후 바뀐 이미지 필드 목록 (지연 로딩된 필드는 조회하지 않고 건너뜀)"""
+        deferred = self.get_deferred_fields()
+        loaded = getattr(self, '_loaded_images', {})
+        changed = []
+        for name in self.rendition_fields:
+            if name in deferred or (update_fields is not None and name not in update_fields):
+                continue
+            field_file = getattr(self, name)
+            if not field_file:
+                continue
+            # 아직 스토리지에 저장되지 않은 파일 = 이번 요청에서 업로드된 파일
+            if not field_file._committed or loaded.get(name) != field_file.name:
+                changed.append(name)
+        return changed
+
+    @staticmethod
+    def dimension_fields(name):
+        """이미지 필드의 (너비, 높이) 필드 이름"""
+        return f'{name}_width', f'{name}_height'
+
+    def _update_image_dimensions(self, changed, update_fields=None):
+        """바뀐 이미지의 크기를 헤더만 읽어 크기 필드에 기록 (디코드하지 않음)
+
+        이전 이미지의 색 정보는 image_meta에서 지운다 (새 이미지의 작업이 다시 채운다).
+        반환값: 값을 바꾼 필드 이름 목록
+        """
+        deferred = self.get_deferred_fields()
+        meta = None if 'image_meta' in deferred else dict(self.image_meta or {})
+        updated = []
+        for name in self.rendition_fields:
+            if update_fields is not None and name not in update_fields:
+                continue
+            if name in changed:
+                field_file = getattr(self, name)
+                try:
+                    size = (field_file.width, field_file.height)
+                except (OSError, ValueError):
+                    size = (None, None)
+            elif name not in deferred and not getattr(self, name):
+                size = (None, None)
+            else:
+                continue
+            for field, value in zip(self.dimension_fields(name), size):
+                setattr(self, field, value)
+                updated.append(field)
+            if meta is not None and meta.pop(name, None) is not None:
+                self.image_meta = meta
+                updated.append('image_meta')
+        return updated
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        changed = self.changed_image_fields(update_fields)
+        if hasattr(self, 'image_meta'):
+            updated = self._update_image_dimensions(changed, update_fields)
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, *updated}
+        super().save(*args, **kwargs)
+        if changed:
+            ImageJob.enqueue(self, changed)
+
+        deferred = self.get_deferred_fields()
+        self._loaded_images = {
+            name: getattr(self, name).name or ''
+            for name in self.rendition_fields if name not in deferred
+        }
+
+    def renditions_ready(self, field_name, renditions):
+        """렌디션 생성 후 워커가 호출 (필요한 모델에서 재정의)
+
+        renditions: {렌디션 이름: 저장된 파일명}
+        """
+
+    def image_metadata(self, field_name):
+        """템플릿용 이미지 정보 ({'width', 'height', 'color', 'blurhash'} 중 있는 값)"""
+        if not hasattr(self, 'image_meta'):
+            return {}
+        metadata = dict((self.image_meta or {}).get(field_name, {}))
+        width_field, height_field = self.dimension_fields(field_name)
+        if getattr(self, width_field) and getattr(self, height_field):
+            metadata.update(width=getattr(self, width_field), height=getattr(self, height_field))
+        return metadata
+
+    def store_image_metadata(self, field_name, metadata):
+        """워커가 계산한 이미지 정보 저장 - 크기는 크기 필드에, 나머지는 image_meta에 병합
+
+        한 객체의 여러 이미지 작업이 동시에 끝날 수 있으므로
+        행을 잠그고 다시 읽은 값에 병합한다. save()를 거치지 않는다.
+        """
+        if not hasattr(self, 'image_meta'):
+            return
+        metadata = dict(metadata)
+        dimensions = dict(zip(self.dimension_fields(field_name), (metadata.pop('width', None), metadata.pop('height', None))))
+        dimensions = {field: value for field, value in dimensions.items() if value}
+        model = type(self)
+        with transaction.atomic():
+            current = model.objects.select_for_update().only('image_meta').get(pk=self.pk)
+            meta = dict(current.image_meta or {})
+            meta[field_name] = {**meta.get(field_name, {}), **metadata}
+            model.objects.filter(pk=self.pk).update(image_meta=meta, **dimensions)
+        self.image_meta = meta
+        for field, value in dimensions.items():
+            setattr(self, field, value)
+
+
+class Artist(ImageRenditionMixin, TimeStampedModel):
     """작가 모델"""
+    rendition_fields = ('profile_image',)
+
     name = models.CharField(max_length=100, verbose_name='작가명')
     name_en = models.CharField(max_length=100, blank=True, verbose_name='영문명')
     birth_year = models.IntegerField(null=True, blank=True, verbose_name='출생년도')
@@ -30,36 +167,23 @@ class Artist(TimeStampedModel):
         verbose_name = '작가'
         verbose_name_plural = '작가 목록'
         ordering = ['display_order', 'name']
+        indexes = [
+            # 공개 목록 (is_active + 표시 순서), 관리 목록 (전체 표시 순서)
+            models.Index(fields=['is_active', 'display_order', 'name'], name='gallery_artist_active_idx'),
+            models.Index(fields=['display_order', 'name'], name='gallery_artist_order_idx'),
+            # 작품 관리 필터용 작가 목록
+            models.Index(fields=['is_active', 'name'], name='gallery_artist_name_idx'),
+            # 대시보드 최근 등록
+            models.Index(fields=['-created_at'], name='gallery_artist_created_idx'),
+        ]
     
     def __str__(self):
         return self.name
-    
-    def save(self, *args, **kwargs):
-        # 프로필 이미지 최적화 - 삭제 작업 시에는 이미지 처리 건너뛰기
-        if self.profile_image and not kwargs.get('force_insert', False):
-            try:
-                # 이미지가 변경되었는지 확인
-                if self.pk:
-                    try:
-                        old_instance = Artist.objects.get(pk=self.pk)
-                        if old_instance.profile_image != self.profile_image and hasattr(self.profile_image, 'file'):
-                            # 이미지 최적화 (최대 800x800)
-                            self.profile_image = ImageOptimizer.create_medium(self.profile_image)
-                    except Artist.DoesNotExist:
-                        pass
-                elif hasattr(self.profile_image, 'file'):
-                    # 새 객체인 경우
-                    self.profile_image = ImageOptimizer.create_medium(self.profile_image)
-            except Exception as e:
-                # 이미지 처리 실패 시 원본 유지
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.warning(f"이미지 최적화 실패: {e}")
-        
-        super().save(*args, **kwargs)
 
-class Exhibition(TimeStampedModel):
+class Exhibition(ImageRenditionMixin, TimeStampedModel):
     """전시 모델"""
+    rendition_fields = ('poster_image',)
+
     EXHIBITION_TYPES = [
         ('solo', '개인전'),
         ('group', '단체전'),
@@ -99,6 +223,14 @@ class Exhibition(TimeStampedModel):
         verbose_name = '전시'
         verbose_name_plural = '전시 목록'
         ordering = ['-start_date']
+        indexes = [
+            # 공개 목록 (게시 + 현재/지난 전시 + 최신순)
+            models.Index(fields=['is_published', 'is_current', '-start_date'], name='gallery_exhib_published_idx'),
+            # 대시보드 현재 전시, 관리 목록 최신순
+            models.Index(fields=['is_current', '-start_date'], name='gallery_exhib_current_idx'),
+            models.Index(fields=['-start_date'], name='gallery_exhib_start_idx'),
+            models.Index(fields=['-created_at'], name='gallery_exhib_created_idx'),
+        ]
     
     def __str__(self):
         return self.title
@@ -119,8 +251,10 @@ class Exhibition(TimeStampedModel):
         """관련 전시 가져오기"""
         return Exhibition.objects.exclude(id=self.id).filter(is_published=True)[:3]
 
-class Artwork(TimeStampedModel):
+class Artwork(ImageRenditionMixin, TimeStampedModel):
     """작품 모델"""
+    rendition_fields = ('main_image',)
+
     ARTWORK_TYPES = [
         ('painting', '회화'),
         ('sculpture', '조각'),
@@ -147,7 +281,10 @@ class Artwork(TimeStampedModel):
     
     # 이미지
     main_image = models.ImageField(upload_to='artworks/', verbose_name='메인 이미지')
+    main_image_width = models.PositiveIntegerField(null=True, blank=True, editable=False, verbose_name='메인 이미지 너비')
+    main_image_height = models.PositiveIntegerField(null=True, blank=True, editable=False, verbose_name='메인 이미지 높이')
     thumbnail = models.ImageField(upload_to='artworks/thumbs/', blank=True, null=True, verbose_name='썸네일')
+    image_meta = models.JSONField(default=dict, blank=True, editable=False, verbose_name='이미지 정보')
     
     # 가격 정보
     price = models.DecimalField(max_digits=12, decimal_places=0, null=True, blank=True, verbose_name='가격')
@@ -166,14 +303,35 @@ class Artwork(TimeStampedModel):
         verbose_name = '작품'
         verbose_name_plural = '작품 목록'
         ordering = ['display_order', '-created_at']
+        indexes = [
+            # 작가 상세/작가 목록 대표 작품 (작가별 게시 작품을 표시 순서로)
+            models.Index(fields=['artist', 'is_published', 'display_order', '-created_at'], name='gallery_artwork_artist_idx'),
+            # 작품 관리 목록 최신순
+            models.Index(fields=['-created_at'], name='gallery_artwork_created_idx'),
+            # 작품 관리 목록 필터 (작가/유형/판매 상태/제작년도) + 최신순
+            models.Index(fields=['artist', '-created_at'], name='gallery_artwork_artist_new_idx'),
+            models.Index(fields=['artwork_type', '-created_at'], name='gallery_artwork_type_idx'),
+            models.Index(fields=['is_sold', 'is_for_sale', '-created_at'], name='gallery_artwork_sale_idx'),
+            models.Index(fields=['year'], name='gallery_artwork_year_idx'),
+        ]
     
     def __str__(self):
         return f'{self.artist.name} - {self.title}'
 
-class ArtworkImage(TimeStampedModel):
+    def renditions_ready(self, field_name, renditions):
+        # 메인 이미지 썸네일을 thumbnail 필드에 연결 (save()를 거치지 않아 재등록되지 않음)
+        if field_name == 'main_image' and 'thumbnail' in renditions:
+            Artwork.objects.filter(pk=self.pk).update(thumbnail=renditions['thumbnail'])
+
+class ArtworkImage(ImageRenditionMixin, TimeStampedModel):
     """작품 추가 이미지"""
+    rendition_fields = ('image',)
+
     artwork = models.ForeignKey(Artwork, on_delete=models.CASCADE, related_name='additional_images', verbose_name='작품')
     image = models.ImageField(upload_to='artworks/additional/', verbose_name='이미지')
+    image_width = models.PositiveIntegerField(null=True, blank=True, editable=False, verbose_name='너비')
+    image_height = models.PositiveIntegerField(null=True, blank=True, editable=False, verbose_name='높이')
+    image_meta = models.JSONField(default=dict, blank=True, editable=False, verbose_name='이미지 정보')
     caption = models.CharField(max_length=200, blank=True, verbose_name='캡션')
     order = models.IntegerField(default=0, verbose_name='순서')
     
@@ -181,13 +339,17 @@ class ArtworkImage(TimeStampedModel):
         verbose_name = '작품 이미지'
         verbose_name_plural = '작품 이미지 목록'
         ordering = ['artwork', 'order']
+        indexes = [
+            models.Index(fields=['artwork', 'order'], name='gallery_artworkimage_order_idx'),
+        ]
     
     def __str__(self):
         return f'{self.artwork.title} - Image {self.order}'
 
 
-class CurrentExhibition(TimeStampedModel):
+class CurrentExhibition(ImageRenditionMixin, TimeStampedModel):
     """현재 전시 정보 모델"""
+    rendition_fields = ('image1', 'image2', 'image3')
     
     # 기본 정보
     title = models.CharField('전시명', max_length=200)
@@ -206,6 +368,13 @@ class CurrentExhibition(TimeStampedModel):
     image1 = models.ImageField('메인 이미지', upload_to='exhibitions/current/')
     image2 = models.ImageField('이미지 2', upload_to='exhibitions/current/', blank=True, null=True)
     image3 = models.ImageField('이미지 3', upload_to='exhibitions/current/', blank=True, null=True)
+    image1_width = models.PositiveIntegerField('메인 이미지 너비', null=True, blank=True, editable=False)
+    image1_height = models.PositiveIntegerField('메인 이미지 높이', null=True, blank=True, editable=False)
+    image2_width = models.PositiveIntegerField('이미지 2 너비', null=True, blank=True, editable=False)
+    image2_height = models.PositiveIntegerField('이미지 2 높이', null=True, blank=True, editable=False)
+    image3_width = models.PositiveIntegerField('이미지 3 너비', null=True, blank=True, editable=False)
+    image3_height = models.PositiveIntegerField('이미지 3 높이', null=True, blank=True, editable=False)
+    image_meta = models.JSONField('이미지 정보', default=dict, blank=True, editable=False)
     
     # 상태 관리
     is_active = models.BooleanField('활성화', default=True)
@@ -214,6 +383,9 @@ class CurrentExhibition(TimeStampedModel):
         verbose_name = '현재 전시'
         verbose_name_plural = '현재 전시'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['is_active', '-created_at'], name='gallery_curexhib_active_idx'),
+        ]
     
     def __str__(self):
         return f"{self.title} - {self.artist_name}"
@@ -224,8 +396,34 @@ class CurrentExhibition(TimeStampedModel):
         return f"{self.start_date.strftime('%Y.%m.%d')} – {self.end_date.strftime('%m.%d')}"
 
 
-class SimpleArtist(TimeStampedModel):
+class CurrentExhibitionPointer(models.Model):
+    """현재전시 페이지에 표시할 CurrentExhibition을 가리키는 한 행짜리 포인터
+
+    is_active 플래그를 모두 끄고 하나를 켜는 방식은 동시에 바꾸면 활성 전시가
+    0개나 2개가 될 수 있어, 이 행(pk=1)을 잠근 트랜잭션 안에서만 바꾼다.
+    MySQL은 조건부 UNIQUE 제약을 지원하지 않으므로 포인터 행으로 하나만 보장한다.
+    변경은 apps/gallery/current.py를 통해서 한다.
+    """
+    SINGLETON_PK = 1
+
+    id = models.PositiveSmallIntegerField(primary_key=True, default=SINGLETON_PK)
+    exhibition = models.OneToOneField(
+        CurrentExhibition, on_delete=models.SET_NULL, null=True, blank=True,
+        related_name='+', verbose_name='현재 전시',
+    )
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
+
+    class Meta:
+        verbose_name = '현재 전시 포인터'
+        verbose_name_plural = '현재 전시 포인터'
+
+    def __str__(self):
+        return str(self.exhibition or '-')
+
+
+class SimpleArtist(ImageRenditionMixin, TimeStampedModel):
     """전속작가 페이지용 간단한 작가 모델"""
+    rendition_fields = ('artwork1', 'artwork2', 'artwork3')
     
     # 기본 정보
     name = models.CharField('작가명', max_length=100)
@@ -235,6 +433,13 @@ class SimpleArtist(TimeStampedModel):
     artwork1 = models.ImageField('작품 이미지 1', upload_to='artists/simple/')
     artwork2 = models.ImageField('작품 이미지 2', upload_to='artists/simple/', blank=True, null=True)
     artwork3 = models.ImageField('작품 이미지 3', upload_to='artists/simple/', blank=True, null=True)
+    artwork1_width = models.PositiveIntegerField('작품 이미지 1 너비', null=True, blank=True, editable=False)
+    artwork1_height = models.PositiveIntegerField('작품 이미지 1 높이', null=True, blank=True, editable=False)
+    artwork2_width = models.PositiveIntegerField('작품 이미지 2 너비', null=True, blank=True, editable=False)
+    artwork2_height = models.PositiveIntegerField('작품 이미지 2 높이', null=True, blank=True, editable=False)
+    artwork3_width = models.PositiveIntegerField('작품 이미지 3 너비', null=True, blank=True, editable=False)
+    artwork3_height = models.PositiveIntegerField('작품 이미지 3 높이', null=True, blank=True, editable=False)
+    image_meta = models.JSONField('이미지 정보', default=dict, blank=True, editable=False)
     
     # 순서 및 상태
     display_order = models.IntegerField('표시 순서', default=0, help_text='낮은 숫자가 먼저 표시됩니다')
@@ -244,6 +449,294 @@ class SimpleArtist(TimeStampedModel):
         verbose_name = '전속작가 (간단)'
         verbose_name_plural = '전속작가 목록 (간단)'
         ordering = ['display_order', 'name']
+        indexes = [
+            models.Index(fields=['is_active', 'display_order', 'name'], name='gallery_simple_active_idx'),
+        ]
     
     def __str__(self):
-        return self.name
\ No newline at end of file
+        return self.name
+
+
+class ImageJob(TimeStampedModel):
+    """이미지 렌디션 생성 작업 큐
+
+    (모델, 객체, 필드, 원본 파일명)이 같은 작업은 한 번만 등록된다.
+    `manage.py process_image_jobs` 워커가 처리한다.
+    """
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, '대기'),
+        (STATUS_RUNNING, '처리중'),
+        (STATUS_DONE, '완료'),
+        (STATUS_FAILED, '실패'),
+    ]
+
+    model_label = models.CharField(max_length=100, verbose_name='모델')
+    object_id = models.PositiveBigIntegerField(verbose_name='객체 ID')
+    field_name = models.CharField(max_length=50, verbose_name='필드')
+    source_name = models.CharField(max_length=255, verbose_name='원본 파일')
+
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING, verbose_name='상태')
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name='시도 횟수')
+    max_attempts = models.PositiveSmallIntegerField(default=3, verbose_name='최대 시도 횟수')
+    last_error = models.TextField(blank=True, verbose_name='마지막 오류')
+    run_after = models.DateTimeField(default=timezone.now, verbose_name='실행 예정')
+    started_at = models.DateTimeField(null=True, blank=True, verbose_name='시작 시각')
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name='완료 시각')
+
+    class Meta:
+        verbose_name = '이미지 작업'
+        verbose_name_plural = '이미지 작업 목록'
+        ordering = ['run_after']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['model_label', 'object_id', 'field_name', 'source_name'],
+                name='gallery_imagejob_unique_source',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['status', 'run_after'], name='gallery_imagejob_queue_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.model_label}#{self.object_id}.{self.field_name} ({self.get_status_display()})'
+
+    @classmethod
+    def enqueue(cls, instance, field_names):
+        """이미지 필드별 작업 등록 (이미 있는 작업은 그대로 둔다)"""
+        jobs = []
+        for field_name in field_names:
+            field_file = getattr(instance, field_name)
+            if not field_file:
+                continue
+            job, _ = cls.objects.get_or_create(
+                model_label=instance._meta.label_lower,
+                object_id=instance.pk,
+                field_name=field_name,
+                source_name=field_file.name,
+            )
+            jobs.append(job)
+        return jobs
+
+    @classmethod
+    def claim(cls, limit):
+        """실행할 작업을 잠그고 처리중으로 표시한 뒤 ID 목록 반환"""
+        from django.db import transaction
+        from django.db.models import F
+
+        now = timezone.now()
+        with transaction.atomic():
+            ids = list(
+                cls.objects.select_for_update(skip_locked=True)
+                .filter(status=cls.STATUS_PENDING, run_after__lte=now)
+                .order_by('run_after')
+                .values_list('pk', flat=True)[:limit]
+            )
+            cls.objects.filter(pk__in=ids).update(
+                status=cls.STATUS_RUNNING, started_at=now, attempts=F('attempts') + 1,
+            )
+        return ids
+
+    @classmethod
+    def requeue_stale(cls, timeout):
+        """워커가 죽어 처리중으로 남은 작업을 다시 대기 상태로"""
+        return cls.objects.filter(
+            status=cls.STATUS_RUNNING, started_at__lt=timezone.now() - timeout,
+        ).update(status=cls.STATUS_PENDING)
+
+    def mark_done(self):
+        self.status = self.STATUS_DONE
+        self.last_error = ''
+        self.finished_at = timezone.now()
+        self.save(update_fields=['status', 'last_error', 'finished_at', 'updated_at'])
+
+    def mark_failed(self, error):
+        """실패 기록 - 남은 시도가 있으면 지수 백오프 후 재시도"""
+        self.last_error = str(error)
+        if self.attempts >= self.max_attempts:
+            self.status = self.STATUS_FAILED
+            self.finished_at = timezone.now()
+        else:
+            self.status = self.STATUS_PENDING
+            self.run_after = timezone.now() + timedelta(seconds=30 * 2 ** self.attempts)
+        self.save(update_fields=['status', 'last_error', 'finished_at', 'run_after', 'updated_at'])
+
+
+class AssembledUploadedFile(UploadedFile):
+    """분할 업로드로 조립된 파일
+
+    temporary_file_path()가 있으므로 FileSystemStorage는 복사 대신 이동한다.
+    """
+
+    def __init__(self, path, name, content_type, size):
+        super().__init__(open(path, 'rb'), name, content_type, size)
+        self._path = path
+
+    def temporary_file_path(self):
+        return self._path
+
+    def close(self):
+        try:
+            return self.file.close()
+        except FileNotFoundError:
+            pass
+
+
+class UploadConflict(Exception):
+    """분할 업로드의 offset이 요청 처리 중에 바뀜 (클라이언트는 현재 offset부터 재전송)"""
+
+
+class ChunkedUpload(UUIDModel):
+    """재개 가능한 분할 업로드 (tus 방식)
+
+    조각은 FILE_UPLOAD_TEMP_DIR 아래 임시 파일에 순서대로 이어 쓰고,
+    완료되면 관리 폼(ArtworkForm/ArtistForm)에 업로드 파일로 전달된다.
+    """
+    STATUS_UPLOADING = 'uploading'
+    STATUS_COMPLETE = 'complete'
+    STATUS_CHOICES = [
+        (STATUS_UPLOADING, '업로드 중'),
+        (STATUS_COMPLETE, '완료'),
+    ]
+
+    user = models.ForeignKey('auth.User', on_delete=models.CASCADE, related_name='chunked_uploads', verbose_name='업로더')
+    filename = models.CharField(max_length=255, verbose_name='파일명')
+    content_type = models.CharField(max_length=100, blank=True, verbose_name='콘텐츠 타입')
+    size = models.PositiveBigIntegerField(verbose_name='전체 크기')
+    offset = models.PositiveBigIntegerField(default=0, verbose_name='받은 크기')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_UPLOADING, verbose_name='상태')
+
+    class Meta:
+        verbose_name = '분할 업로드'
+        verbose_name_plural = '분할 업로드 목록'
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f'{self.filename} ({self.offset}/{self.size})'
+
+    @property
+    def part_path(self):
+        from django.conf import settings
+        return os.path.join(settings.FILE_UPLOAD_TEMP_DIR, 'chunked_uploads', f'{self.pk}.part')
+
+    @classmethod
+    def purge_expired(cls, age):
+        """오래된 미완료/미사용 업로드와 임시 파일 삭제"""
+        expired = cls.objects.filter(updated_at__lt=timezone.now() - age)
+        for upload in expired:
+            upload.discard()
+
+    def append(self, stream, chunk_size=64 * 1024):
+        """요청 본문을 현재 offset 뒤에 이어 쓰기
+
+        본문을 받는 동안 DB 행은 잠그지 않는다. 같은 업로드에 동시에 온 요청은
+        임시 파일 잠금으로 하나만 쓰고, 쓰기 전후로 DB의 offset이 그대로인지 다시
+        확인한다 (달라졌으면 UploadConflict, 전체 크기를 넘으면 ValueError).
+        """
+        start = self.offset
+        uploading = type(self).objects.filter(pk=self.pk, status=self.STATUS_UPLOADING)
+        os.makedirs(os.path.dirname(self.part_path), exist_ok=True)
+        with open(self.part_path, 'ab') as part:
+            # 파일 잠금은 DB 저장(커밋)까지 유지 - 다음 요청은 바뀐 offset을 보게 된다
+            try:
+                fcntl.flock(part, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                raise UploadConflict('다른 요청이 조각을 전송하는 중입니다.')
+            if not uploading.filter(offset=start).exists():
+                raise UploadConflict('업로드 위치가 바뀌었습니다.')
+            # 이전 요청이 중간에 끊겨 기록되지 않은 꼬리는 잘라낸다
+            part.truncate(start)
+            part.seek(start)
+            while True:
+                chunk = stream.read(chunk_size)
+                if not chunk:
+                    break
+                if part.tell() + len(chunk) > self.size:
+                    raise ValueError('파일 크기를 초과했습니다.')
+                part.write(chunk)
+            part.flush()
+            end = part.tell()
+
+            with transaction.atomic():
+                if not uploading.select_for_update().filter(offset=start).exists():
+                    raise UploadConflict('업로드 위치가 바뀌었습니다.')
+                self.offset = end
+                self.save(update_fields=['offset', 'updated_at'])
+
+    def complete(self):
+        """모든 조각을 받았는지 확인하고 이미지인지 검증"""
+        from PIL import Image
+
+        if self.offset != self.size:
+            raise ValueError('아직 모든 조각을 받지 못했습니다.')
+        with Image.open(self.part_path) as img:
+            img.verify()
+        self.status = self.STATUS_COMPLETE
+        self.save(update_fields=['status', 'updated_at'])
+
+    def as_uploaded_file(self):
+        """폼에 넘길 업로드 파일"""
+        return AssembledUploadedFile(self.part_path, self.filename, self.content_type or None, self.size)
+
+    def discard(self):
+        """임시 파일과 함께 삭제"""
+        try:
+            os.remove(self.part_path)
+        except FileNotFoundError:
+            pass
+        self.delete()
+
+
+class SearchToken(models.Model):
+    """검색용 역색인 (작가/전시/작품)
+
+    (모델, 객체)마다 검색 대상 텍스트의 토큰(음절 n-gram, 자모 3-gram, 영문 접두어)을
+    한 행씩 저장한다. apps/gallery/search.py가 저장/삭제 신호로 갱신하고, 전체
+    재생성은 `manage.py rebuild_search_index`로 한다.
+    """
+    model_label = models.CharField(max_length=100, verbose_name='모델')
+    object_id = models.PositiveBigIntegerField(verbose_name='객체 ID')
+    token = models.CharField(max_length=20, verbose_name='토큰')
+    weight = models.PositiveSmallIntegerField(default=1, verbose_name='가중치')
+
+    class Meta:
+        verbose_name = '검색 토큰'
+        verbose_name_plural = '검색 토큰 목록'
+        constraints = [
+            # 토큰 → 객체 조회를 인덱스만으로 처리
+            models.UniqueConstraint(fields=['model_label', 'token', 'object_id'], name='gallery_searchtoken_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['model_label', 'object_id'], name='gallery_searchtoken_obj_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.model_label}#{self.object_id} {self.token}'
+
+
+class DailyStats(models.Model):
+    """관리자 대시보드 추이용 일별 집계
+
+    날짜별 등록 수와 그날의 판매 완료/판매 중 작품 금액을 한 행에 저장한다.
+    등록 수는 created_at으로 지난 날짜도 다시 계산할 수 있지만 금액은 그 시점의
+    스냅숏이므로, 대시보드 통계를 새로 계산할 때마다 오늘 행을 갱신한다.
+    apps/gallery/stats.py 참고, 지난 등록 수 채우기는 `manage.py rollup_daily_stats`.
+    """
+    date = models.DateField(unique=True, verbose_name='날짜')
+    artists_added = models.PositiveIntegerField(default=0, verbose_name='등록 작가')
+    exhibitions_added = models.PositiveIntegerField(default=0, verbose_name='등록 전시')
+    artworks_added = models.PositiveIntegerField(default=0, verbose_name='등록 작품')
+    sold_value = models.DecimalField(max_digits=16, decimal_places=0, null=True, blank=True, verbose_name='판매 완료 금액')
+    for_sale_value = models.DecimalField(max_digits=16, decimal_places=0, null=True, blank=True, verbose_name='판매 중 금액')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
+
+    class Meta:
+        verbose_name = '일별 통계'
+        verbose_name_plural = '일별 통계 목록'
+        ordering = ['-date']
+
+    def __str__(self):
+        return f'{self.date} 작품 +{self.artworks_added}'
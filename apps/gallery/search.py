@@ -0,0 +1,270 @@
+import math
+import re
+import unicodedata
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from .models import Artist, Artwork, Exhibition, SearchToken
+
+WORD_RE = re.compile(r'\w+')
+MAX_TOKEN_LENGTH = 20
+
+# 토큰 종류 접두어 (음절 n-gram은 접두어 없음)
+JAMO_PREFIX = '~'
+LATIN_PREFIX = '@'
+
+# 한글 음절 → 자모 분해 (호환 자모로 표기)
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+INITIALS = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+MEDIALS = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+FINALS = ('', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ',
+          'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ')
+
+# 오타 허용 검색에서 일치해야 하는 자모 토큰 비율
+FUZZY_MIN_RATIO = 0.5
+
+
+def normalize(text):
+    """NFKC 정규화 + 소문자 (호환 자모/전각 문자를 같은 글자로)"""
+    return unicodedata.normalize('NFKC', text or '').lower()
+
+
+def words(text):
+    return WORD_RE.findall(normalize(text))
+
+
+def bigrams(word):
+    return {word[i:i + 2] for i in range(len(word) - 1)}
+
+
+def word_ngrams(word):
+    """단어의 음절 2-gram + 1-gram
+
+    한글은 띄어쓰기가 불규칙하고 조사가 붙으므로 형태소 대신 음절 2-gram으로
+    부분 일치를 찾는다. 1-gram은 한 글자 검색어('꽃')를 정확히 일치 조회로
+    찾기 위한 것이다 (LIKE '꽃%'는 DB에 따라 인덱스를 못 쓴다).
+    """
+    return bigrams(word) | set(word)
+
+
+def is_hangul(char):
+    return HANGUL_BASE <= ord(char) <= HANGUL_LAST
+
+
+def jamo(word):
+    """한글 음절을 초성/중성/종성 자모로 풀어 쓴 문자열 ('바다' → 'ㅂㅏㄷㅏ')"""
+    letters = []
+    for char in word:
+        if is_hangul(char):
+            code = ord(char) - HANGUL_BASE
+            letters.append(INITIALS[code // 588] + MEDIALS[code % 588 // 28] + FINALS[code % 28])
+        else:
+            letters.append(char)
+    return ''.join(letters)
+
+
+def jamo_trigrams(word):
+    """자모 3-gram - 음절 하나가 틀려도 (바다/바댜) 나머지 자모 토큰이 일치한다"""
+    if not any(is_hangul(char) for char in word):
+        return set()
+    letters = jamo(word)
+    if len(letters) < 3:
+        return {JAMO_PREFIX + letters}
+    return {JAMO_PREFIX + letters[i:i + 3] for i in range(len(letters) - 2)}
+
+
+def latin_word(word):
+    return word.isascii() and word.isalpha()
+
+
+def latin_prefixes(word):
+    """영문 단어의 접두어 토큰 ('monet' → @mo, @mon, @mone, @monet)"""
+    if not latin_word(word):
+        return set()
+    word = word[:MAX_TOKEN_LENGTH - len(LATIN_PREFIX)]
+    return {LATIN_PREFIX + word[:i] for i in range(min(2, len(word)), len(word) + 1)}
+
+
+def word_tokens(word):
+    return word_ngrams(word) | jamo_trigrams(word) | latin_prefixes(word)
+
+
+def query_tokens(query):
+    """검색어 → (모두 일치해야 하는 토큰, 오타 허용용 자모 토큰)
+
+    영문 단어는 접두어 토큰 하나로('mon' → monet), 그 외는 음절 2-gram으로 찾는다.
+    """
+    exact, fuzzy = set(), set()
+    for word in words(query):
+        if latin_word(word):
+            exact.add(LATIN_PREFIX + word[:MAX_TOKEN_LENGTH - len(LATIN_PREFIX)])
+        else:
+            exact |= bigrams(word) or {word}
+        fuzzy |= jamo_trigrams(word)
+    return exact, fuzzy
+
+
+class SearchIndex:
+    """모델 하나의 색인 설정
+
+    fields: (필드 경로, 가중치) 목록 - 같은 토큰이 여러 필드에 있으면 큰 가중치를 쓴다.
+    public: 공개 검색 결과에 포함할 조건
+    """
+
+    def __init__(self, model, fields, public, select_related=()):
+        self.model = model
+        self.label = model._meta.label
+        self.fields = fields
+        self.public = public
+        self.select_related = select_related
+
+    def queryset(self):
+        """색인에 필요한 필드만 읽는 쿼리셋"""
+        return (
+            self.model.objects.select_related(*self.select_related)
+            .only(*(path for path, _ in self.fields))
+        )
+
+    def public_queryset(self):
+        return self.model.objects.filter(**self.public).select_related(*self.select_related)
+
+    def value(self, obj, path):
+        for name in path.split('__'):
+            obj = getattr(obj, name, None)
+        return obj or ''
+
+    def document(self, obj):
+        """{토큰: 가중치}"""
+        tokens = {}
+        for path, weight in self.fields:
+            for word in words(self.value(obj, path)):
+                for token in word_tokens(word):
+                    if tokens.get(token, 0) < weight:
+                        tokens[token] = weight
+        return tokens
+
+
+INDEXES = {
+    index.label: index for index in (
+        SearchIndex(Artist, [('name', 3), ('name_en', 2)], {'is_active': True}),
+        SearchIndex(Exhibition, [('title', 3), ('title_en', 2)], {'is_published': True}),
+        SearchIndex(
+            Artwork, [('title', 3), ('title_en', 2), ('artist__name', 1)], {'is_published': True},
+            select_related=('artist',),
+        ),
+    )
+}
+ARTIST_LABEL = Artist._meta.label
+EXHIBITION_LABEL = Exhibition._meta.label
+ARTWORK_LABEL = Artwork._meta.label
+
+# 작품 관리 목록 검색 대상 필드
+ARTWORK_FIELDS = ('title', 'title_en', 'artist__name')
+
+
+def index_objects(objects, batch_size=1000, replace=True):
+    """객체들의 토큰을 다시 만든다 - INDEXES의 queryset()으로 읽은 목록 권장
+
+    replace=False면 기존 토큰을 지우지 않는다 (전체 재생성처럼 이미 비운 경우).
+    """
+    objects = list(objects)
+    if not objects:
+        return 0
+    index = INDEXES[objects[0]._meta.label]
+    rows = [
+        SearchToken(model_label=index.label, object_id=obj.pk, token=token, weight=weight)
+        for obj in objects
+        for token, weight in index.document(obj).items()
+    ]
+    with transaction.atomic():
+        if replace:
+            unindex(index.label, [obj.pk for obj in objects])
+        SearchToken.objects.bulk_create(rows, batch_size=batch_size)
+    return len(rows)
+
+
+def unindex(model_label, object_ids):
+    SearchToken.objects.filter(model_label=model_label, object_id__in=list(object_ids)).delete()
+
+
+@transaction.atomic
+def rebuild(label, chunk_size=2000):
+    """모델 하나의 색인 전체 재생성 - 반환값: (객체 수, 토큰 수)"""
+    SearchToken.objects.filter(model_label=label).delete()
+    objects = tokens = 0
+    batch = []
+    for obj in INDEXES[label].queryset().order_by('pk').iterator(chunk_size=chunk_size):
+        batch.append(obj)
+        if len(batch) >= chunk_size:
+            tokens += index_objects(batch, replace=False)
+            objects += len(batch)
+            batch = []
+    tokens += index_objects(batch, replace=False)
+    objects += len(batch)
+    return objects, tokens
+
+
+def search_q(query, model_label, fields):
+    """검색어의 모든 단어를 포함하는 객체만 남기는 Q (관리 목록용 부분 문자열 검색)
+
+    1) 단어의 n-gram이 모두 색인에 있는 객체로 좁히고 (토큰 인덱스 조회),
+    2) 좁혀진 행에서 실제 부분 문자열 일치를 확인한다 (n-gram 순서/필드 경계 오탐 제거).
+    """
+    condition = Q()
+    for word in words(query):
+        tokens = SearchToken.objects.filter(model_label=model_label)
+        for gram in bigrams(word) or {word}:
+            condition &= Q(pk__in=tokens.filter(token=gram).values('object_id'))
+
+        matches = Q()
+        for field in fields:
+            matches |= Q(**{f'{field}__icontains': word})
+        condition &= matches
+    return condition
+
+
+def search_artworks(queryset, query):
+    return queryset.filter(search_q(query, ARTWORK_LABEL, ARTWORK_FIELDS))
+
+
+def ranked_ids(label, tokens, min_hits, limit):
+    """토큰이 min_hits개 이상 일치하는 객체 pk - 일치한 토큰의 필드 가중치 합 순
+
+    제목 일치가 작가명 일치보다 앞선다. (label, token) 인덱스로 게시 목록만 읽는다.
+    """
+    rows = (
+        SearchToken.objects
+        .filter(model_label=label, token__in=tokens)
+        .values('object_id')
+        .annotate(hits=Count('pk'), score=Sum('weight'))
+        .filter(hits__gte=min_hits)
+        .order_by('-score', '-object_id')
+        .values_list('object_id', flat=True)
+    )
+    return list(rows[:limit])
+
+
+def ranked_search(query, limit=20):
+    """공개 통합 검색 - {모델 label: 점수순 공개 객체 목록}
+
+    모든 단어의 음절/영문 토큰이 일치하는 객체를 먼저 찾고, 어느 모델에서도
+    결과가 없으면 오타로 보고 자모 토큰이 FUZZY_MIN_RATIO 이상 일치하는 객체를
+    찾는다 (정확한 결과가 있을 때 비슷한 이름이 섞이지 않도록).
+    비공개 객체는 점수순 목록에서 걸러내므로 limit의 두 배를 읽는다.
+    """
+    exact, fuzzy = query_tokens(query)
+    phases = [(exact, len(exact))]
+    if fuzzy:
+        phases.append((fuzzy, math.ceil(len(fuzzy) * FUZZY_MIN_RATIO)))
+
+    results = {label: [] for label in INDEXES}
+    for tokens, min_hits in phases:
+        if not tokens:
+            continue
+        for label, index in INDEXES.items():
+            ids = ranked_ids(label, tokens, min_hits, limit * 2)
+            objects = index.public_queryset().in_bulk(ids)
+            results[label] = [objects[pk] for pk in ids if pk in objects][:limit]
+        if any(results.values()):
+            break
+    return results
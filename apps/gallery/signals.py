@@ -0,0 +1,68 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from apps.core.cache import invalidate_public_pages
+from . import current, search, stats
+from .models import Artist, Artwork, ArtworkImage, CurrentExhibition, Exhibition, SimpleArtist
+
+# 공개 페이지(core/gallery)에 표시되는 모델 - 바뀌면 캐시된 페이지 전체를 무효화
+PUBLIC_MODELS = (Artist, Exhibition, Artwork, ArtworkImage, CurrentExhibition, SimpleArtist)
+PUBLIC_M2M = (Exhibition.artists.through, Artwork.exhibitions.through)
+
+
+def invalidate_pages(sender, **kwargs):
+    invalidate_public_pages()
+
+
+def invalidate_pages_m2m(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate_public_pages()
+
+
+def invalidate_dashboard(sender, **kwargs):
+    stats.invalidate()
+
+
+def invalidate_current(sender, **kwargs):
+    current.invalidate()
+
+
+def _changes(update_fields, fields):
+    # update_fields 저장(이미지 메타데이터 등)에서 검색 필드가 없으면 색인을 건너뛴다
+    return update_fields is None or bool(set(update_fields) & set(fields))
+
+
+def index_object(sender, instance, update_fields=None, **kwargs):
+    index = search.INDEXES[sender._meta.label]
+    if _changes(update_fields, [path.split('__')[0] for path, _ in index.fields]):
+        search.index_objects([instance])
+
+
+def index_artist_artworks(sender, instance, update_fields=None, **kwargs):
+    # 작가명도 작품 색인에 들어가므로 이름이 바뀌면 작가의 작품을 다시 색인
+    if _changes(update_fields, ('name',)):
+        search.index_objects(search.INDEXES[search.ARTWORK_LABEL].queryset().filter(artist=instance))
+
+
+def unindex_object(sender, instance, **kwargs):
+    search.unindex(sender._meta.label, [instance.pk])
+
+
+def connect():
+    for model in PUBLIC_MODELS:
+        post_save.connect(invalidate_pages, sender=model, dispatch_uid=f'pages_save_{model._meta.label}')
+        post_delete.connect(invalidate_pages, sender=model, dispatch_uid=f'pages_delete_{model._meta.label}')
+    for through in PUBLIC_M2M:
+        m2m_changed.connect(invalidate_pages_m2m, sender=through, dispatch_uid=f'pages_m2m_{through._meta.label}')
+
+    for model in (Artist, Exhibition, Artwork):
+        post_save.connect(index_object, sender=model, dispatch_uid=f'search_index_{model._meta.label}')
+        post_delete.connect(unindex_object, sender=model, dispatch_uid=f'search_unindex_{model._meta.label}')
+    post_save.connect(index_artist_artworks, sender=Artist, dispatch_uid='search_index_artist_artworks')
+
+    # 관리자 대시보드 통계 (작가/전시/작품 수, 판매 금액, 최근 목록)
+    for model in (Artist, Exhibition, Artwork):
+        post_save.connect(invalidate_dashboard, sender=model, dispatch_uid=f'dashboard_save_{model._meta.label}')
+        post_delete.connect(invalidate_dashboard, sender=model, dispatch_uid=f'dashboard_delete_{model._meta.label}')
+
+    # 현재전시 페이지의 캐시된 전시 (포인터 변경은 current.activate()가 직접 무효화)
+    post_save.connect(invalidate_current, sender=CurrentExhibition, dispatch_uid='current_save')
+    post_delete.connect(invalidate_current, sender=CurrentExhibition, dispatch_uid='current_delete')
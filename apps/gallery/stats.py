@@ -0,0 +1,209 @@
+from datetime import datetime, time, timedelta
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import CharField, Count, DecimalField, IntegerField, Q, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from apps.core.cache import bump_namespace, namespaced_key
+from .models import Artist, Artwork, DailyStats, Exhibition
+
+DASHBOARD_CACHE_NAMESPACE = 'dashboard'
+# 저장/삭제 신호로 무효화되지만 QuerySet.update()처럼 신호 없는 변경도 이 시간 뒤에는 반영
+DASHBOARD_CACHE_TIMEOUT = 300
+
+# 추이 그래프 기간
+TREND_WEEKS = 8
+TREND_DAYS = 14
+# rollup()이 쿼리 한 번에 집계하는 날짜 수 (날짜마다 COUNT 열이 하나씩 붙음)
+ROLLUP_CHUNK_DAYS = 62
+
+# (DailyStats 필드, 모델)
+ADDED_FIELDS = (
+    ('artists_added', Artist),
+    ('exhibitions_added', Exhibition),
+    ('artworks_added', Artwork),
+)
+
+ZERO = Value(0, output_field=DecimalField(max_digits=16, decimal_places=0))
+
+
+def invalidate():
+    """대시보드 캐시 무효화 (트랜잭션이 커밋된 뒤에 실행)"""
+    transaction.on_commit(lambda: bump_namespace(DASHBOARD_CACHE_NAMESPACE))
+
+
+def _start_of(day):
+    """현지 날짜의 0시 (aware datetime)"""
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def _week_start(day):
+    return day - timedelta(days=day.weekday())
+
+
+def _summary(queryset, kind, since, flagged, sold_value=ZERO, for_sale_value=ZERO):
+    return (
+        queryset.order_by()
+        .annotate(_group=Value(1, output_field=IntegerField())).values('_group')
+        .annotate(
+            total=Count('pk'),
+            week=Count('pk', filter=Q(created_at__gte=since['week'])),
+            month=Count('pk', filter=Q(created_at__gte=since['month'])),
+            flagged=Count('pk', filter=flagged),
+            sold_value=sold_value,
+            for_sale_value=for_sale_value,
+            kind=Value(kind, output_field=CharField()),
+        )
+        .values_list('kind', 'total', 'week', 'month', 'flagged', 'sold_value', 'for_sale_value')
+    )
+
+
+def totals(today):
+    """작가/전시/작품 수와 판매 금액 - UNION ALL 쿼리 한 번
+
+    {'artists': {'total', 'week', 'month', 'flagged', ...}, 'exhibitions': ..., 'artworks': ...}
+    flagged는 활동 중 작가 / 현재 전시 / 판매 완료 작품 수다.
+    """
+    since = {'week': _start_of(_week_start(today)), 'month': _start_of(today.replace(day=1))}
+    artists = _summary(Artist.objects.all(), 'artists', since, Q(is_active=True))
+    exhibitions = _summary(Exhibition.objects.all(), 'exhibitions', since, Q(is_current=True))
+    artworks = _summary(
+        Artwork.objects.all(), 'artworks', since, Q(is_sold=True),
+        sold_value=Coalesce(Sum('price', filter=Q(is_sold=True)), ZERO),
+        for_sale_value=Coalesce(Sum('price', filter=Q(is_for_sale=True, is_sold=False)), ZERO),
+    )
+
+    columns = ('total', 'week', 'month', 'flagged', 'sold_value', 'for_sale_value')
+    result = {kind: dict.fromkeys(columns, 0) for kind in ('artists', 'exhibitions', 'artworks')}
+    # 빈 테이블은 GROUP BY 결과 행이 없으므로 0으로 남는다
+    for kind, *values in artists.union(exhibitions, artworks, all=True):
+        result[kind] = dict(zip(columns, values))
+    return result
+
+
+def rollup(start, end, sold_value=None, for_sale_value=None):
+    """start~end(포함) 날짜의 등록 수를 다시 집계해 DailyStats에 저장 - {날짜: 행}
+
+    등록 수는 날짜별 created_at 범위의 조건부 COUNT로 구한다 (DB 시간대 함수 없이).
+    금액은 주어졌을 때만 end 날짜 행에 기록하고, 지난 날짜의 금액 스냅숏은 그대로 둔다.
+    """
+    days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+    counts = {day: {} for day in days}
+    for offset in range(0, len(days), ROLLUP_CHUNK_DAYS):
+        chunk = days[offset:offset + ROLLUP_CHUNK_DAYS]
+        bounds = [(day, _start_of(day), _start_of(day + timedelta(days=1))) for day in chunk]
+        for field, model in ADDED_FIELDS:
+            row = model.objects.filter(
+                created_at__gte=bounds[0][1], created_at__lt=bounds[-1][2],
+            ).aggregate(**{
+                f'd{i}': Count('pk', filter=Q(created_at__gte=since, created_at__lt=until))
+                for i, (_, since, until) in enumerate(bounds)
+            })
+            for i, (day, _, _) in enumerate(bounds):
+                counts[day][field] = row[f'd{i}']
+
+    now = timezone.now()
+    with transaction.atomic():
+        rows = DailyStats.objects.filter(date__range=(start, end)).in_bulk(field_name='date')
+        created, changed = [], []
+        for day in days:
+            row = rows.get(day)
+            if row is None:
+                row = rows[day] = DailyStats(date=day)
+                created.append(row)
+            else:
+                changed.append(row)
+            for field, _ in ADDED_FIELDS:
+                setattr(row, field, counts[day][field])
+            row.updated_at = now
+        if sold_value is not None:
+            rows[end].sold_value = sold_value
+            rows[end].for_sale_value = for_sale_value
+
+        # 다른 요청이 같은 날짜 행을 먼저 만들었으면 그 값(같은 집계)을 둔다
+        DailyStats.objects.bulk_create(created, ignore_conflicts=True)
+        DailyStats.objects.bulk_update(changed, [
+            *(field for field, _ in ADDED_FIELDS), 'sold_value', 'for_sale_value', 'updated_at',
+        ])
+    return rows
+
+
+def _refresh_rollups(today, since, totals):
+    """추이 기간의 일별 집계 - 없거나 마감 전에 계산된 날짜와 오늘만 다시 집계
+
+    그날 안에 계산된 행은 이후 등록분이 빠져 있을 수 있으므로 다음 날 다시 집계한다.
+    """
+    rows = DailyStats.objects.filter(date__range=(since, today)).in_bulk(field_name='date')
+    stale = [
+        day for day in (since + timedelta(days=i) for i in range((today - since).days))
+        if day not in rows or timezone.localdate(rows[day].updated_at) <= day
+    ]
+    artworks = totals['artworks']
+    rows.update(rollup(
+        min(stale, default=today), today,
+        sold_value=artworks['sold_value'], for_sale_value=artworks['for_sale_value'],
+    ))
+    return rows
+
+
+def _trends(today, rows):
+    weeks = []
+    first_week = _week_start(today) - timedelta(weeks=TREND_WEEKS - 1)
+    for i in range(TREND_WEEKS):
+        start = first_week + timedelta(weeks=i)
+        count = sum(
+            rows[day].artworks_added
+            for day in (start + timedelta(days=d) for d in range(7)) if day in rows
+        )
+        weeks.append({'start': start, 'count': count})
+
+    values = [
+        {'date': day, 'sold': rows[day].sold_value, 'for_sale': rows[day].for_sale_value}
+        for day in sorted(rows)
+        if day > today - timedelta(days=TREND_DAYS) and rows[day].sold_value is not None
+    ]
+    return {
+        'weekly_uploads': weeks,
+        'weekly_uploads_max': max((week['count'] for week in weeks), default=0),
+        'sales_values': values,
+        'sales_values_max': max((max(v['sold'], v['for_sale']) for v in values), default=0),
+    }
+
+
+def _compute(today):
+    stats = {'totals': totals(today)}
+    since = min(_week_start(today) - timedelta(weeks=TREND_WEEKS - 1), today - timedelta(days=TREND_DAYS - 1))
+    stats.update(_trends(today, _refresh_rollups(today, since, stats['totals'])))
+    stats.update(
+        recent_artists=list(Artist.objects.order_by('-created_at')[:6]),
+        recent_exhibitions=list(Exhibition.objects.order_by('-created_at')[:5]),
+        current_exhibitions=list(Exhibition.objects.filter(is_current=True)),
+    )
+    return stats
+
+
+def dashboard_stats():
+    """관리자 대시보드 통계 (캐시) - 작가/전시/작품이 바뀌면 신호로 무효화
+
+    캐시 키는 현재 네임스페이스 버전으로 먼저 만들므로, 계산 중에 커밋된 변경은
+    올라간 버전의 키를 쓰는 다음 요청에서 다시 계산된다.
+    """
+    today = timezone.localdate()
+    key = namespaced_key(DASHBOARD_CACHE_NAMESPACE, f'stats:{today}')
+    stats = cache.get(key)
+    if stats is None:
+        stats = _compute(today)
+        cache.set(key, stats, DASHBOARD_CACHE_TIMEOUT)
+    return stats
+
+
+def dashboard_context():
+    """admin/gallery_dashboard.html 컨텍스트 (gallery/adminpanel 대시보드 공용)"""
+    stats = dashboard_stats()
+    totals = stats['totals']
+    return {
+        **stats,
+        'total_artists': totals['artists']['total'],
+        'total_exhibitions': totals['exhibitions']['total'],
+        'total_artworks': totals['artworks']['total'],
+    }
@@ -0,0 +1,68 @@
+import logging
+from PIL import Image
+from django.apps import apps
+from apps.core.cache import invalidate_public_pages
+from .models import ImageJob
+from .utils import ImageOptimizer, allow_large_images
+
+logger = logging.getLogger(__name__)
+
+
+def generate_renditions(field_file):
+    """원본 옆에 썸네일/중간/큰 렌디션과 반응형 세트(xs/sm/md) 저장 (srcset의 가장 큰 너비는 큰 렌디션)
+
+    각 렌디션은 JPEG와 함께 WebP(가능하면 AVIF)로도 저장된다.
+    파일명이 원본에서 결정되므로 여러 번 실행해도 같은 결과가 된다.
+    반환값: {렌디션 이름: 저장된 JPEG 파일명}
+    """
+    storage = field_file.storage
+    saved = {}
+    with field_file.open('rb') as original:
+        specs = dict(ImageOptimizer.RENDITIONS)
+        specs.update(ImageOptimizer.responsive_specs(Image.open(original).width))
+
+        # 렌디션을 하나씩 받아 바로 저장하고 닫는다 (버퍼는 항상 하나)
+        for (rendition, fmt), content in ImageOptimizer.iter_render(original, ImageOptimizer.with_formats(specs)):
+            with content:
+                name = ImageOptimizer.rendition_name(field_file.name, rendition, fmt)
+                if storage.exists(name):
+                    storage.delete(name)
+                name = storage.save(name, content)
+            if fmt == 'JPEG':
+                saved[rendition] = name
+    return saved
+
+
+def describe_image(field_file, renditions):
+    """원본 크기(헤더)와 썸네일 렌디션에서 계산한 대표 색/blurhash"""
+    metadata = {'width': field_file.width, 'height': field_file.height}
+    with field_file.storage.open(renditions['thumbnail'], 'rb') as thumbnail:
+        metadata.update(ImageOptimizer.describe(thumbnail))
+    return metadata
+
+
+@allow_large_images()
+def run_image_job(job_id):
+    """작업 하나 처리 (워커 프로세스에서 실행)"""
+    job = ImageJob.objects.get(pk=job_id)
+
+    try:
+        model = apps.get_model(job.model_label)
+        instance = model.objects.filter(pk=job.object_id).first()
+        field_file = getattr(instance, job.field_name, None) if instance else None
+
+        # 객체가 삭제됐거나 그 사이 다른 이미지로 바뀐 경우 처리할 것이 없음
+        if not field_file or field_file.name != job.source_name:
+            logger.info(f"이미지 작업 건너뜀 (원본 변경/삭제): {job}")
+        else:
+            renditions = generate_renditions(field_file)
+            instance.store_image_metadata(job.field_name, describe_image(field_file, renditions))
+            instance.renditions_ready(job.field_name, renditions)
+            # 렌디션/이미지 정보는 update()로 저장되어 시그널이 발생하지 않는다
+            invalidate_public_pages()
+        job.mark_done()
+    except Exception as e:
+        logger.warning(f"이미지 작업 실패 ({job.attempts}/{job.max_attempts}): {job} - {e}")
+        job.mark_failed(e)
+
+    return job.status
@@ -0,0 +1,155 @@
+import base64
+from functools import lru_cache
+from io import BytesIO
+from django import template
+from django.urls import reverse
+from django.forms.utils import flatatt
+from django.utils.html import format_html, format_html_join
+from ..utils import ImageOptimizer
+
+register = template.Library()
+
+# 템플릿 위치(slot)별로 사용할 렌디션
+SLOT_RENDITIONS = {
+    'thumb': 'thumbnail',   # 관리 목록, 아바타 등 작은 이미지
+    'card': 'medium',       # 카드/그리드
+    'detail': 'large',      # 상세 보기, 라이트박스
+}
+
+
+@register.simple_tag
+def rendition_url(field_file, slot='card'):
+    """슬롯에 맞는 렌디션 URL 반환
+
+    렌디션이 아직 생성되지 않았으면 원본 URL을 반환한다.
+    사용법: {% rendition_url artwork.main_image 'thumb' %}
+    """
+    if not field_file:
+        return ''
+
+    rendition = SLOT_RENDITIONS.get(slot, slot)
+    name = ImageOptimizer.rendition_name(field_file.name, rendition)
+    storage = field_file.storage
+    if storage.exists(name):
+        return storage.url(name)
+    return field_file.url
+
+
+def _srcset(field_file, format='JPEG'):
+    """반응형 세트(xs/sm/md/large) 중 존재하는 파일로 srcset 문자열 생성"""
+    storage = field_file.storage
+    metadata = _image_metadata(field_file)
+    candidates, widths = [], []
+    for width, suffix in ImageOptimizer.RESPONSIVE_SIZES:
+        name = ImageOptimizer.rendition_name(field_file.name, suffix, format)
+        if not storage.exists(name):
+            continue
+        # 기본 렌디션(large)은 박스에 맞춰 줄이므로 원본 크기를 알면 실제 너비를 쓴다
+        box = ImageOptimizer.RENDITIONS.get(suffix, {}).get('size')
+        if box and metadata.get('width') and metadata.get('height'):
+            width = ImageOptimizer._fit((metadata['width'], metadata['height']), box)[0]
+        if widths and width <= widths[-1]:
+            continue
+        widths.append(width)
+        candidates.append(f'{storage.url(name)} {width}w')
+    return ', '.join(candidates)
+
+
+def _image_metadata(field_file):
+    """필드 파일이 속한 객체에 저장된 이미지 정보 (width/height/color/blurhash)"""
+    instance = getattr(field_file, 'instance', None)
+    if not hasattr(instance, 'image_metadata'):
+        return {}
+    return instance.image_metadata(field_file.field.name)
+
+
+@lru_cache(maxsize=1024)
+def _blurhash_data_uri(blurhash):
+    """blurhash를 8x8 PNG data URI로 복원 (같은 해시는 한 번만 계산)"""
+    buffer = BytesIO()
+    ImageOptimizer.blurhash_image(blurhash).save(buffer, 'PNG')
+    return 'data:image/png;base64,' + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+
+@register.filter
+def image_placeholder(field_file):
+    """이미지가 로드되기 전 보여줄 배경 CSS (대표 색 + blurhash)
+
+    사용법: <div style="{{ artwork.main_image|image_placeholder }}">
+    """
+    if not field_file:
+        return ''
+    metadata = _image_metadata(field_file)
+    styles = []
+    if metadata.get('color'):
+        styles.append(f"background-color: {metadata['color']}")
+    if metadata.get('blurhash'):
+        try:
+            styles.append(f"background-image: url({_blurhash_data_uri(metadata['blurhash'])})")
+            styles.append('background-size: cover')
+        except (ValueError, IndexError):
+            pass
+    return '; '.join(styles)
+
+
+@register.simple_tag
+def resized_url(field_file, width, height=None):
+    """요청 시 리사이즈 엔드포인트 URL (높이를 생략하면 정사각형 박스)
+
+    스키마 변경 없이 모든 MEDIA_ROOT 이미지(SimpleArtist, CurrentExhibition,
+    Media 등)를 필요한 크기로 받을 수 있다. 크기는 RENDITION_SIZES에 등록해야 한다.
+    사용법: {% resized_url artist.artwork1 160 %}
+    """
+    if not field_file:
+        return ''
+    name = getattr(field_file, 'name', field_file)
+    return reverse('gallery:resized_image', kwargs={'width': width, 'height': height or width, 'path': name})
+
+
+@register.simple_tag
+def responsive_img(field_file, sizes='100vw', **attrs):
+    """srcset/sizes가 포함된 이미지 태그 생성
+
+    WebP/AVIF 렌디션이 있으면 <picture>로 감싸 브라우저가 지원하는
+    가장 작은 포맷을 고르게 하고, 없으면 JPEG srcset만 가진 <img>를 만든다.
+    src는 큰 JPEG 렌디션(라이트박스용, srcset 미지원 브라우저 대체)이다.
+    이미지 정보가 저장돼 있으면 width/height와 플레이스홀더 배경을 넣어
+    디코드 전에도 레이아웃이 잡히게 한다.
+    사용법: {% responsive_img artist.artwork1 sizes="33vw" class="lbox" alt=artist.name %}
+    """
+    if not field_file:
+        return ''
+
+    attrs.setdefault('alt', '')
+    attrs.setdefault('loading', 'lazy')
+    attrs['src'] = rendition_url(field_file, 'detail')
+    metadata = _image_metadata(field_file)
+    if metadata.get('width') and metadata.get('height'):
+        attrs.setdefault('width', metadata['width'])
+        attrs.setdefault('height', metadata['height'])
+    placeholder = image_placeholder(field_file)
+    if placeholder:
+        attrs['style'] = '; '.join(filter(None, [attrs.get('style', '').rstrip('; '), placeholder]))
+    srcset = _srcset(field_file)
+    if srcset:
+        attrs['srcset'] = srcset
+        attrs['sizes'] = sizes
+    img = format_html('<img{}>', flatatt(attrs))
+
+    sources = []
+    for fmt in ImageOptimizer.output_formats():
+        if fmt == 'JPEG':
+            continue
+        fmt_srcset = _srcset(field_file, fmt)
+        if fmt_srcset:
+            source_attrs = {'type': ImageOptimizer.FORMAT_MIME_TYPES[fmt], 'srcset': fmt_srcset, 'sizes': sizes}
+            sources.append(format_html('<source{}>', flatatt(source_attrs)))
+    if not sources:
+        return img
+
+    # display: contents - 기존 그리드/카드 CSS가 <img>에 그대로 적용되도록
+    return format_html(
+        '<picture style="display: contents">{}{}</picture>',
+        format_html_join('', '{}', ((source,) for source in sources)),
+        img,
+    )
@@ -1,3 +1,661 @@
-from django.test import TestCase
+import fcntl
+import itertools
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from io import BytesIO, StringIO
+from unittest import mock, skipIf
+from PIL import Image
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client, TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from . import current
+from .bulk import BULK_MAX_IDS
+from .models import (
+    Artist, Artwork, ArtworkImage, ChunkedUpload, CurrentExhibition, CurrentExhibitionPointer, Exhibition, ImageJob,
+    SimpleArtist, UploadConflict,
+)
+from .search import ARTIST_LABEL, ARTWORK_LABEL, EXHIBITION_LABEL, ranked_search, search_artworks
+from .tasks import generate_renditions
+from .templatetags.gallery_images import _srcset
+from .utils import RenditionCache, allow_large_images
 
-# Create your tests here.
+
+class DetailQueryBudgetTest(TestCase):
+    """상세 페이지 쿼리 수가 작품/이미지/전시 수와 무관하게 고정인지 확인
+
+    조건부 GET 검사 1 + 본문 쿼리 3 = 4
+    """
+
+    budget = 4
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.artist = Artist.objects.create(name='작가', profile_image='artists/profiles/a.jpg')
+        cls.exhibitions = [
+            Exhibition.objects.create(
+                title=f'전시 {i}', slug=f'exhibition-{i}',
+                start_date=date(2024, 1, 1), end_date=date(2024, 2, 1),
+            )
+            for i in range(3)
+        ]
+        for exhibition in cls.exhibitions:
+            exhibition.artists.add(cls.artist)
+        cls.artwork = cls.create_artworks(1)[0]
+
+    @classmethod
+    def create_artworks(cls, count):
+        artworks = []
+        for i in range(count):
+            artwork = Artwork.objects.create(title=f'작품 {i}', artist=cls.artist, main_image=f'artworks/{i}.jpg')
+            artwork.exhibitions.set(cls.exhibitions)
+            ArtworkImage.objects.create(artwork=artwork, image=f'artworks/additional/{i}.jpg')
+            artworks.append(artwork)
+        return artworks
+
+    def setUp(self):
+        cache.clear()
+
+    def assertBudget(self, url):
+        with self.assertNumQueries(self.budget):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+    def test_artwork_detail(self):
+        url = reverse('gallery:artwork_detail', args=[self.artwork.pk])
+        self.assertBudget(url)
+        self.create_artworks(10)
+        for _ in range(5):
+            ArtworkImage.objects.create(artwork=self.artwork, image='artworks/additional/more.jpg')
+        self.assertBudget(url)
+
+    def test_artist_detail(self):
+        url = reverse('gallery:artist_detail', args=[self.artist.pk])
+        self.assertBudget(url)
+        self.create_artworks(10)
+        self.assertBudget(url)
+
+    def test_not_modified(self):
+        url = reverse('gallery:artwork_detail', args=[self.artwork.pk])
+        etag = self.client.get(url)['ETag']
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_exhibition_etag_tracks_artists(self):
+        url = reverse('gallery:exhibition_detail', args=[self.exhibitions[0].slug])
+        Exhibition.objects.update(is_published=True)
+        Artwork.objects.update(is_published=True)
+        etag = self.client.get(url)['ETag']
+        self.artist.name = '작가 (개명)'
+        self.artist.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+
+class SearchTest(TestCase):
+    """공개 통합 검색 - 저장 신호로 색인된 작가/전시/작품"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.artist = Artist.objects.create(name='김바다', name_en='Kim Bada')
+        cls.artwork = Artwork.objects.create(title='푸른 바다', artist=cls.artist, main_image='artworks/sea.jpg')
+        cls.exhibition = Exhibition.objects.create(
+            title='바다의 기억', slug='memory-of-sea',
+            start_date=date(2024, 1, 1), end_date=date(2024, 2, 1),
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def titles(self, query):
+        return [artwork.title for artwork in ranked_search(query)[ARTWORK_LABEL]]
+
+    def test_all_models_ranked_by_field_weight(self):
+        Artwork.objects.create(title='산', artist=self.artist, main_image='artworks/mountain.jpg')
+        results = ranked_search('바다')
+        self.assertEqual([artist.pk for artist in results[ARTIST_LABEL]], [self.artist.pk])
+        self.assertEqual([exhibition.pk for exhibition in results[EXHIBITION_LABEL]], [self.exhibition.pk])
+        # 제목 일치(가중치 3)가 작가명 일치(1)보다 앞선다
+        self.assertEqual(self.titles('바다'), ['푸른 바다', '산'])
+
+    def test_english_prefix(self):
+        self.assertEqual([artist.pk for artist in ranked_search('bad')[ARTIST_LABEL]], [self.artist.pk])
+        self.assertEqual(ranked_search('bada kim')[ARTIST_LABEL], [self.artist])
+
+    def test_fuzzy_jamo_fallback(self):
+        Artwork.objects.create(title='바둑', artist=Artist.objects.create(name='이산'), main_image='artworks/go.jpg')
+        # 정확한 결과가 있으면 자모가 비슷한 이름(바둑)은 섞지 않는다
+        self.assertEqual(self.titles('바다'), ['푸른 바다'])
+        # 오타(바댜)는 결과가 없으므로 자모 3-gram 절반 이상 일치로 찾는다
+        self.assertIn('푸른 바다', self.titles('바댜'))
+        self.assertEqual(ranked_search('바댜')[ARTIST_LABEL], [self.artist])
+        self.assertEqual(self.titles('쿠쿠'), [])
+
+    def test_unpublished_filtered(self):
+        Artwork.objects.filter(pk=self.artwork.pk).update(is_published=False)
+        Artist.objects.filter(pk=self.artist.pk).update(is_active=False)
+        results = ranked_search('바다')
+        self.assertEqual(results[ARTWORK_LABEL], [])
+        self.assertEqual(results[ARTIST_LABEL], [])
+        self.assertEqual(results[EXHIBITION_LABEL], [self.exhibition])
+
+    def test_xhr_and_html_are_not_mixed(self):
+        url = reverse('gallery:search')
+        html = self.client.get(url, {'q': '바다'})
+        self.assertTemplateUsed(html, 'gallery/search.html')
+        self.assertIn('X-Requested-With', html['Vary'])
+        xhr = self.client.get(url, {'q': '바다'}, HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        self.assertEqual(xhr['Content-Type'], 'application/json')
+        self.assertEqual([item['id'] for item in xhr.json()['artworks']], [self.artwork.pk])
+        self.assertTemplateUsed(self.client.get(url, {'q': '바다'}), 'gallery/search.html')
+
+
+class ExhibitionFormCurrentTest(TestCase):
+    """전시 등록/수정 폼의 '현재 전시'는 current.set_current()/clear_current()로만 바뀐다"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('staff', password='staff', is_staff=True)
+        cls.artist = Artist.objects.create(name='작가')
+        cls.previous = Exhibition.objects.create(
+            title='이전 전시', slug='previous', is_current=True,
+            start_date=date(2024, 1, 1), end_date=date(2024, 2, 1),
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def post_data(self, **extra):
+        return {
+            'title': '새 전시', 'slug': 'new', 'exhibition_type': 'solo',
+            'start_date': '2024-03-01', 'end_date': '2024-04-01',
+            'venue': '하나아트갤러리', 'artists': [self.artist.pk], 'is_published': 'on',
+            **extra,
+        }
+
+    def current_slugs(self):
+        return list(Exhibition.objects.filter(is_current=True).values_list('slug', flat=True))
+
+    def test_create_ticked_replaces_current(self):
+        response = self.client.post(reverse('gallery:exhibition_create'), self.post_data(is_current='on'))
+        self.assertRedirects(response, reverse('gallery:exhibition_manage_list'), fetch_redirect_response=False)
+        self.assertEqual(self.current_slugs(), ['new'])
+
+    def test_create_unticked_keeps_current(self):
+        self.client.post(reverse('gallery:exhibition_create'), self.post_data())
+        self.assertEqual(self.current_slugs(), ['previous'])
+
+    def test_edit_unticked_clears_current(self):
+        url = reverse('gallery:exhibition_edit', args=[self.previous.pk])
+        self.assertContains(self.client.get(url), 'name="is_current"')
+        self.client.get(reverse('gallery:exhibition_list'))  # 공개 목록 캐시 채우기
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(url, self.post_data(title='이전 전시 (수정)', slug='previous'))
+        self.assertEqual(self.current_slugs(), [])
+        response = self.client.get(reverse('gallery:exhibition_list'))
+        self.assertNotIn(self.previous, response.context['current_exhibitions'])
+
+
+class RenditionCacheTest(TestCase):
+    """요청 시 리사이즈 캐시 - 동시 요청"""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.media_root = directory.name
+        self.source = os.path.join(directory.name, 'source.jpg')
+        Image.new('RGB', (800, 600), 'navy').save(self.source)
+        self.cache_root = os.path.join(directory.name, 'renditions')
+        self.cache = RenditionCache(root=self.cache_root)
+
+    def test_concurrent_misses_create_once(self):
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(lambda _: self.cache.get_or_create(self.source, 160, 160), range(16)))
+        self.assertEqual(len(set(results)), 1)
+        path, _ = results[0]
+        with Image.open(path) as image:
+            self.assertLessEqual(max(image.size), 160)
+        # 샤드 잠금 파일은 남고 임시 파일은 없다
+        self.assertEqual(sorted(os.listdir(os.path.dirname(path))), ['.lock', os.path.basename(path)])
+
+    def test_evicts_every_n_writes(self):
+        cache = RenditionCache(root=self.cache_root, max_bytes=1, evict_every=3)
+        with mock.patch.object(RenditionCache, '_writes', itertools.count(1)):
+            paths = [cache.get_or_create(self.source, size, size)[0] for size in (100, 120)]
+            self.assertTrue(all(os.path.exists(path) for path in paths))
+            path, _ = cache.get_or_create(self.source, 140, 140)
+        self.assertFalse(any(os.path.exists(path) for path in [*paths, path]))
+
+    def test_view_allows_only_configured_sizes(self):
+        with override_settings(MEDIA_ROOT=self.media_root, RENDITION_CACHE_DIR=self.cache_root,
+                               RENDITION_SIZES=[(160, 160)]):
+            allowed = reverse('gallery:resized_image', kwargs={'width': 160, 'height': 160, 'path': 'source.jpg'})
+            self.assertEqual(self.client.get(allowed).status_code, 200)
+            other = reverse('gallery:resized_image', kwargs={'width': 161, 'height': 160, 'path': 'source.jpg'})
+            self.assertEqual(self.client.get(other).status_code, 404)
+        self.assertEqual(len(os.listdir(self.cache_root)), 1)
+
+    def test_view_resizes_large_image(self):
+        url = reverse('gallery:resized_image', kwargs={'width': 160, 'height': 160, 'path': 'source.jpg'})
+        with override_settings(MEDIA_ROOT=self.media_root, RENDITION_CACHE_DIR=self.cache_root,
+                               RENDITION_SIZES=[(160, 160)], IMAGE_MAX_PIXELS=10 ** 6), \
+                mock.patch.object(Image, 'MAX_IMAGE_PIXELS', 100_000):
+            self.assertEqual(self.client.get(url).status_code, 200)
+            self.assertEqual(Image.MAX_IMAGE_PIXELS, 100_000)
+
+    def test_view_unreadable_image_404(self):
+        with open(os.path.join(self.media_root, 'broken.jpg'), 'wb') as broken:
+            broken.write(b'not an image')
+        with override_settings(MEDIA_ROOT=self.media_root, RENDITION_CACHE_DIR=self.cache_root,
+                               RENDITION_SIZES=[(160, 160)], IMAGE_MAX_PIXELS=None), \
+                mock.patch.object(Image, 'MAX_IMAGE_PIXELS', 100_000):
+            for path in ('broken.jpg', 'source.jpg'):  # 손상된 파일, 한도를 넘는 압축 폭탄
+                url = reverse('gallery:resized_image', kwargs={'width': 160, 'height': 160, 'path': path})
+                self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_large_image_limit_only_inside_block(self):
+        default = Image.MAX_IMAGE_PIXELS
+        with override_settings(IMAGE_MAX_PIXELS=default * 4):
+            with allow_large_images():
+                self.assertEqual(Image.MAX_IMAGE_PIXELS, default * 4)
+        self.assertEqual(Image.MAX_IMAGE_PIXELS, default)
+
+
+def image_upload(name, size):
+    buffer = BytesIO()
+    Image.new('RGB', size, 'gray').save(buffer, 'JPEG')
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/jpeg')
+
+
+class GenerateRenditionsTest(TestCase):
+    """렌디션 생성 - srcset의 가장 큰 너비는 'large' 렌디션을 다시 쓴다"""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        media = override_settings(MEDIA_ROOT=directory.name)
+        media.enable()
+        self.addCleanup(media.disable)
+        self.artist = Artist.objects.create(name='작가')
+
+    def render(self, size):
+        artwork = Artwork.objects.create(title='작품', artist=self.artist, main_image=image_upload('a.jpg', size))
+        saved = generate_renditions(artwork.main_image)
+        return artwork, saved
+
+    def test_large_doubles_as_widest_srcset_entry(self):
+        artwork, saved = self.render((2400, 1600))
+        self.assertEqual(sorted(saved), ['large', 'md', 'medium', 'sm', 'thumbnail', 'xs'])
+        directory = os.path.dirname(artwork.main_image.path)
+        self.assertFalse([name for name in os.listdir(directory) if '_lg.' in name])
+        srcset = _srcset(artwork.main_image)
+        self.assertEqual([entry.split()[1] for entry in srcset.split(', ')], ['320w', '640w', '1024w', '1920w'])
+        self.assertIn(saved['large'].rsplit('/', 1)[-1], srcset)
+
+    def test_srcset_uses_actual_large_width(self):
+        artwork, _ = self.render((1800, 2400))  # 세로 이미지 - large는 1440x1920
+        srcset = _srcset(artwork.main_image)
+        self.assertEqual([entry.split()[1] for entry in srcset.split(', ')], ['320w', '640w', '1024w', '1440w'])
+
+
+class ImageDimensionTest(TestCase):
+    """업로드 시 이미지 크기 필드 기록 (색 정보만 image_meta)"""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        media = override_settings(MEDIA_ROOT=directory.name)
+        media.enable()
+        self.addCleanup(media.disable)
+
+    def test_upload_and_clear(self):
+        artist = SimpleArtist.objects.create(
+            name='작가', bio='소개',
+            artwork1=image_upload('a.jpg', (40, 30)), artwork2=image_upload('b.jpg', (20, 50)),
+        )
+        self.assertEqual((artist.artwork1_width, artist.artwork1_height), (40, 30))
+        self.assertEqual((artist.artwork2_width, artist.artwork2_height), (20, 50))
+        self.assertIsNone(artist.artwork3_width)
+
+        artist.store_image_metadata('artwork2', {'width': 20, 'height': 50, 'color': '#808080'})
+        artist.refresh_from_db()
+        self.assertEqual(artist.image_meta, {'artwork2': {'color': '#808080'}})
+        self.assertEqual(artist.image_metadata('artwork2'), {'width': 20, 'height': 50, 'color': '#808080'})
+
+        artist.artwork2 = None
+        artist.save(update_fields=['artwork2'])
+        artist.refresh_from_db()
+        self.assertEqual((artist.artwork2_width, artist.artwork2_height), (None, None))
+        self.assertEqual(artist.image_meta, {})
+        self.assertEqual(artist.image_metadata('artwork1'), {'width': 40, 'height': 30})
+
+
+class ChunkedUploadTest(TestCase):
+    """분할 업로드 - 조각 이어 쓰기, 끊긴 뒤 재개, 폼 제출"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('staff', password='staff', is_staff=True)
+        cls.artist = Artist.objects.create(name='작가')
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        paths = override_settings(MEDIA_ROOT=directory.name, FILE_UPLOAD_TEMP_DIR=directory.name)
+        paths.enable()
+        self.addCleanup(paths.disable)
+        self.client.force_login(self.user)
+        self.content = image_upload('scan.jpg', (64, 48)).read()
+
+    def create(self):
+        response = self.client.post(
+            reverse('gallery:chunked_upload_create'),
+            {'filename': 'scan.jpg', 'size': len(self.content), 'content_type': 'image/jpeg'},
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 201)
+        return response.json()['id']
+
+    def patch(self, pk, offset, chunk):
+        return self.client.patch(
+            reverse('gallery:chunked_upload_detail', args=[pk]), chunk,
+            content_type='application/offset+octet-stream', HTTP_UPLOAD_OFFSET=str(offset),
+        )
+
+    def test_assemble_resume_and_submit(self):
+        pk = self.create()
+        half = len(self.content) // 2
+        self.assertEqual(self.patch(pk, 0, self.content[:half])['Upload-Offset'], str(half))
+
+        # 응답을 못 받은 클라이언트가 같은 조각을 다시 보내면 409와 현재 위치
+        retry = self.patch(pk, 0, self.content[:half])
+        self.assertEqual(retry.status_code, 409)
+        self.assertEqual(retry['Upload-Offset'], str(half))
+        status = self.client.get(reverse('gallery:chunked_upload_detail', args=[pk]))
+        self.assertEqual(status.json()['offset'], half)
+
+        complete_url = reverse('gallery:chunked_upload_complete', args=[pk])
+        self.assertEqual(self.client.post(complete_url).status_code, 400)
+        self.assertEqual(self.patch(pk, half, self.content[half:]).status_code, 200)
+        self.assertEqual(self.client.post(complete_url).json()['status'], ChunkedUpload.STATUS_COMPLETE)
+
+        response = self.client.post(reverse('gallery:artwork_create'), {
+            'title': '분할 업로드 작품', 'artist': self.artist.pk, 'artwork_type': 'painting',
+            'display_order': 0, 'main_image_upload': pk,
+        })
+        self.assertRedirects(response, reverse('gallery:artwork_manage_list'), fetch_redirect_response=False)
+        artwork = Artwork.objects.get(title='분할 업로드 작품')
+        with artwork.main_image.open('rb') as saved:
+            self.assertEqual(saved.read(), self.content)
+        self.assertEqual((artwork.main_image_width, artwork.main_image_height), (64, 48))
+        self.assertFalse(ChunkedUpload.objects.filter(pk=pk).exists())
+
+    def test_rejects_oversized_chunk_and_other_users(self):
+        pk = self.create()
+        self.assertEqual(self.patch(pk, 0, self.content + b'x').status_code, 413)
+        self.client.force_login(User.objects.create_user('other', is_staff=True))
+        self.assertEqual(self.patch(pk, 0, self.content).status_code, 404)
+
+    def test_conflicting_patches(self):
+        pk = self.create()
+        upload = ChunkedUpload.objects.get(pk=pk)
+        os.makedirs(os.path.dirname(upload.part_path), exist_ok=True)
+
+        # 다른 요청이 조각을 쓰는 중 (파일 잠금)
+        with open(upload.part_path, 'ab') as part:
+            fcntl.flock(part, fcntl.LOCK_EX)
+            response = self.patch(pk, 0, self.content)
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response['Upload-Offset'], '0')
+
+        # 본문을 받는 사이 offset이 바뀌면 저장하지 않는다
+        class Stream(BytesIO):
+            def read(stream, size=-1):
+                ChunkedUpload.objects.filter(pk=pk).update(offset=10)
+                return super().read(size)
+
+        with self.assertRaises(UploadConflict):
+            upload.append(Stream(self.content))
+        upload.refresh_from_db()
+        self.assertEqual(upload.offset, 10)
+
+
+class ArtworkSearchTest(TestCase):
+    """작품 관리 목록 검색 (search_q) - 토큰 색인으로 좁힌 뒤 부분 문자열로 확인"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('staff', password='staff', is_staff=True)
+        monet = Artist.objects.create(name='모네', name_en='Claude Monet')
+        kim = Artist.objects.create(name='김가나')
+        cls.artworks = {
+            title: Artwork.objects.create(title=title, title_en=title_en, artist=artist, main_image='artworks/a.jpg', is_sold=sold)
+            for title, title_en, artist, sold in [
+                ('수련 연못', 'Water Lilies', monet, True),
+                ('붉은 꽃', '', kim, False),
+                ('가나 나다라', '', kim, False),
+                ('가나다 풍경', '', kim, False),
+            ]
+        }
+
+    def search(self, query):
+        return set(search_artworks(Artwork.objects.all(), query).values_list('title', flat=True))
+
+    def test_substring_fields(self):
+        self.assertEqual(self.search('연못'), {'수련 연못'})
+        self.assertEqual(self.search('꽃'), {'붉은 꽃'})
+        self.assertEqual(self.search('lilies'), {'수련 연못'})
+        self.assertEqual(self.search('김가'), {'붉은 꽃', '가나 나다라', '가나다 풍경'})
+
+    def test_every_word_must_match(self):
+        self.assertEqual(self.search('김가나 풍경'), {'가나다 풍경'})
+        self.assertEqual(self.search('수련 풍경'), set())
+
+    def test_ngram_false_positives_removed(self):
+        # '가나 나다라'에도 가나/나다 2-gram은 모두 있지만 '가나다'는 없다
+        self.assertEqual(self.search('가나다'), {'가나다 풍경'})
+
+    def test_manage_list_combines_filters(self):
+        self.client.force_login(self.user)
+        url = reverse('gallery:artwork_manage_list')
+        page = self.client.get(url, {'q': '모네'}).context['page_obj']
+        self.assertEqual([artwork.title for artwork in page], ['수련 연못'])
+        page = self.client.get(url, {'q': '모네', 'status': 'available'}).context['page_obj']
+        self.assertEqual(list(page), [])
+
+
+class ManageBulkTest(TestCase):
+    """관리 목록 일괄 작업 (POST /manage/bulk/, JSON)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('staff', password='staff', is_staff=True)
+        cls.artist = Artist.objects.create(name='작가')
+        cls.artworks = [
+            Artwork.objects.create(title=f'작품 {i}', artist=cls.artist, main_image=f'artworks/{i}.jpg', display_order=i)
+            for i in range(3)
+        ]
+        cls.ids = [artwork.pk for artwork in cls.artworks]
+        cls.exhibition = Exhibition.objects.create(
+            title='전시', slug='bulk', start_date=date(2024, 1, 1), end_date=date(2024, 2, 1),
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def post(self, data, **extra):
+        return self.client.post(reverse('gallery:manage_bulk'), data, content_type='application/json', **extra)
+
+    def assertSuccess(self, data, count):
+        response = self.post(data)
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.json()['count'], count)
+        self.assertTrue(response.json()['success'])
+        return response.json()
+
+    def assertRejected(self, data, status=400):
+        response = self.post(data)
+        self.assertEqual(response.status_code, status)
+        self.assertFalse(response.json()['success'])
+        self.assertTrue(response.json()['message'])
+
+    def test_publish_and_sold(self):
+        before = Artwork.objects.get(pk=self.ids[0]).updated_at
+        result = self.assertSuccess({'model': 'artwork', 'operation': 'unpublish', 'ids': self.ids[:2]}, 2)
+        self.assertEqual(result['message'], '작품 2점을 게시 해제했습니다.')
+        self.assertEqual(list(Artwork.objects.filter(is_published=False).order_by('pk').values_list('pk', flat=True)), self.ids[:2])
+        self.assertGreater(Artwork.objects.get(pk=self.ids[0]).updated_at, before)
+
+        self.assertSuccess({'model': 'artwork', 'operation': 'set_sold', 'ids': self.ids, 'sold': True}, 3)
+        self.assertEqual(Artwork.objects.filter(is_sold=True).count(), 3)
+        self.assertSuccess({'model': 'artist', 'operation': 'unpublish', 'ids': [self.artist.pk]}, 1)
+        self.assertFalse(Artist.objects.get(pk=self.artist.pk).is_active)
+
+    def test_reorder_follows_selection_order(self):
+        self.assertSuccess({'model': 'artwork', 'operation': 'reorder', 'ids': self.ids[::-1], 'start': 10}, 3)
+        orders = dict(Artwork.objects.values_list('pk', 'display_order'))
+        self.assertEqual([orders[pk] for pk in self.ids], [12, 11, 10])
+
+    def test_assign_exhibition_and_delete(self):
+        self.exhibition.artworks.add(self.ids[0])
+        self.assertSuccess({
+            'model': 'artwork', 'operation': 'assign_exhibition', 'ids': self.ids, 'exhibition': self.exhibition.pk,
+        }, 3)
+        self.assertEqual(set(self.exhibition.artworks.values_list('pk', flat=True)), set(self.ids))
+
+        self.assertSuccess({'model': 'artwork', 'operation': 'delete', 'ids': [self.ids[0], 0]}, 1)
+        self.assertFalse(Artwork.objects.filter(pk=self.ids[0]).exists())
+
+    def test_validation_errors(self):
+        response = self.client.post(reverse('gallery:manage_bulk'), 'not json', content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        for data in [
+            [],
+            {'model': 'user', 'operation': 'delete', 'ids': [1]},
+            {'model': 'artwork', 'operation': 'drop', 'ids': [1]},
+            {'model': ['artwork'], 'operation': 'publish', 'ids': [1]},
+            {'model': 'artist', 'operation': 'set_sold', 'ids': [self.artist.pk]},
+            {'model': 'artwork', 'operation': 'publish', 'ids': []},
+            {'model': 'artwork', 'operation': 'publish', 'ids': 'all'},
+            {'model': 'artwork', 'operation': 'publish', 'ids': ['x']},
+            {'model': 'artwork', 'operation': 'publish', 'ids': list(range(1, BULK_MAX_IDS + 2))},
+            {'model': 'artwork', 'operation': 'assign_exhibition', 'ids': self.ids},
+            {'model': 'artwork', 'operation': 'reorder', 'ids': self.ids, 'start': 'first'},
+        ]:
+            with self.subTest(data=data):
+                self.assertRejected(data)
+        self.assertEqual(Artwork.objects.filter(is_published=True).count(), 3)
+
+    def test_requires_login_post_and_csrf(self):
+        self.assertEqual(self.client.get(reverse('gallery:manage_bulk')).status_code, 405)
+        client = Client(enforce_csrf_checks=True)
+        client.force_login(self.user)
+        response = client.post(
+            reverse('gallery:manage_bulk'), {'model': 'artwork', 'operation': 'delete', 'ids': self.ids},
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 403)
+        self.client.logout()
+        response = self.post({'model': 'artwork', 'operation': 'delete', 'ids': self.ids})
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(response['Location'].startswith('/manage/login/'))
+        self.assertEqual(Artwork.objects.count(), 3)
+
+
+class CurrentExhibitionTest(TestCase):
+    """현재 전시 전환 (current.activate / current.set_current) - 항상 하나만, 캐시 무효화"""
+
+    def setUp(self):
+        cache.clear()
+
+    def current_exhibition(self, title):
+        return CurrentExhibition(
+            title=title, artist_name='작가', description='설명', image1='exhibitions/current/a.jpg',
+            start_date=date(2024, 1, 1), end_date=date(2024, 2, 1),
+        )
+
+    def test_activate_switches_pointer_and_flags(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            first = current.activate(self.current_exhibition('첫 전시'))
+        self.assertIsNotNone(first.pk)
+        self.assertEqual(current.get_current(), first)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            second = current.activate(self.current_exhibition('두 번째 전시'))
+        self.assertEqual(current.get_current(), second)
+        self.assertEqual(list(CurrentExhibition.objects.filter(is_active=True)), [second])
+        self.assertEqual(CurrentExhibitionPointer.objects.get().exhibition, second)
+
+        # 지난 전시를 다시 활성화
+        with self.captureOnCommitCallbacks(execute=True):
+            current.activate(first)
+        self.assertEqual(current.get_current(), first)
+        self.assertEqual(list(CurrentExhibition.objects.filter(is_active=True)), [first])
+
+    def test_get_current_is_cached(self):
+        self.assertIsNone(current.get_current())
+        with self.assertNumQueries(0):
+            self.assertIsNone(current.get_current())
+        exhibition = self.current_exhibition('전시')
+        exhibition.save()
+        # 포인터는 activate()로만 바뀐다
+        self.assertIsNone(current.get_current(cached=False))
+
+    def test_set_current_keeps_one(self):
+        exhibitions = [
+            Exhibition.objects.create(
+                title=f'전시 {i}', slug=f'current-{i}', is_current=i == 0,
+                start_date=date(2024, 1, 1), end_date=date(2024, 2, 1),
+            )
+            for i in range(3)
+        ]
+        before = exhibitions[0].updated_at
+        current.set_current(exhibitions[2])
+        self.assertEqual(list(Exhibition.objects.filter(is_current=True)), [exhibitions[2]])
+        # update()로 해제된 전시도 updated_at이 바뀌어 ETag가 갱신된다
+        exhibitions[0].refresh_from_db()
+        self.assertGreater(exhibitions[0].updated_at, before)
+
+        user = User.objects.create_user('staff', is_staff=True)
+        self.client.force_login(user)
+        response = self.client.post(
+            reverse('gallery:exhibition_set_current', args=[exhibitions[1].pk]),
+            HTTP_X_REQUESTED_WITH='XMLHttpRequest',
+        )
+        self.assertTrue(response.json()['success'])
+        self.assertEqual(list(Exhibition.objects.filter(is_current=True)), [exhibitions[1]])
+
+
+@skipIf(connection.vendor == 'sqlite' and connection.is_in_memory_db(), '워커 프로세스가 메모리 DB를 볼 수 없음')
+class ProcessImageJobsTest(TransactionTestCase):
+    """process_image_jobs - 여러 워커 프로세스가 각자 DB 연결을 쓰는지"""
+
+    def test_multiple_workers(self):
+        # 객체가 없는 작업은 워커가 조회 후 완료 처리한다 (작업마다 DB 왕복)
+        jobs = ImageJob.objects.bulk_create([
+            ImageJob(model_label='gallery.artwork', object_id=10000 + i, field_name='main_image', source_name=f'{i}.jpg')
+            for i in range(12)
+        ])
+        call_command('process_image_jobs', workers=2, batch=4, once=True, stdout=StringIO())
+        self.assertEqual(
+            set(ImageJob.objects.values_list('status', flat=True)), {ImageJob.STATUS_DONE},
+        )
+        # 부모 프로세스의 연결도 그대로 쓸 수 있다
+        self.assertEqual(ImageJob.objects.filter(pk__in=[job.pk for job in jobs]).count(), 12)
+
+    def test_worker_drops_inherited_connection(self):
+        from .management.commands.process_image_jobs import _init_worker
+        connection.ensure_connection()
+        inherited = connection.connection
+        _init_worker()
+        self.assertIsNone(connection.connection)
+        self.assertEqual(ImageJob.objects.count(), 0)
+        self.assertIsNot(connection.connection, inherited)
+        inherited.close()
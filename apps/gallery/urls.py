@@ -10,8 +10,12 @@ urlpatterns = [
     path('exhibitions/', views.exhibition_list, name='exhibition_list'),
     path('exhibitions/<slug:slug>/', views.exhibition_detail, name='exhibition_detail'),
     path('artworks/<int:pk>/', views.artwork_detail, name='artwork_detail'),
+    path('search/', views.search, name='search'),
     path('location/', views.location, name='location'),
     path('frame/', views.frame, name='frame'),
+
+    # 요청 시 리사이즈 이미지 (예: /media/r/600x600/artists/simple/a.jpg)
+    path('media/r/<int:width>x<int:height>/<path:path>', views.resized_image, name='resized_image'),
     
     # 관리 페이지 (Manage Views) - /manage/ prefix로 접근
     # Artists Management
@@ -33,6 +37,14 @@ urlpatterns = [
     path('manage/artworks/<int:pk>/edit/', views.artwork_edit, name='artwork_edit'),
     path('manage/artworks/<int:pk>/delete/', views.artwork_delete, name='artwork_delete'),
     
+    # 일괄 작업 (목록에서 선택한 항목)
+    path('manage/bulk/', views.manage_bulk, name='manage_bulk'),
+    
+    # 분할 업로드 (대용량 이미지)
+    path('manage/uploads/', views.chunked_upload_create, name='chunked_upload_create'),
+    path('manage/uploads/<uuid:pk>/', views.chunked_upload_detail, name='chunked_upload_detail'),
+    path('manage/uploads/<uuid:pk>/complete/', views.chunked_upload_complete, name='chunked_upload_complete'),
+    
     # 로그인/로그아웃
     path('manage/login/', views.manage_login, name='manage_login'),
     path('manage/logout/', views.manage_logout, name='manage_logout'),
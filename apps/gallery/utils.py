@@ -1,156 +1,496 @@
 from PIL import Image
+from contextlib import contextmanager
+import fcntl
+import hashlib
+import itertools
+import math
 import os
+import shutil
 from django.conf import settings
-from django.core.files.base import ContentFile
-from io import BytesIO
+from django.core.files.base import File
+import tempfile
+
+
+@contextmanager
+def allow_large_images():
+    """이 블록(데코레이터로 쓰면 그 함수) 동안 Pillow 픽셀 한도를 IMAGE_MAX_PIXELS로 올린다
+
+    직원 업로드 검증, 렌디션 작업, 직원이 올린 원본의 리사이즈용 - 그 밖의 이미지는
+    Pillow 기본 한도(약 89MP)로 압축 폭탄을 막는다. 한도는 프로세스 전역이므로 동기 워커 기준이다.
+    """
+    previous = Image.MAX_IMAGE_PIXELS
+    limit = getattr(settings, 'IMAGE_MAX_PIXELS', None)
+    if previous is not None and limit and limit > previous:
+        Image.MAX_IMAGE_PIXELS = limit
+    try:
+        yield
+    finally:
+        Image.MAX_IMAGE_PIXELS = previous
+
 
 class ImageOptimizer:
-    """이미지 최적화 유틸리티"""
-    
+    """이미지 최적화 유틸리티
+
+    원본은 한 번만 디코드하고(JPEG는 draft()로 축소 디코드),
+    모든 렌디션은 큰 크기부터 차례로 이전 결과를 축소해 만든다.
+    원본은 디스크 파일에서 읽고, 메모리에는 디코드된 비트맵 하나와
+    인코딩 버퍼 하나만 유지한다 (버퍼가 크면 임시 파일로 넘어간다).
+    """
+
     THUMBNAIL_SIZE = (300, 300)
     MEDIUM_SIZE = (800, 800)
     LARGE_SIZE = (1920, 1920)
-    
+
+    # 작품 이미지 기본 렌디션 (이름: 최대 크기, 품질, 저장 옵션)
+    RENDITIONS = {
+        'large': {'size': LARGE_SIZE, 'quality': 95, 'progressive': True},
+        'medium': {'size': MEDIUM_SIZE, 'quality': 90},
+        'thumbnail': {'size': THUMBNAIL_SIZE, 'quality': 85},
+    }
+
+    # 렌디션 파일명 접미사 ({원본}_{접미사}.{확장자})
+    RENDITION_SUFFIXES = {'thumbnail': 'thumb', 'medium': 'medium', 'large': 'large'}
+
+    # 출력 포맷 (선호 순서) - AVIF는 Pillow 빌드가 지원할 때만 사용
+    FORMATS = ['AVIF', 'WEBP', 'JPEG']
+    FORMAT_EXTENSIONS = {'JPEG': 'jpg', 'WEBP': 'webp', 'AVIF': 'avif'}
+    FORMAT_MIME_TYPES = {'JPEG': 'image/jpeg', 'WEBP': 'image/webp', 'AVIF': 'image/avif'}
+
+    # 포맷별 인코딩 옵션 (JPEG 품질은 렌디션 spec을 따름)
+    FORMAT_OPTIONS = {
+        'JPEG': {'optimize': True},
+        'WEBP': {'quality': 80, 'method': 4},
+        'AVIF': {'quality': 60, 'speed': 6},
+    }
+
+    # 반응형 이미지 너비 (너비, 접미사) - RENDITIONS에 있는 이름은 그 렌디션을 그대로 쓴다
+    RESPONSIVE_SIZES = [
+        (320, 'xs'),   # 모바일
+        (640, 'sm'),   # 태블릿
+        (1024, 'md'),  # 데스크탑
+        (1920, 'large'),  # 큰 화면
+    ]
+
+    # 플레이스홀더(blurhash) 성분 수와 계산에 쓰는 축소 크기
+    BLURHASH_COMPONENTS = (4, 3)
+    BLURHASH_SAMPLE_SIZE = (32, 32)
+    BASE83 = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~'
+
+    @staticmethod
+    def _fit(size, box):
+        """비율을 유지하며 box 안에 들어가는 크기 계산 (확대하지 않음)"""
+        width, height = size
+        ratio = min(box[0] / width, box[1] / height, 1)
+        return max(1, round(width * ratio)), max(1, round(height * ratio))
+
+    @staticmethod
+    def _to_rgb(img):
+        """RGBA/LA/P 등을 흰 배경의 RGB로 변환"""
+        if img.mode == 'RGB':
+            return img
+        if img.mode == 'P':
+            img = img.convert('RGBA')
+        if img.mode in ('RGBA', 'LA'):
+            background = Image.new('RGB', img.size, (255, 255, 255))
+            background.paste(img.convert('RGBA'), mask=img.getchannel('A'))
+            return background
+        return img.convert('RGB')
+
+    @staticmethod
+    def _open(image_file):
+        """헤더만 읽은 (아직 디코드하지 않은) 이미지"""
+        if hasattr(image_file, 'seek'):
+            image_file.seek(0)
+        return Image.open(image_file)
+
+    @classmethod
+    def decode(cls, image_file, box=None):
+        """원본을 한 번만 디코드
+
+        box가 주어지면 JPEG는 draft()로 box 이상이 보장되는
+        가장 작은 배율(1/2, 1/4, 1/8)로 디코드한다.
+        """
+        img = cls._open(image_file)
+        if box:
+            img.draft('RGB', cls._fit(img.size, box))
+        img.load()
+        rgb = cls._to_rgb(img)
+        if rgb is not img:
+            img.close()
+        return rgb
+
+    @classmethod
+    def output_formats(cls):
+        """현재 Pillow 빌드로 저장 가능한 출력 포맷 (선호 순서)"""
+        Image.init()
+        return [fmt for fmt in cls.FORMATS if fmt in Image.SAVE]
+
+    @classmethod
+    def best_format(cls, accept):
+        """Accept 헤더에서 브라우저가 받을 수 있는 가장 좋은 포맷 선택"""
+        accept = accept or ''
+        for fmt in cls.output_formats():
+            if fmt == 'JPEG' or cls.FORMAT_MIME_TYPES[fmt] in accept:
+                return fmt
+        return 'JPEG'
+
+    @classmethod
+    def with_formats(cls, specs, formats=None):
+        """spec마다 출력 포맷별 spec을 만든다 - 결과 키: (이름, 포맷)"""
+        result = {}
+        for name, spec in specs.items():
+            for fmt in formats or cls.output_formats():
+                if fmt == 'JPEG':
+                    result[(name, fmt)] = dict(spec, format=fmt)
+                else:
+                    result[(name, fmt)] = {'size': spec['size'], 'format': fmt}
+        return result
+
+    @classmethod
+    def encode(cls, img, quality=85, format='JPEG', **options):
+        """지정한 포맷으로 인코딩해 File 반환
+
+        결과는 SpooledTemporaryFile에 쓰므로 IMAGE_SPOOL_MAX_MEMORY_SIZE를
+        넘으면 디스크로 넘어가고, 스토리지에는 복사 없이 청크 단위로 저장된다.
+        사용 후 close()해야 한다.
+        """
+        save_options = dict(cls.FORMAT_OPTIONS.get(format, {}))
+        if format == 'JPEG':
+            save_options['quality'] = quality
+        save_options.update(options)
+
+        max_size = getattr(settings, 'IMAGE_SPOOL_MAX_MEMORY_SIZE', 5 * 1024 * 1024)
+        output = tempfile.SpooledTemporaryFile(max_size=max_size, dir=settings.FILE_UPLOAD_TEMP_DIR)
+        img.save(output, format=format, **save_options)
+        output.seek(0)
+        return File(output)
+
+    @classmethod
+    def render(cls, image_file, specs):
+        """한 번의 디코드로 여러 렌디션 생성 - 결과: {이름: File}
+
+        결과를 모두 들고 있으므로 작은 렌디션 몇 개에만 쓰고,
+        대량 생성은 iter_render()로 하나씩 저장한다.
+        """
+        return dict(cls.iter_render(image_file, specs))
+
+    @classmethod
+    def iter_render(cls, image_file, specs):
+        """한 번의 디코드로 렌디션을 하나씩 생성하는 제너레이터
+
+        specs: {이름: {'size': (w, h), 'quality': q, 'format': 'JPEG', ...}}
+        나머지 키는 Image.save() 옵션으로 전달된다.
+        크기가 같은 spec(포맷만 다른 경우)은 같은 비트맵을 다시 인코딩만 한다.
+        (이름, File)을 내보내며, 다음 항목을 요청하기 전에 이전 File을
+        저장하고 닫으면 인코딩 버퍼가 하나만 유지된다.
+        """
+        if not specs:
+            return
+
+        # 원본 크기 기준 목표 크기를 계산하고 큰 것부터 처리해야
+        # 이전 결과를 다시 축소할 수 있다 (비율이 같으므로 면적 순 = 크기 순)
+        original_size = cls._open(image_file).size
+        targets = {name: cls._fit(original_size, spec['size']) for name, spec in specs.items()}
+        ordered = sorted(specs.items(), key=lambda item: targets[item[0]][0] * targets[item[0]][1], reverse=True)
+
+        current = cls.decode(image_file, targets[ordered[0][0]])
+        try:
+            for name, spec in ordered:
+                options = dict(spec)
+                options.pop('size')
+                quality = options.pop('quality', 85)
+
+                target = targets[name]
+                if target != current.size:
+                    # 이전 비트맵은 바로 해제해 한 번에 하나만 유지
+                    resized = current.resize(target, Image.Resampling.LANCZOS)
+                    current.close()
+                    current = resized
+                yield name, cls.encode(current, quality, **options)
+        finally:
+            current.close()
+
     @classmethod
     def create_thumbnail(cls, image_file, quality=85):
         """썸네일 생성"""
-        img = Image.open(image_file)
-        
-        # RGBA를 RGB로 변환
-        if img.mode in ('RGBA', 'LA', 'P'):
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            if img.mode == 'P':
-                img = img.convert('RGBA')
-            background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-            img = background
-        
-        # 썸네일 생성
-        img.thumbnail(cls.THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
-        
-        # BytesIO에 저장
-        output = BytesIO()
-        img.save(output, format='JPEG', quality=quality, optimize=True)
-        output.seek(0)
-        
-        return ContentFile(output.read())
-    
+        spec = {'size': cls.THUMBNAIL_SIZE, 'quality': quality}
+        return cls.render(image_file, {'thumbnail': spec})['thumbnail']
+
     @classmethod
     def create_medium(cls, image_file, quality=90):
         """중간 크기 이미지 생성"""
-        img = Image.open(image_file)
-        
-        # RGBA를 RGB로 변환
-        if img.mode in ('RGBA', 'LA', 'P'):
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            if img.mode == 'P':
-                img = img.convert('RGBA')
-            background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-            img = background
-        
-        # 리사이즈
-        img.thumbnail(cls.MEDIUM_SIZE, Image.Resampling.LANCZOS)
-        
-        # BytesIO에 저장
-        output = BytesIO()
-        img.save(output, format='JPEG', quality=quality, optimize=True)
-        output.seek(0)
-        
-        return ContentFile(output.read())
-    
+        spec = {'size': cls.MEDIUM_SIZE, 'quality': quality}
+        return cls.render(image_file, {'medium': spec})['medium']
+
     @classmethod
     def optimize_large(cls, image_file, quality=95):
         """큰 이미지 최적화"""
-        img = Image.open(image_file)
-        
-        # RGBA를 RGB로 변환
-        if img.mode in ('RGBA', 'LA', 'P'):
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            if img.mode == 'P':
-                img = img.convert('RGBA')
-            background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-            img = background
-        
-        # 너무 큰 이미지만 리사이즈
-        if img.width > cls.LARGE_SIZE[0] or img.height > cls.LARGE_SIZE[1]:
-            img.thumbnail(cls.LARGE_SIZE, Image.Resampling.LANCZOS)
-        
-        # BytesIO에 저장
-        output = BytesIO()
-        img.save(output, format='JPEG', quality=quality, optimize=True, progressive=True)
-        output.seek(0)
-        
-        return ContentFile(output.read())
-    
+        spec = {'size': cls.LARGE_SIZE, 'quality': quality, 'progressive': True}
+        return cls.render(image_file, {'large': spec})['large']
+
+    @classmethod
+    def rendition_name(cls, name, rendition, format='JPEG'):
+        """원본 파일명 옆에 놓일 렌디션 파일명"""
+        base_name = os.path.splitext(name)[0]
+        suffix = cls.RENDITION_SUFFIXES.get(rendition, rendition)
+        return f"{base_name}_{suffix}.{cls.FORMAT_EXTENSIONS[format]}"
+
     @classmethod
     def get_image_dimensions(cls, image_file):
         """이미지 크기 반환"""
         img = Image.open(image_file)
         return img.width, img.height
-    
+
+    @staticmethod
+    def _srgb_to_linear(value):
+        v = value / 255
+        return v / 12.92 if v <= 0.04045 else ((v + 0.055) / 1.055) ** 2.4
+
+    @staticmethod
+    def _linear_to_srgb(value):
+        v = max(0.0, min(1.0, value))
+        if v <= 0.0031308:
+            return int(v * 12.92 * 255 + 0.5)
+        return int((1.055 * v ** (1 / 2.4) - 0.055) * 255 + 0.5)
+
+    @staticmethod
+    def _sign_pow(value, exp):
+        return math.copysign(abs(value) ** exp, value)
+
+    @classmethod
+    def _encode83(cls, value, length):
+        return ''.join(cls.BASE83[value // 83 ** (length - i) % 83] for i in range(1, length + 1))
+
+    @classmethod
+    def _decode83(cls, text):
+        value = 0
+        for char in text:
+            value = value * 83 + cls.BASE83.index(char)
+        return value
+
+    @classmethod
+    def dominant_color(cls, img):
+        """가장 넓은 면적을 차지하는 색 (#rrggbb)"""
+        small = cls._to_rgb(img).resize((64, 64), Image.Resampling.BILINEAR)
+        quantized = small.quantize(colors=8, method=Image.Quantize.MEDIANCUT)
+        _, index = max(quantized.getcolors())
+        r, g, b = quantized.getpalette()[index * 3:index * 3 + 3]
+        return f'#{r:02x}{g:02x}{b:02x}'
+
+    @classmethod
+    def blurhash(cls, img, components=None):
+        """blurhash 문자열 (https://blurha.sh) - 작게 축소한 뒤 계산"""
+        nx, ny = components or cls.BLURHASH_COMPONENTS
+        sample = cls._to_rgb(img).resize(cls.BLURHASH_SAMPLE_SIZE, Image.Resampling.BILINEAR)
+        width, height = sample.size
+        table = [cls._srgb_to_linear(v) for v in range(256)]
+        pixels = [(table[r], table[g], table[b]) for r, g, b in sample.getdata()]
+        cos_x = [[math.cos(math.pi * i * x / width) for x in range(width)] for i in range(nx)]
+        cos_y = [[math.cos(math.pi * j * y / height) for y in range(height)] for j in range(ny)]
+
+        factors = []
+        for j in range(ny):
+            for i in range(nx):
+                r = g = b = 0.0
+                for y in range(height):
+                    cy = cos_y[j][y]
+                    row = pixels[y * width:(y + 1) * width]
+                    for x, (pr, pg, pb) in enumerate(row):
+                        basis = cos_x[i][x] * cy
+                        r += basis * pr
+                        g += basis * pg
+                        b += basis * pb
+                scale = (1 if i == j == 0 else 2) / (width * height)
+                factors.append((r * scale, g * scale, b * scale))
+
+        dc, ac = factors[0], factors[1:]
+        result = cls._encode83((nx - 1) + (ny - 1) * 9, 1)
+        if ac:
+            actual_max = max(abs(v) for factor in ac for v in factor)
+            quantised_max = max(0, min(82, int(actual_max * 166 - 0.5)))
+            max_value = (quantised_max + 1) / 166
+            result += cls._encode83(quantised_max, 1)
+        else:
+            max_value = 1
+            result += cls._encode83(0, 1)
+
+        r, g, b = (cls._linear_to_srgb(v) for v in dc)
+        result += cls._encode83((r << 16) + (g << 8) + b, 4)
+        for factor in ac:
+            qr, qg, qb = (
+                max(0, min(18, int(cls._sign_pow(v / max_value, 0.5) * 9 + 9.5))) for v in factor
+            )
+            result += cls._encode83(qr * 19 * 19 + qg * 19 + qb, 2)
+        return result
+
+    @classmethod
+    def blurhash_image(cls, blurhash, size=(8, 8)):
+        """blurhash를 작은 RGB 이미지로 복원 (플레이스홀더용)"""
+        size_flag = cls._decode83(blurhash[0])
+        nx, ny = size_flag % 9 + 1, size_flag // 9 + 1
+        max_value = (cls._decode83(blurhash[1]) + 1) / 166
+
+        dc = cls._decode83(blurhash[2:6])
+        colors = [tuple(cls._srgb_to_linear(v) for v in (dc >> 16, (dc >> 8) & 255, dc & 255))]
+        for k in range(1, nx * ny):
+            value = cls._decode83(blurhash[4 + k * 2:6 + k * 2])
+            colors.append(tuple(
+                cls._sign_pow((q - 9) / 9, 2) * max_value
+                for q in (value // 361, value // 19 % 19, value % 19)
+            ))
+
+        width, height = size
+        data = []
+        for y in range(height):
+            for x in range(width):
+                r = g = b = 0.0
+                for j in range(ny):
+                    for i in range(nx):
+                        basis = math.cos(math.pi * x * i / width) * math.cos(math.pi * y * j / height)
+                        cr, cg, cb = colors[i + j * nx]
+                        r += cr * basis
+                        g += cg * basis
+                        b += cb * basis
+                data.append((cls._linear_to_srgb(r), cls._linear_to_srgb(g), cls._linear_to_srgb(b)))
+        img = Image.new('RGB', size)
+        img.putdata(data)
+        return img
+
+    @classmethod
+    def describe(cls, image_file):
+        """레이아웃/플레이스홀더용 색 정보 (작은 렌디션에서 계산)
+
+        반환값: {'color': '#rrggbb', 'blurhash': '...'}
+        """
+        with cls._open(image_file) as img:
+            img.draft('RGB', (64, 64))
+            rgb = cls._to_rgb(img)
+            return {'color': cls.dominant_color(rgb), 'blurhash': cls.blurhash(rgb)}
+
     @classmethod
     def process_artwork_image(cls, artwork_image):
-        """작품 이미지 처리 - 3가지 버전 생성"""
+        """작품 이미지 처리 - 3가지 버전을 한 번의 디코드로 생성"""
         original = artwork_image.image.file
-        
-        # 파일명 생성
-        base_name = os.path.splitext(artwork_image.image.name)[0]
-        
-        # 썸네일 생성
-        thumbnail = cls.create_thumbnail(original)
-        thumbnail_name = f"{base_name}_thumb.jpg"
-        
-        # 중간 크기 생성
-        original.seek(0)  # 파일 포인터 리셋
-        medium = cls.create_medium(original)
-        medium_name = f"{base_name}_medium.jpg"
-        
-        # 큰 이미지 최적화
-        original.seek(0)  # 파일 포인터 리셋
-        large = cls.optimize_large(original)
-        large_name = f"{base_name}_large.jpg"
-        
+        name = artwork_image.image.name
+
+        renditions = cls.render(original, cls.RENDITIONS)
         return {
-            'thumbnail': (thumbnail_name, thumbnail),
-            'medium': (medium_name, medium),
-            'large': (large_name, large)
+            rendition: (cls.rendition_name(name, rendition), content)
+            for rendition, content in renditions.items()
         }
-    
+
+    @classmethod
+    def responsive_specs(cls, original_width):
+        """반응형 렌디션 spec (원본보다 큰 사이즈와 RENDITIONS로 이미 만드는 이름은 건너뛰고,
+        높이는 너비 비율을 따름)"""
+        return {
+            suffix: {'size': (width, 1 << 16), 'quality': 85}
+            for width, suffix in cls.RESPONSIVE_SIZES
+            if width <= original_width and suffix not in cls.RENDITIONS
+        }
+
     @classmethod
     def create_responsive_set(cls, image_file):
-        """반응형 이미지 세트 생성"""
-        sizes = [
-            (320, 'xs'),   # 모바일
-            (640, 'sm'),   # 태블릿
-            (1024, 'md'),  # 데스크탑
-            (1920, 'lg'),  # 큰 화면
-        ]
-        
-        result = {}
-        img = Image.open(image_file)
-        
-        # RGBA를 RGB로 변환
-        if img.mode in ('RGBA', 'LA', 'P'):
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            if img.mode == 'P':
-                img = img.convert('RGBA')
-            background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-            img = background
-        
-        for width, suffix in sizes:
-            # 원본보다 큰 사이즈는 건너뛰기
-            if width > img.width:
-                continue
-            
-            # 비율 유지하며 리사이즈
-            ratio = width / img.width
-            height = int(img.height * ratio)
-            
-            resized = img.resize((width, height), Image.Resampling.LANCZOS)
-            
-            output = BytesIO()
-            resized.save(output, format='JPEG', quality=85, optimize=True)
-            output.seek(0)
-            
-            result[suffix] = ContentFile(output.read())
-        
-        return result
\ No newline at end of file
+        """반응형 이미지 세트 생성
+
+        결과 키(xs/sm/md)는 rendition_name()의 접미사로 그대로 쓰인다.
+        가장 큰 너비는 기본 'large' 렌디션을 쓰므로 여기서 만들지 않는다.
+        """
+        original_width = cls._open(image_file).width
+        return cls.render(image_file, cls.responsive_specs(original_width))
+
+
+class RenditionCache:
+    """요청 시 만드는 리사이즈 이미지의 디스크 캐시
+
+    키는 (원본 경로, 원본 수정시각/크기, 목표 크기, 포맷)의 해시이므로
+    원본이 바뀌면 자연히 새 키가 된다. 용량 검사는 디렉터리 전체를 훑으므로
+    새 파일 evict_every개마다 한 번 하고, max_bytes를 넘으면 가장 오래
+    사용되지 않은 파일(mtime 기준)부터 삭제한다.
+    """
+
+    # 프로세스의 새 파일 수 (용량 검사 주기)
+    _writes = itertools.count(1)
+
+    def __init__(self, root=None, max_bytes=None, evict_every=None):
+        self.root = root or getattr(settings, 'RENDITION_CACHE_DIR', os.path.join(settings.BASE_DIR, 'cache', 'renditions'))
+        self.max_bytes = max_bytes or getattr(settings, 'RENDITION_CACHE_MAX_BYTES', 2 * 1024 ** 3)
+        self.evict_every = evict_every or getattr(settings, 'RENDITION_CACHE_EVICT_EVERY', 100)
+
+    @staticmethod
+    def allowed_size(width, height):
+        """설정(RENDITION_SIZES)에 등록된 크기인지 - 임의 크기로 리사이즈를 강제하지 못하게"""
+        return (width, height) in {tuple(size) for size in getattr(settings, 'RENDITION_SIZES', ())}
+
+    def key(self, source_path, width, height, format):
+        stat = os.stat(source_path)
+        raw = f'{source_path}|{stat.st_mtime_ns}|{stat.st_size}|{width}x{height}|{format}'
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def path(self, key, format):
+        ext = ImageOptimizer.FORMAT_EXTENSIONS[format]
+        return os.path.join(self.root, key[:2], f'{key}.{ext}')
+
+    def get_or_create(self, source_path, width, height, format='JPEG'):
+        """캐시된 파일 경로와 키 반환 - 없으면 한 번만 생성"""
+        key = self.key(source_path, width, height, format)
+        path = self.path(key, format)
+        if os.path.exists(path):
+            os.utime(path)  # LRU 갱신
+            return path, key
+
+        shard = os.path.dirname(path)
+        os.makedirs(shard, exist_ok=True)
+        # 여러 워커가 같은 키를 동시에 요청해도 리사이즈는 한 번만
+        # 잠금 파일은 샤드(키 앞 2자리)마다 하나로 고정하고 지우지 않는다
+        # (지우면 대기 중인 워커와 새로 연 워커가 서로 다른 파일을 잠글 수 있다)
+        with open(os.path.join(shard, '.lock'), 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                # 잠금을 기다리는 동안 다른 워커가 만들었으면 그대로 사용
+                if os.path.exists(path):
+                    return path, key
+                specs = ImageOptimizer.with_formats({'r': {'size': (width, height), 'quality': 85}}, [format])
+                with open(source_path, 'rb') as original:
+                    content = ImageOptimizer.render(original, specs)[('r', format)]
+                tmp_path = f'{path}.tmp'
+                with content, open(tmp_path, 'wb') as output:
+                    shutil.copyfileobj(content, output)
+                os.replace(tmp_path, path)
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+        if next(self._writes) % self.evict_every == 0:
+            self.evict()
+        return path, key
+
+    def evict(self):
+        """용량 초과 시 오래 사용되지 않은 파일부터 삭제 (목표: 90%)"""
+        entries = []
+        total = 0
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if filename.endswith(('.lock', '.tmp')):
+                    continue
+                full_path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(full_path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, full_path))
+                total += stat.st_size
+
+        if total <= self.max_bytes:
+            return 0
+
+        removed = 0
+        target = self.max_bytes * 0.9
+        for _, size, full_path in sorted(entries):
+            if total <= target:
+                break
+            try:
+                os.unlink(full_path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        return removed
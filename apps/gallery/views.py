@@ -1,32 +1,88 @@
+import json
+import os
+from datetime import timedelta
+from django.conf import settings
 from django.shortcuts import render, get_object_or_404, redirect
-from django.core.paginator import Paginator
+from django.core.exceptions import SuspiciousFileOperation, ValidationError
 from django.contrib import messages
-from django.http import JsonResponse
-from django.views.decorators.http import require_POST
+from django.http import FileResponse, Http404, JsonResponse
+from django.urls import reverse
+from django.utils._os import safe_join
+from django.db import transaction
+from django.db.models import Count, OuterRef, Prefetch, Subquery
+from django.db.models.functions import Coalesce
+from django.views.decorators.http import require_POST, require_http_methods, etag
+from django.views.decorators.vary import vary_on_headers
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib.auth import authenticate, login, logout
-from .models import Artist, Exhibition, Artwork, CurrentExhibition, SimpleArtist
+from PIL import Image, UnidentifiedImageError
+from apps.core.cache import cache_public_page, conditional_on_updated
+from apps.core.pagination import KeysetPaginator
+from .models import Artist, Exhibition, Artwork, ArtworkImage, CurrentExhibition, SimpleArtist, ChunkedUpload, UploadConflict
 from .forms import ArtistForm, ExhibitionForm, ArtworkForm, CurrentExhibitionForm, SimpleArtistForm
+from .utils import ImageOptimizer, RenditionCache, allow_large_images
+from . import bulk, current
+from .stats import dashboard_context
+from .search import ARTIST_LABEL, ARTWORK_LABEL, EXHIBITION_LABEL, ranked_search, search_artworks
 
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp', '.tif', '.tiff')
+
+def _count_subquery(queryset, field):
+    """OuterRef('pk')별 행 수 서브쿼리 (없으면 0)"""
+    counts = queryset.filter(**{field: OuterRef('pk')}).order_by().values(field).annotate(count=Count('pk')).values('count')
+    return Coalesce(Subquery(counts), 0)
+
+@cache_public_page
 def artist_list(request):
-    """작가 목록"""
-    artists = Artist.objects.filter(is_active=True).prefetch_related('artworks').order_by('display_order', 'name')
-    
-    # 전속작가와 일반작가 분리
-    exclusive_artists = artists.filter(is_exclusive=True)
-    regular_artists = artists.filter(is_exclusive=False)
-    
+    """작가 목록
+
+    작가 1쿼리 + 대표 작품 1쿼리로 끝난다 (작가 수와 무관).
+    게시된 작품/전시 수는 서브쿼리로 함께 가져오고, 대표 작품은
+    작가별 첫 번째 게시 작품만 필요한 컬럼으로 prefetch 한다.
+    """
+    cover = Artwork.objects.filter(is_published=True).only(
+        'id', 'artist_id', 'title', 'year', 'main_image', 'main_image_width', 'main_image_height', 'image_meta',
+    ).order_by('display_order', '-created_at')[:1]
+
+    artists = (
+        Artist.objects.filter(is_active=True)
+        .only('id', 'name', 'name_en', 'bio', 'profile_image', 'is_exclusive', 'display_order')
+        .annotate(
+            artwork_count=_count_subquery(Artwork.objects.filter(is_published=True), 'artist'),
+            exhibition_count=_count_subquery(Exhibition.objects.filter(is_published=True), 'artists'),
+        )
+        .prefetch_related(Prefetch('artworks', queryset=cover, to_attr='cover_artworks'))
+        .order_by('display_order', 'name')
+    )
+
+    # 전속작가와 일반작가 분리 (쿼리 한 번의 결과를 나눔)
+    exclusive_artists = []
+    regular_artists = []
+    for artist in artists:
+        artist.cover_artwork = artist.cover_artworks[0] if artist.cover_artworks else None
+        (exclusive_artists if artist.is_exclusive else regular_artists).append(artist)
+
     context = {
         'exclusive_artists': exclusive_artists,
         'regular_artists': regular_artists,
     }
     return render(request, 'gallery/artist_list.html', context)
 
+@conditional_on_updated(lambda pk: [
+    Artist.objects.filter(pk=pk),
+    Artwork.objects.filter(artist_id=pk),
+    Exhibition.objects.filter(artists=pk),
+])
 def artist_detail(request, pk):
-    """작가 상세"""
+    """작가 상세 (작가/작품/전시 각 1쿼리, 작품 수와 무관)"""
     artist = get_object_or_404(Artist, pk=pk, is_active=True)
-    artworks = artist.artworks.filter(is_published=True).order_by('display_order', '-created_at')
-    exhibitions = artist.exhibitions.filter(is_published=True).order_by('-start_date')
+    artworks = artist.artworks.filter(is_published=True).only(
+        'id', 'artist_id', 'title', 'title_en', 'year', 'medium', 'size', 'price',
+        'description', 'main_image', 'main_image_width', 'main_image_height', 'image_meta',
+    ).order_by('display_order', '-created_at')
+    exhibitions = artist.exhibitions.filter(is_published=True).only(
+        'id', 'slug', 'title', 'title_en', 'start_date', 'end_date', 'description',
+    ).order_by('-start_date')
     
     context = {
         'artist': artist,
@@ -35,6 +91,7 @@ def artist_detail(request, pk):
     }
     return render(request, 'gallery/artist_detail.html', context)
 
+@cache_public_page
 def exhibition_list(request):
     """전시 목록"""
     from datetime import date
@@ -52,6 +109,13 @@ def exhibition_list(request):
     }
     return render(request, 'gallery/exhibition_list.html', context)
 
+@conditional_on_updated(lambda slug: [
+    Exhibition.objects.filter(slug=slug),
+    Artwork.objects.filter(exhibitions__slug=slug),
+    Artist.objects.filter(exhibitions__slug=slug),
+    Artist.objects.filter(artworks__exhibitions__slug=slug),
+])
+@cache_public_page
 def exhibition_detail(request, slug):
     """전시 상세"""
     exhibition = get_object_or_404(Exhibition, slug=slug, is_published=True)
@@ -63,20 +127,119 @@ def exhibition_detail(request, slug):
     }
     return render(request, 'gallery/exhibition_detail.html', context)
 
+@conditional_on_updated(lambda pk: [
+    Artwork.objects.filter(pk=pk),
+    Artist.objects.filter(artworks=pk),
+    Artwork.objects.filter(artist__artworks=pk).exclude(pk=pk),
+    ArtworkImage.objects.filter(artwork_id=pk),
+])
 def artwork_detail(request, pk):
-    """작품 상세"""
-    artwork = get_object_or_404(Artwork, pk=pk, is_published=True)
+    """작품 상세 (작품+작가 1쿼리, 추가 이미지 1쿼리, 다른 작품 1쿼리)"""
+    artwork = get_object_or_404(
+        Artwork.objects.select_related('artist').only(
+            'id', 'title', 'title_en', 'year', 'medium', 'size', 'edition', 'price',
+            'description', 'main_image', 'main_image_width', 'main_image_height', 'image_meta',
+            'artist__id', 'artist__name', 'artist__name_en', 'artist__profile_image',
+        ).prefetch_related(
+            Prefetch('additional_images', queryset=ArtworkImage.objects.only('id', 'artwork_id', 'image', 'image_width', 'image_height', 'image_meta', 'order')),
+        ),
+        pk=pk, is_published=True,
+    )
     related_artworks = Artwork.objects.filter(
-        artist=artwork.artist,
+        artist_id=artwork.artist_id,
         is_published=True
-    ).exclude(pk=pk)[:4]
-    
+    ).exclude(pk=pk).only('id', 'title', 'year', 'main_image', 'main_image_width', 'main_image_height', 'image_meta')[:4]
+
+    # 메인 이미지 + 추가 이미지 (캐러셀)
+    images = [image for image in [artwork.main_image, *(extra.image for extra in artwork.additional_images.all())] if image]
+
     context = {
         'artwork': artwork,
+        'images': images,
         'related_artworks': related_artworks,
     }
     return render(request, 'gallery/artwork_detail.html', context)
 
+# 검색어마다 캐시 항목이 생기므로 페이지 캐시를 쓰지 않는다 (XHR이면 JSON, 아니면 HTML)
+@vary_on_headers('X-Requested-With')
+def search(request):
+    """통합 검색 - 작가/전시/작품을 점수순으로 (오타 허용)"""
+    query = request.GET.get('q', '').strip()[:100]
+    results = ranked_search(query) if query else {}
+    artists = results.get(ARTIST_LABEL, [])
+    exhibitions = results.get(EXHIBITION_LABEL, [])
+    artworks = results.get(ARTWORK_LABEL, [])
+
+    if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        return JsonResponse({
+            'success': True,
+            'query': query,
+            'artists': [
+                {'id': artist.pk, 'name': artist.name, 'url': reverse('gallery:artist_detail', args=[artist.pk])}
+                for artist in artists
+            ],
+            'exhibitions': [
+                {'id': exhibition.pk, 'title': exhibition.title, 'url': reverse('gallery:exhibition_detail', args=[exhibition.slug])}
+                for exhibition in exhibitions
+            ],
+            'artworks': [
+                {
+                    'id': artwork.pk, 'title': artwork.title, 'artist': artwork.artist.name,
+                    'url': reverse('gallery:artwork_detail', args=[artwork.pk]),
+                }
+                for artwork in artworks
+            ],
+        })
+
+    context = {
+        'query': query,
+        'artists': artists,
+        'exhibitions': exhibitions,
+        'artworks': artworks,
+        'total': len(artists) + len(exhibitions) + len(artworks),
+    }
+    return render(request, 'gallery/search.html', context)
+
+def _media_image_path(path):
+    """MEDIA_ROOT 안의 이미지 파일 경로 (없거나 범위를 벗어나면 None)"""
+    try:
+        source_path = safe_join(settings.MEDIA_ROOT, path)
+    except SuspiciousFileOperation:
+        return None
+    if not source_path.lower().endswith(IMAGE_EXTENSIONS) or not os.path.isfile(source_path):
+        return None
+    return source_path
+
+def _resized_image_etag(request, width, height, path):
+    source_path = _media_image_path(path)
+    if source_path is None or not RenditionCache.allowed_size(width, height):
+        return None
+    fmt = ImageOptimizer.best_format(request.headers.get('Accept'))
+    return RenditionCache().key(source_path, width, height, fmt)
+
+@vary_on_headers('Accept')
+@etag(_resized_image_etag)
+def resized_image(request, width, height, path):
+    """요청한 크기에 맞춘 미디어 이미지 (최초 요청 시 한 번만 리사이즈 후 캐시)"""
+    if not RenditionCache.allowed_size(width, height):
+        raise Http404('지원하지 않는 이미지 크기입니다.')
+
+    source_path = _media_image_path(path)
+    if source_path is None:
+        raise Http404('이미지를 찾을 수 없습니다.')
+
+    fmt = ImageOptimizer.best_format(request.headers.get('Accept'))
+    try:
+        # 원본은 직원 업로드이고 크기는 RENDITION_SIZES로 제한되므로 업로드 때와 같은 한도 적용
+        with allow_large_images():
+            cache_path, _ = RenditionCache().get_or_create(source_path, width, height, fmt)
+    except (Image.DecompressionBombError, UnidentifiedImageError):
+        raise Http404('이미지를 열 수 없습니다.')
+
+    response = FileResponse(open(cache_path, 'rb'), content_type=ImageOptimizer.FORMAT_MIME_TYPES[fmt])
+    response['Cache-Control'] = 'public, max-age=86400'
+    return response
+
 def location(request):
     """오시는길"""
     return render(request, 'gallery/location.html')
@@ -115,24 +278,127 @@ def manage_logout(request):
 @login_required(login_url='/manage/login/')
 def admin_dashboard(request):
     """관리자 대시보드"""
-    context = {
-        'total_artists': Artist.objects.count(),
-        'total_exhibitions': Exhibition.objects.count(),
-        'total_artworks': Artwork.objects.count(),
-        'recent_artists': Artist.objects.order_by('-created_at')[:6],
-        'recent_exhibitions': Exhibition.objects.order_by('-created_at')[:5],
-        'current_exhibitions': Exhibition.objects.filter(is_current=True),
-    }
-    return render(request, 'admin/gallery_dashboard.html', context)
+    return render(request, 'admin/gallery_dashboard.html', dashboard_context())
+
+@login_required(login_url='/manage/login/')
+@require_POST
+def manage_bulk(request):
+    """관리 목록 일괄 작업 (JSON) - {"model", "operation", "ids", ...}"""
+    try:
+        data = json.loads(request.body or '{}')
+    except ValueError:
+        return JsonResponse({'success': False, 'message': 'JSON 형식의 요청이 아닙니다.'}, status=400)
+    try:
+        count, message = bulk.apply(data)
+    except ValueError as e:
+        return JsonResponse({'success': False, 'message': str(e)}, status=400)
+    return JsonResponse({'success': True, 'message': message, 'count': count})
+
+# 분할 업로드 (재개 가능, tus 방식)
+# 1) POST   /manage/uploads/                -> 업로드 생성 (filename, size)
+# 2) PATCH  /manage/uploads/<id>/           -> Upload-Offset 헤더 위치부터 조각 전송
+#    HEAD   /manage/uploads/<id>/           -> 끊긴 뒤 이어 보낼 위치 확인
+# 3) POST   /manage/uploads/<id>/complete/  -> 검증 후 완료
+# 4) 작품/작가 폼에 <필드명>_upload=<id>로 제출하면 업로드 파일로 처리
+def _upload_response(upload, status=200):
+    response = JsonResponse({
+        'id': str(upload.pk),
+        'offset': upload.offset,
+        'size': upload.size,
+        'status': upload.status,
+    }, status=status)
+    response['Upload-Offset'] = str(upload.offset)
+    response['Upload-Length'] = str(upload.size)
+    return response
+
+@login_required(login_url='/manage/login/')
+@require_POST
+def chunked_upload_create(request):
+    """분할 업로드 생성"""
+    try:
+        data = json.loads(request.body or '{}')
+        filename = os.path.basename(str(data['filename']))
+        size = int(data['size'])
+    except (ValueError, KeyError, TypeError):
+        return JsonResponse({'success': False, 'message': 'filename과 size가 필요합니다.'}, status=400)
+
+    if not filename.lower().endswith(IMAGE_EXTENSIONS):
+        return JsonResponse({'success': False, 'message': '이미지 파일만 업로드할 수 있습니다.'}, status=400)
+    if not 0 < size <= settings.CHUNKED_UPLOAD_MAX_SIZE:
+        return JsonResponse({'success': False, 'message': '허용되지 않는 파일 크기입니다.'}, status=413)
+
+    ChunkedUpload.purge_expired(timedelta(hours=settings.CHUNKED_UPLOAD_EXPIRE_HOURS))
+    upload = ChunkedUpload.objects.create(
+        user=request.user,
+        filename=filename,
+        content_type=str(data.get('content_type', ''))[:100],
+        size=size,
+    )
+    return _upload_response(upload, status=201)
+
+@login_required(login_url='/manage/login/')
+@require_http_methods(['GET', 'HEAD', 'PATCH'])
+def chunked_upload_detail(request, pk):
+    """업로드 상태 조회 / 조각 전송"""
+    if request.method != 'PATCH':
+        upload = get_object_or_404(ChunkedUpload, pk=pk, user=request.user)
+        return _upload_response(upload)
+
+    # 행 잠금은 위치 확인에만 - 본문은 잠금 밖에서 받고 append()가 저장 전에 다시 확인
+    with transaction.atomic():
+        upload = get_object_or_404(ChunkedUpload.objects.select_for_update(), pk=pk, user=request.user)
+        if upload.status != ChunkedUpload.STATUS_UPLOADING:
+            return _upload_response(upload, status=409)
+        if request.headers.get('Upload-Offset') != str(upload.offset):
+            # 클라이언트는 응답의 Upload-Offset부터 다시 보내면 된다
+            return _upload_response(upload, status=409)
+    try:
+        upload.append(request)
+    except UploadConflict:
+        upload = get_object_or_404(ChunkedUpload, pk=pk, user=request.user)
+        return _upload_response(upload, status=409)
+    except ValueError as e:
+        return JsonResponse({'success': False, 'message': str(e)}, status=413)
+    return _upload_response(upload)
+
+@login_required(login_url='/manage/login/')
+@require_POST
+@allow_large_images()
+def chunked_upload_complete(request, pk):
+    """모든 조각 수신 확인 및 이미지 검증"""
+    upload = get_object_or_404(ChunkedUpload, pk=pk, user=request.user)
+    if upload.status != ChunkedUpload.STATUS_COMPLETE:
+        try:
+            upload.complete()
+        except Exception as e:
+            return JsonResponse({'success': False, 'message': f'업로드를 완료할 수 없습니다: {e}'}, status=400)
+    return _upload_response(upload)
+
+def _files_with_chunked_uploads(request):
+    """<필드명>_upload로 전달된 완료된 분할 업로드를 request.FILES에 합침"""
+    files = request.FILES.copy()
+    uploads = []
+    for key, value in request.POST.items():
+        if not key.endswith('_upload') or not value:
+            continue
+        try:
+            upload = ChunkedUpload.objects.get(pk=value, user=request.user, status=ChunkedUpload.STATUS_COMPLETE)
+        except (ChunkedUpload.DoesNotExist, ValidationError):
+            continue
+        files[key[:-len('_upload')]] = upload.as_uploaded_file()
+        uploads.append(upload)
+    return files, uploads
+
+def _discard_uploads(uploads):
+    for upload in uploads:
+        upload.discard()
 
 # Artist CRUD Views
 @login_required(login_url='/manage/login/')
 def artist_manage_list(request):
     """작가 관리 목록"""
-    artists = Artist.objects.all().order_by('display_order', 'name')
-    paginator = Paginator(artists, 20)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    paginator = KeysetPaginator(Artist.objects.all(), ['display_order', 'name'], 20)
+    page_obj = paginator.get_page(request)
     
     context = {
         'page_obj': page_obj,
@@ -140,12 +406,15 @@ def artist_manage_list(request):
     return render(request, 'admin/artist_list.html', context)
 
 @login_required(login_url='/manage/login/')
+@allow_large_images()
 def artist_create(request):
     """작가 생성"""
     if request.method == 'POST':
-        form = ArtistForm(request.POST, request.FILES)
+        files, uploads = _files_with_chunked_uploads(request)
+        form = ArtistForm(request.POST, files)
         if form.is_valid():
             artist = form.save()
+            _discard_uploads(uploads)
             messages.success(request, f'작가 {artist.name}이(가) 등록되었습니다.')
             return redirect('gallery:artist_manage_list')
     else:
@@ -158,13 +427,16 @@ def artist_create(request):
     return render(request, 'admin/artist_form.html', context)
 
 @login_required(login_url='/manage/login/')
+@allow_large_images()
 def artist_edit(request, pk):
     """작가 수정"""
     artist = get_object_or_404(Artist, pk=pk)
     if request.method == 'POST':
-        form = ArtistForm(request.POST, request.FILES, instance=artist)
+        files, uploads = _files_with_chunked_uploads(request)
+        form = ArtistForm(request.POST, files, instance=artist)
         if form.is_valid():
             form.save()
+            _discard_uploads(uploads)
             messages.success(request, f'작가 {artist.name}이(가) 수정되었습니다.')
             return redirect('gallery:artist_manage_list')
     else:
@@ -213,10 +485,8 @@ def artist_delete(request, pk):
 @login_required(login_url='/manage/login/')
 def exhibition_manage_list(request):
     """전시 관리 목록"""
-    exhibitions = Exhibition.objects.all().order_by('-start_date')
-    paginator = Paginator(exhibitions, 20)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    paginator = KeysetPaginator(Exhibition.objects.all(), ['-start_date'], 20)
+    page_obj = paginator.get_page(request)
     
     context = {
         'page_obj': page_obj,
@@ -224,17 +494,18 @@ def exhibition_manage_list(request):
     return render(request, 'admin/exhibition_list.html', context)
 
 @login_required(login_url='/manage/login/')
+@allow_large_images()
 def exhibition_create(request):
     """전시 생성"""
     if request.method == 'POST':
         form = ExhibitionForm(request.POST, request.FILES)
         if form.is_valid():
-            exhibition = form.save()
-            # 선택된 작품들을 전시와 연결
-            if form.cleaned_data.get('artworks'):
-                artworks = form.cleaned_data['artworks']
-                for artwork in artworks:
-                    artwork.exhibitions.add(exhibition)
+            with transaction.atomic():
+                exhibition = form.save()
+                # 선택된 작품들을 전시와 연결 (bulk INSERT 한 번)
+                exhibition.artworks.set(form.cleaned_data.get('artworks') or [])
+                if form.cleaned_data.get('is_current'):
+                    current.set_current(exhibition)
             messages.success(request, f'전시 {exhibition.title}이(가) 등록되었습니다.')
             return redirect('gallery:exhibition_manage_list')
     else:
@@ -247,19 +518,22 @@ def exhibition_create(request):
     return render(request, 'admin/exhibition_form.html', context)
 
 @login_required(login_url='/manage/login/')
+@allow_large_images()
 def exhibition_edit(request, pk):
     """전시 수정"""
     exhibition = get_object_or_404(Exhibition, pk=pk)
     if request.method == 'POST':
+        was_current = exhibition.is_current
         form = ExhibitionForm(request.POST, request.FILES, instance=exhibition)
         if form.is_valid():
-            exhibition = form.save()
-            # 기존 작품 연결 해제 후 새로 선택된 작품들 연결
-            exhibition.artworks.clear()
-            if form.cleaned_data.get('artworks'):
-                artworks = form.cleaned_data['artworks']
-                for artwork in artworks:
-                    artwork.exhibitions.add(exhibition)
+            with transaction.atomic():
+                exhibition = form.save()
+                # 현재 연결과 비교해 바뀐 작품만 DELETE/INSERT 한 번씩 (set()이 차집합 계산)
+                exhibition.artworks.set(form.cleaned_data.get('artworks') or [])
+                if form.cleaned_data.get('is_current'):
+                    current.set_current(exhibition)
+                elif was_current:
+                    current.clear_current(exhibition)
             messages.success(request, f'전시 {exhibition.title}이(가) 수정되었습니다.')
             return redirect('gallery:exhibition_manage_list')
     else:
@@ -294,12 +568,8 @@ def exhibition_set_current(request, pk):
     """현재 전시 설정"""
     exhibition = get_object_or_404(Exhibition, pk=pk)
     
-    # 기존 현재 전시 해제
-    Exhibition.objects.filter(is_current=True).update(is_current=False)
-    
-    # 새로운 현재 전시 설정
-    exhibition.is_current = True
-    exhibition.save()
+    # 기존 현재 전시 해제 + 새로운 현재 전시 설정 (한 트랜잭션, 동시 요청은 순서대로)
+    current.set_current(exhibition)
     
     if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
         return JsonResponse({'success': True, 'message': f'{exhibition.title}이(가) 현재 전시로 설정되었습니다.'})
@@ -308,30 +578,90 @@ def exhibition_set_current(request, pk):
     return redirect('gallery:exhibition_manage_list')
 
 # Artwork CRUD Views
+# 판매 상태 필터 값 → 조건
+ARTWORK_STATUS_FILTERS = {
+    'available': {'is_sold': False, 'is_for_sale': True},
+    'sold': {'is_sold': True},
+    'reserved': {'is_sold': False, 'is_for_sale': False},
+}
+
+# 가격대 필터 값 (만원 단위) → 조건
+ARTWORK_PRICE_FILTERS = {
+    '0-100': {'price__lt': 1000000},
+    '100-300': {'price__gte': 1000000, 'price__lt': 3000000},
+    '300-500': {'price__gte': 3000000, 'price__lt': 5000000},
+    '500+': {'price__gte': 5000000},
+}
+
+
+def _int_param(params, name):
+    try:
+        return int(params.get(name, ''))
+    except ValueError:
+        return None
+
+
+def _filter_artworks(queryset, params):
+    """작품 관리 목록 필터 - (쿼리셋, 템플릿에 다시 채울 필터 값)"""
+    filters = {
+        'artist': _int_param(params, 'artist'),
+        'exhibition': _int_param(params, 'exhibition'),
+        'type': params.get('type', ''),
+        'status': params.get('status', ''),
+        'price': params.get('price', ''),
+        'year_from': _int_param(params, 'year_from'),
+        'year_to': _int_param(params, 'year_to'),
+        'q': params.get('q', '').strip(),
+    }
+
+    if filters['artist']:
+        queryset = queryset.filter(artist_id=filters['artist'])
+    if filters['exhibition']:
+        queryset = queryset.filter(exhibitions=filters['exhibition'])
+    if filters['type'] in dict(Artwork.ARTWORK_TYPES):
+        queryset = queryset.filter(artwork_type=filters['type'])
+    if filters['status'] in ARTWORK_STATUS_FILTERS:
+        queryset = queryset.filter(**ARTWORK_STATUS_FILTERS[filters['status']])
+    if filters['price'] in ARTWORK_PRICE_FILTERS:
+        queryset = queryset.filter(**ARTWORK_PRICE_FILTERS[filters['price']])
+    if filters['year_from']:
+        queryset = queryset.filter(year__gte=filters['year_from'])
+    if filters['year_to']:
+        queryset = queryset.filter(year__lte=filters['year_to'])
+    if filters['q']:
+        queryset = search_artworks(queryset, filters['q'])
+    return queryset, filters
+
 @login_required(login_url='/manage/login/')
 def artwork_manage_list(request):
-    """작품 관리 목록"""
-    artworks = Artwork.objects.all().select_related('artist').order_by('-created_at')
-    paginator = Paginator(artworks, 20)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    """작품 관리 목록 (작가/전시/유형/판매 상태/가격/제작년도 필터 + 검색)"""
+    artworks, filters = _filter_artworks(Artwork.objects.select_related('artist'), request.GET)
+    paginator = KeysetPaginator(artworks, ['-created_at'], 20)
+    page_obj = paginator.get_page(request)
     
-    # 필터용 작가 목록
-    artists = Artist.objects.filter(is_active=True).order_by('name')
+    # 필터용 작가/전시 목록
+    artists = Artist.objects.filter(is_active=True).only('name').order_by('name')
+    exhibitions = Exhibition.objects.only('title', 'start_date').order_by('-start_date')
     
     context = {
         'page_obj': page_obj,
         'artists': artists,
+        'exhibitions': exhibitions,
+        'artwork_types': Artwork.ARTWORK_TYPES,
+        'filters': filters,
     }
     return render(request, 'admin/artwork_list.html', context)
 
 @login_required(login_url='/manage/login/')
+@allow_large_images()
 def artwork_create(request):
     """작품 생성"""
     if request.method == 'POST':
-        form = ArtworkForm(request.POST, request.FILES)
+        files, uploads = _files_with_chunked_uploads(request)
+        form = ArtworkForm(request.POST, files)
         if form.is_valid():
             artwork = form.save()
+            _discard_uploads(uploads)
             messages.success(request, f'작품 {artwork.title}이(가) 등록되었습니다.')
             return redirect('gallery:artwork_manage_list')
     else:
@@ -344,13 +674,16 @@ def artwork_create(request):
     return render(request, 'admin/artwork_form.html', context)
 
 @login_required(login_url='/manage/login/')
+@allow_large_images()
 def artwork_edit(request, pk):
     """작품 수정"""
     artwork = get_object_or_404(Artwork, pk=pk)
     if request.method == 'POST':
-        form = ArtworkForm(request.POST, request.FILES, instance=artwork)
+        files, uploads = _files_with_chunked_uploads(request)
+        form = ArtworkForm(request.POST, files, instance=artwork)
         if form.is_valid():
             form.save()
+            _discard_uploads(uploads)
             messages.success(request, f'작품 {artwork.title}이(가) 수정되었습니다.')
             return redirect('gallery:artwork_manage_list')
     else:
@@ -421,7 +754,7 @@ def is_staff(user):
 @user_passes_test(is_staff)
 def manage_current_exhibition(request):
     """현재전시 관리 메인 페이지"""
-    current_exhibition = CurrentExhibition.objects.filter(is_active=True).first()
+    current_exhibition = current.get_current()
     past_exhibitions = CurrentExhibition.objects.filter(is_active=False).order_by('-created_at')[:10]
     
     context = {
@@ -432,18 +765,14 @@ def manage_current_exhibition(request):
 
 @login_required
 @user_passes_test(is_staff)
+@allow_large_images()
 def create_current_exhibition(request):
     """새 전시 등록"""
     if request.method == 'POST':
         form = CurrentExhibitionForm(request.POST, request.FILES)
         if form.is_valid():
-            # 기존 활성 전시를 비활성화
-            CurrentExhibition.objects.filter(is_active=True).update(is_active=False)
-            
-            # 새 전시 저장
-            exhibition = form.save(commit=False)
-            exhibition.is_active = True
-            exhibition.save()
+            # 새 전시 저장 + 기존 활성 전시 비활성화 (포인터 행을 잠근 한 트랜잭션)
+            current.activate(form.save(commit=False))
             
             messages.success(request, '새 전시가 등록되었습니다.')
             return redirect('gallery:manage_current_exhibition')
@@ -454,9 +783,12 @@ def create_current_exhibition(request):
 
 @login_required
 @user_passes_test(is_staff)
+@allow_large_images()
 def edit_current_exhibition(request):
     """현재 전시 수정"""
-    exhibition = get_object_or_404(CurrentExhibition, is_active=True)
+    exhibition = current.get_current(cached=False)
+    if exhibition is None:
+        raise Http404('현재 전시가 없습니다.')
     
     if request.method == 'POST':
         form = CurrentExhibitionForm(request.POST, request.FILES, instance=exhibition)
@@ -486,6 +818,7 @@ def manage_simple_artists(request):
 
 @login_required
 @user_passes_test(is_staff)
+@allow_large_images()
 def create_simple_artist(request):
     """새 전속작가 등록"""
     if request.method == 'POST':
@@ -501,6 +834,7 @@ def create_simple_artist(request):
 
 @login_required
 @user_passes_test(is_staff)
+@allow_large_images()
 def edit_simple_artist(request, pk):
     """전속작가 수정"""
     artist = get_object_or_404(SimpleArtist, pk=pk)
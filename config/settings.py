@@ -66,7 +66,7 @@ if os.environ.get('DJANGO_VERSION', '').startswith('5.'):
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
+    'apps.core.middleware.LazySessionMiddleware',
     'django.middleware.locale.LocaleMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -164,11 +164,28 @@ MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
 # 파일 업로드 설정 (대용량 파일 지원)
-DATA_UPLOAD_MAX_MEMORY_SIZE = 1024 * 1024 * 500  # 500MB
-FILE_UPLOAD_MAX_MEMORY_SIZE = 1024 * 1024 * 100  # 100MB
+# 업로드 파일은 크기와 무관하게 TemporaryFileUploadHandler로 디스크에 바로 기록되고,
+# 아래 메모리 한도는 파일을 제외한 요청 본문(폼 필드)에만 적용된다.
+DATA_UPLOAD_MAX_MEMORY_SIZE = 1024 * 1024 * 10  # 10MB
+FILE_UPLOAD_MAX_MEMORY_SIZE = 1024 * 1024 * 2  # 2MB
 DATA_UPLOAD_MAX_NUMBER_FIELDS = 10000
 FILE_UPLOAD_TEMP_DIR = '/tmp'
 
+# 분할 업로드 (/manage/uploads/) - 조각은 FILE_UPLOAD_TEMP_DIR/chunked_uploads에 조립
+CHUNKED_UPLOAD_MAX_SIZE = 1024 * 1024 * 1024 * 2  # 2GB
+CHUNKED_UPLOAD_EXPIRE_HOURS = 24
+
+# 이미지 처리 메모리 한도
+IMAGE_SPOOL_MAX_MEMORY_SIZE = 1024 * 1024 * 5  # 인코딩 버퍼가 이보다 크면 임시 파일 사용
+IMAGE_MAX_PIXELS = 400_000_000  # 직원 업로드/이미지 작업에서 300메가픽셀 스캔 허용 (공개 요청은 Pillow 기본값 약 89MP)
+
+# 요청 시 리사이즈 이미지 캐시 (/media/r/<w>x<h>/<path>)
+RENDITION_CACHE_DIR = os.path.join(BASE_DIR, 'cache', 'renditions')
+RENDITION_CACHE_MAX_BYTES = 1024 * 1024 * 1024 * 2  # 2GB
+# 만들 수 있는 (너비, 높이) 목록 - 템플릿의 {% resized_url %} 크기와 맞춘다 (그 외 크기는 404)
+RENDITION_SIZES = [(160, 160), (600, 600)]
+RENDITION_CACHE_EVICT_EVERY = 100  # 프로세스마다 새 파일 N개를 만들 때마다 용량 검사
+
 # 청크 업로드 설정
 FILE_UPLOAD_HANDLERS = [
     'django.core.files.uploadhandler.TemporaryFileUploadHandler',
@@ -180,19 +197,52 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # 세션 설정
 SESSION_COOKIE_AGE = 86400 * 7  # 7일
 SESSION_EXPIRE_AT_BROWSER_CLOSE = False
-SESSION_SAVE_EVERY_REQUEST = True
+SESSION_SAVE_EVERY_REQUEST = False  # 저장 시점은 LazySessionMiddleware가 결정
+SESSION_REFRESH_INTERVAL = 60 * 60  # 로그인 세션 만료 연장 주기(초)
 SESSION_COOKIE_HTTPONLY = True
 SESSION_COOKIE_SAMESITE = 'Lax'
-SESSION_ENGINE = 'django.contrib.sessions.backends.db'
+# 세션은 /manage/, /admin/에 로그인한 직원만 사용한다.
+# cached_db: 공유 캐시에서 읽고 DB에는 변경 시에만 기록
+# 서버 저장소 없이 쓰려면 django.contrib.sessions.backends.signed_cookies
+SESSION_ENGINE = os.environ.get('SESSION_ENGINE', 'django.contrib.sessions.backends.cached_db')
+# 프로세스 메모리(L1)를 거치면 로그아웃/세션 변경이 다른 워커에 늦게 반영되므로 공유 캐시만 사용
+SESSION_CACHE_ALIAS = 'shared'
+
+# 캐시 설정
+# CACHE_URL이 redis://...이면 Redis, 없으면 같은 서버의 모든 워커가 공유하는
+# 파일 캐시를 L2로 쓴다. default는 프로세스 메모리(L1) + 공유 캐시(L2) 2단계.
+CACHE_URL = os.environ.get('CACHE_URL', '')
+if CACHE_URL.startswith(('redis://', 'rediss://', 'unix://')):
+    SHARED_CACHE = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': CACHE_URL,
+    }
+else:
+    SHARED_CACHE = {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(BASE_DIR, 'cache', 'django'),
+        # 기본값(300개)이면 세션/페이지 캐시만으로 금방 차서 자주 컬링된다
+        # (컬링은 파일을 무작위로 지우므로 ns:* 버전 키도 지워질 수 있다 - apps/core/cache.py 참고)
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.environ.get('CACHE_MAX_ENTRIES', 50000)),
+            'CULL_FREQUENCY': 10,
+        },
+    }
 
-# 캐시 설정 (Redis)
 CACHES = {
     'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'unique-snowflake',
-    }
+        'BACKEND': 'apps.core.cache.TieredCache',
+        'OPTIONS': {
+            'SHARED_CACHE': 'shared',
+            'LOCAL_TIMEOUT': int(os.environ.get('CACHE_LOCAL_TIMEOUT', 5)),  # 다른 워커에 변경이 반영되는 최대 지연(초)
+        },
+    },
+    'shared': {**SHARED_CACHE, 'KEY_PREFIX': 'hana'},
 }
 
+# 비로그인 방문자용 공개 페이지 캐시 (콘텐츠가 바뀌면 시그널로 즉시 무효화)
+PAGE_CACHE_TIMEOUT = 60 * 10
+
 # CORS 설정
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
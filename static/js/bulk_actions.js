@@ -0,0 +1,125 @@
+/**
+ * 관리 목록 일괄 작업
+ * data-bulk-model 속성이 있는 작업 바는 같은 페이지의 data-bulk-id 체크박스로 고른 항목에
+ * data-bulk-operation 버튼의 작업을 JSON 한 번으로 요청한다 (POST /manage/bulk/).
+ * 선택한 순서를 기억하므로 순서 변경(reorder)은 체크한 순서가 표시 순서가 된다.
+ */
+
+class HanaBulkActions {
+    constructor(bar) {
+        this.bar = bar;
+        this.model = bar.dataset.bulkModel;
+        this.url = bar.dataset.bulkUrl || '/manage/bulk/';
+        this.selected = [];
+        this.countEl = bar.querySelector('[data-bulk-count]');
+        this.selectAll = bar.querySelector('[data-bulk-select-all]');
+    }
+
+    get checkboxes() {
+        return Array.from(document.querySelectorAll('[data-bulk-id]'));
+    }
+
+    get pageIds() {
+        return [...new Set(this.checkboxes.map(box => Number(box.value)))];
+    }
+
+    toggle(id, checked) {
+        this.selected = this.selected.filter(value => value !== id);
+        if (checked) this.selected.push(id);
+        // 그리드/리스트 보기에 같은 항목의 체크박스가 하나씩 있다
+        this.checkboxes.forEach(box => {
+            if (Number(box.value) === id) box.checked = checked;
+        });
+        this.render();
+    }
+
+    render() {
+        if (this.countEl) this.countEl.textContent = this.selected.length;
+        this.bar.classList.toggle('active', this.selected.length > 0);
+        if (this.selectAll) {
+            const ids = this.pageIds;
+            this.selectAll.checked = ids.length > 0 && ids.every(id => this.selected.includes(id));
+        }
+    }
+
+    payload(button) {
+        const data = {model: this.model, operation: button.dataset.bulkOperation, ids: this.selected};
+        if (button.dataset.bulkSold) {
+            data.sold = button.dataset.bulkSold === 'true';
+        }
+        if (data.operation === 'assign_exhibition') {
+            const select = this.bar.querySelector('[data-bulk-exhibition]');
+            data.exhibition = select ? select.value : '';
+        }
+        if (data.operation === 'reorder') {
+            const start = this.bar.querySelector('[data-bulk-start]');
+            data.start = start && start.value ? Number(start.value) : 0;
+        }
+        return data;
+    }
+
+    async send(data) {
+        const response = await fetch(this.url, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': getCookie('csrftoken'),
+                'X-Requested-With': 'XMLHttpRequest',
+            },
+            credentials: 'same-origin',
+            body: JSON.stringify(data),
+        });
+        const result = await response.json();
+        if (!result.success) {
+            throw new Error(result.message || '일괄 작업에 실패했습니다.');
+        }
+        return result;
+    }
+
+    run(button) {
+        if (!this.selected.length) {
+            hanaToast.warning('먼저 항목을 선택하세요.');
+            return;
+        }
+        const data = this.payload(button);
+        const execute = async () => {
+            showLoading();
+            try {
+                const result = await this.send(data);
+                hanaToast.success(result.message);
+                setTimeout(() => window.location.reload(), 1000);
+            } catch (error) {
+                hanaToast.error(error.message);
+            } finally {
+                hideLoading();
+            }
+        };
+
+        if (data.operation === 'delete') {
+            hanaModal.confirmDelete(`선택한 ${this.selected.length}개 항목`, execute);
+        } else {
+            execute();
+        }
+    }
+
+    attach() {
+        this.checkboxes.forEach(box => {
+            box.addEventListener('change', () => this.toggle(Number(box.value), box.checked));
+        });
+        if (this.selectAll) {
+            this.selectAll.addEventListener('change', () => {
+                this.pageIds.forEach(id => this.toggle(id, this.selectAll.checked));
+            });
+        }
+        this.bar.querySelectorAll('[data-bulk-operation]').forEach(button => {
+            button.addEventListener('click', () => this.run(button));
+        });
+        this.render();
+    }
+
+    static attachAll() {
+        document.querySelectorAll('[data-bulk-model]').forEach(bar => new HanaBulkActions(bar).attach());
+    }
+}
+
+document.addEventListener('DOMContentLoaded', () => HanaBulkActions.attachAll());
@@ -0,0 +1,168 @@
+/**
+ * 대용량 이미지 분할 업로드
+ * data-chunked-upload 속성이 있는 파일 input은 폼 제출 시 조각으로 나눠 업로드하고,
+ * 연결이 끊기면 같은 파일에 대해 받은 위치부터 이어서 보낸다.
+ * 업로드가 끝나면 <필드명>_upload 값으로 업로드 ID를 폼과 함께 제출한다.
+ */
+
+class HanaChunkedUpload {
+    constructor(input, options = {}) {
+        this.input = input;
+        this.form = input.form;
+        this.url = options.url || input.dataset.chunkedUploadUrl || '/manage/uploads/';
+        this.chunkSize = options.chunkSize || 5 * 1024 * 1024;  // 5MB
+        this.threshold = options.threshold || 8 * 1024 * 1024;  // 이보다 작은 파일은 일반 업로드
+        this.maxRetries = options.maxRetries || 5;
+        this.progress = null;
+    }
+
+    get csrfToken() {
+        const field = this.form.querySelector('[name=csrfmiddlewaretoken]');
+        return field ? field.value : '';
+    }
+
+    storageKey(file) {
+        return `hana-upload:${file.name}:${file.size}:${file.lastModified}`;
+    }
+
+    async request(url, options = {}) {
+        const headers = Object.assign({'X-CSRFToken': this.csrfToken}, options.headers || {});
+        return fetch(url, Object.assign({}, options, {headers, credentials: 'same-origin'}));
+    }
+
+    /**
+     * 업로드 생성 또는 이전 업로드 재개 - {id, offset} 반환
+     */
+    async start(file) {
+        const key = this.storageKey(file);
+        const savedId = localStorage.getItem(key);
+        if (savedId) {
+            const response = await this.request(`${this.url}${savedId}/`, {method: 'HEAD'});
+            if (response.ok) {
+                return {id: savedId, offset: parseInt(response.headers.get('Upload-Offset'), 10)};
+            }
+            localStorage.removeItem(key);
+        }
+
+        const response = await this.request(this.url, {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({filename: file.name, size: file.size, content_type: file.type}),
+        });
+        const data = await response.json();
+        if (!response.ok) {
+            throw new Error(data.message || '업로드를 시작할 수 없습니다.');
+        }
+        localStorage.setItem(key, data.id);
+        return {id: data.id, offset: data.offset};
+    }
+
+    async upload(file) {
+        let {id, offset} = await this.start(file);
+        let retries = 0;
+
+        while (offset < file.size) {
+            const chunk = file.slice(offset, offset + this.chunkSize);
+            try {
+                const response = await this.request(`${this.url}${id}/`, {
+                    method: 'PATCH',
+                    headers: {
+                        'Content-Type': 'application/offset+octet-stream',
+                        'Upload-Offset': String(offset),
+                    },
+                    body: chunk,
+                });
+                if (!response.ok && response.status !== 409) {
+                    const data = await response.json().catch(() => ({}));
+                    throw new Error(data.message || `업로드 실패 (${response.status})`);
+                }
+                // 409: 서버가 받은 위치가 다르면 그 위치부터 다시 보낸다
+                offset = parseInt(response.headers.get('Upload-Offset'), 10);
+                retries = 0;
+                this.showProgress(offset, file.size);
+            } catch (error) {
+                if (++retries > this.maxRetries) {
+                    throw error;
+                }
+                await new Promise(resolve => setTimeout(resolve, 1000 * 2 ** retries));
+                const response = await this.request(`${this.url}${id}/`, {method: 'HEAD'});
+                if (response.ok) {
+                    offset = parseInt(response.headers.get('Upload-Offset'), 10);
+                }
+            }
+        }
+
+        const response = await this.request(`${this.url}${id}/complete/`, {method: 'POST'});
+        const data = await response.json();
+        if (!response.ok) {
+            throw new Error(data.message || '업로드를 완료할 수 없습니다.');
+        }
+        localStorage.removeItem(this.storageKey(file));
+        return id;
+    }
+
+    showProgress(offset, size) {
+        if (!this.progress) {
+            this.progress = document.createElement('div');
+            this.progress.className = 'upload-progress small text-muted mt-2';
+            this.input.parentElement.appendChild(this.progress);
+        }
+        this.progress.textContent = `업로드 중... ${Math.floor(offset / size * 100)}%`;
+    }
+
+    /**
+     * 폼 제출 전에 파일을 분할 업로드하고 업로드 ID만 폼으로 보낸다
+     */
+    async handleSubmit() {
+        const file = this.input.files[0];
+        if (!file || file.size < this.threshold) {
+            return true;
+        }
+
+        const id = await this.upload(file);
+        let hidden = this.form.querySelector(`[name="${this.input.name}_upload"]`);
+        if (!hidden) {
+            hidden = document.createElement('input');
+            hidden.type = 'hidden';
+            hidden.name = `${this.input.name}_upload`;
+            this.form.appendChild(hidden);
+        }
+        hidden.value = id;
+        this.input.value = '';
+        return true;
+    }
+
+    static attachAll() {
+        const forms = new Map();
+        document.querySelectorAll('input[type=file][data-chunked-upload]').forEach(input => {
+            if (!input.form) return;
+            if (!forms.has(input.form)) forms.set(input.form, []);
+            forms.get(input.form).push(new HanaChunkedUpload(input));
+        });
+
+        forms.forEach((uploaders, form) => {
+            form.addEventListener('submit', async function(e) {
+                if (form.dataset.chunkedReady) return;
+                e.preventDefault();
+                const submitButton = form.querySelector('[type=submit]');
+                if (submitButton) submitButton.disabled = true;
+                try {
+                    for (const uploader of uploaders) {
+                        await uploader.handleSubmit();
+                    }
+                    form.dataset.chunkedReady = 'true';
+                    form.submit();
+                } catch (error) {
+                    if (submitButton) submitButton.disabled = false;
+                    if (window.hanaToast) {
+                        window.hanaToast.error(error.message);
+                    } else {
+                        alert(error.message);
+                    }
+                }
+            });
+        });
+    }
+}
+
+document.addEventListener('DOMContentLoaded', () => HanaChunkedUpload.attachAll());